@@ -0,0 +1,361 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+os.environ.setdefault("BOT_TOKEN", "0:benchmark")
+
+from aiogram import Bot, Dispatcher
+from aiogram.types import Update
+
+from benchmarks.dataset import DatasetGenerator
+from bot.app import create_dispatcher
+from bot.database.schema import init_db
+from loadtest.mock_session import MockSession
+from loadtest.updates import make_callback_update, make_message_update
+
+HANDLERS = (
+    "start",
+    "take_quiz",
+    "paging",
+    "start_quiz",
+    "answer",
+    "back",
+    "finish",
+    "creation",
+)
+
+def count_persisted(db_path: str) -> dict[str, int]:
+    conn = sqlite3.connect(db_path)
+    
+    try:
+        return {
+            'attempts': conn.execute(
+                "SELECT COUNT(*) FROM attempts"
+            ).fetchone()[0],
+            'quiz_leaderboard': conn.execute(
+                "SELECT COUNT(*) FROM quiz_leaderboard"
+            ).fetchone()[0],
+            'answer_events': conn.execute(
+                "SELECT COUNT(*) FROM answer_events"
+            ).fetchone()[0],
+            'quiz_starts': conn.execute(
+                "SELECT COALESCE(SUM(starts), 0) FROM quiz_stats"
+            ).fetchone()[0]
+        }
+    finally:
+        conn.close()
+
+def load_question_ids(db_path: str) -> dict[int, list[int]]:
+    conn = sqlite3.connect(db_path)
+    
+    try:
+        question_ids: dict[int, list[int]] = defaultdict(list)
+        for quiz_id, question_id in conn.execute(
+            "SELECT quiz_id, id FROM questions ORDER BY quiz_id, position"
+        ):
+            question_ids[quiz_id].append(question_id)
+        return question_ids
+    finally:
+        conn.close()
+
+class HandlerBenchmark:
+    
+    def __init__(
+        self,
+        dp: Dispatcher,
+        bot: Bot,
+        question_ids: dict[int, list[int]],
+        answers: int,
+        seed: int
+    ) -> None:
+        self._dp: Dispatcher = dp
+        self._bot: Bot = bot
+        self._question_ids: dict[int, list[int]] = question_ids
+        self._answers: int = answers
+        self._random: random.Random = random.Random(seed)
+        self._next_update_id: int = 1
+        self._total_pages: int = max(1, (len(question_ids) + 5) // 6)
+        
+        self.latencies: dict[str, list[int]] = defaultdict(list)
+        self.finished: set[tuple[int, int]] = set()
+    
+    async def run_user(self, user_id: int, create: bool) -> None:
+        await self._message("start", user_id, "/start")
+        await self._callback("take_quiz", user_id, "take_quiz")
+        await self._callback(
+            "paging",
+            user_id,
+            f"quiz_page_{self._random.randint(1, self._total_pages)}"
+        )
+        
+        quiz_id = self._random.choice(list(self._question_ids))
+        question_ids = self._question_ids[quiz_id]
+        
+        await self._callback("start_quiz", user_id, f"quiz_{quiz_id}")
+        
+        for index, question_id in enumerate(question_ids):
+            await self._answer(user_id, question_id)
+            
+            if index == 1 and index + 1 < len(question_ids):
+                await self._callback(
+                    "back",
+                    user_id,
+                    f"back_{question_ids[index + 1]}"
+                )
+                await self._answer(user_id, question_id)
+                
+        await self._callback("finish", user_id, f"finish_quiz_{quiz_id}")
+        self.finished.add((user_id, quiz_id))
+        
+        if create:
+            for text in (
+                "/create_quiz",
+                f"Benchmark quiz by {user_id}",
+                "1",
+                "What is the answer?",
+                "\n".join(
+                    f"Answer {position}"
+                    for position in range(1, self._answers + 1)
+                ),
+                "1"
+            ):
+                await self._message("creation", user_id, text)
+    
+    async def _answer(self, user_id: int, question_id: int) -> None:
+        position = self._random.randint(1, self._answers)
+        await self._callback(
+            "answer",
+            user_id,
+            f"answer_{question_id}_{position}"
+        )
+    
+    async def _message(self, name: str, user_id: int, text: str) -> None:
+        update_id = self._allocate_update_id()
+        await self._feed(
+            name,
+            make_message_update(update_id, user_id, text, update_id)
+        )
+    
+    async def _callback(self, name: str, user_id: int, data: str) -> None:
+        await self._feed(
+            name,
+            make_callback_update(
+                self._allocate_update_id(),
+                user_id,
+                data,
+                message_id=1
+            )
+        )
+    
+    async def _feed(self, name: str, payload: dict[str, Any]) -> None:
+        update = Update.model_validate(payload, context={"bot": self._bot})
+        
+        started = time.perf_counter_ns()
+        await self._dp.feed_update(self._bot, update)
+        self.latencies[name].append(time.perf_counter_ns() - started)
+    
+    def _allocate_update_id(self) -> int:
+        update_id = self._next_update_id
+        self._next_update_id += 1
+        return update_id
+
+def percentile(values: list[int], fraction: float) -> float:
+    index = min(len(values) - 1, int(len(values) * fraction))
+    return values[index] / 1_000_000
+
+def summarize(latencies: dict[str, list[int]]) -> dict[str, dict]:
+    summary: dict[str, dict] = {}
+    
+    for name in HANDLERS:
+        values = sorted(latencies.get(name, []))
+        
+        if not values:
+            continue
+        
+        total_seconds = sum(values) / 1_000_000_000
+        summary[name] = {
+            'count': len(values),
+            'mean_ms': round(statistics.fmean(values) / 1_000_000, 3),
+            'p50_ms': round(percentile(values, 0.50), 3),
+            'p95_ms': round(percentile(values, 0.95), 3),
+            'p99_ms': round(percentile(values, 0.99), 3),
+            'max_ms': round(values[-1] / 1_000_000, 3),
+            'updates_per_second': round(len(values) / total_seconds, 1)
+        }
+        
+    return summary
+
+def compare(
+    results: dict,
+    baseline: dict,
+    max_regression: float
+) -> list[str]:
+    regressions: list[str] = []
+    
+    print(f"\n{'handler':<12} {'p95 base':>10} {'p95 now':>10} {'change':>8}")
+    
+    for name, current in results['handlers'].items():
+        previous = baseline.get('handlers', {}).get(name)
+        if previous is None:
+            continue
+        
+        change = (current['p95_ms'] - previous['p95_ms']) / previous['p95_ms']
+        print(
+            f"{name:<12} {previous['p95_ms']:>10.3f} "
+            f"{current['p95_ms']:>10.3f} {change:>+8.1%}"
+        )
+        
+        if change > max_regression:
+            regressions.append(name)
+            
+    return regressions
+
+async def run_benchmark(args: argparse.Namespace) -> dict:
+    work_dir = Path(tempfile.mkdtemp(prefix="quiz-bench-"))
+    db_path = str(work_dir / "bench.db")
+    
+    await init_db(db_path)
+    
+    seed_started = time.perf_counter()
+    DatasetGenerator(
+        users=1,
+        quizzes=args.quizzes,
+        questions_per_quiz=args.questions,
+        answers_per_question=args.answers,
+        attempts=0,
+        seed=args.seed
+    ).generate(db_path)
+    seed_seconds = time.perf_counter() - seed_started
+    
+    dp = create_dispatcher(db_path)
+    bot = Bot(token=os.environ["BOT_TOKEN"], session=MockSession())
+    await dp.emit_startup(bot=bot)
+    
+    benchmark = HandlerBenchmark(
+        dp,
+        bot,
+        load_question_ids(db_path),
+        args.answers,
+        args.seed
+    )
+    
+    semaphore = asyncio.Semaphore(args.concurrency)
+    
+    async def run_user(index: int) -> None:
+        async with semaphore:
+            await benchmark.run_user(
+                user_id=10_000 + index,
+                create=index % args.create_every == 0
+            )
+            
+    started = time.perf_counter()
+    await asyncio.gather(*(run_user(index) for index in range(args.users)))
+    elapsed = time.perf_counter() - started
+    
+    await dp.emit_shutdown(bot=bot)
+    await bot.session.close()
+    
+    total_updates = sum(len(values) for values in benchmark.latencies.values())
+    expected = {
+        'attempts': len(benchmark.latencies['finish']),
+        'quiz_leaderboard': len(benchmark.finished),
+        'answer_events': len(benchmark.latencies['answer']),
+        'quiz_starts': len(benchmark.latencies['start_quiz'])
+    }
+    
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'quizzes': args.quizzes,
+            'questions_per_quiz': args.questions,
+            'answers_per_question': args.answers,
+            'users': args.users,
+            'concurrency': args.concurrency,
+            'seed': args.seed,
+            'seed_seconds': round(seed_seconds, 3),
+            'database_path': db_path
+        },
+        'total': {
+            'updates': total_updates,
+            'elapsed_s': round(elapsed, 3),
+            'updates_per_second': round(total_updates / elapsed, 1)
+        },
+        'handlers': summarize(benchmark.latencies),
+        'persisted': {
+            'expected': expected,
+            'actual': count_persisted(db_path)
+        }
+    }
+
+def check_persisted(results: dict) -> list[str]:
+    persisted = results['persisted']
+    
+    return [
+        f"{name}: expected {count}, found {persisted['actual'][name]}"
+        for name, count in persisted['expected'].items()
+        if persisted['actual'][name] != count
+    ]
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Feed synthetic updates through the real Dispatcher"
+    )
+    parser.add_argument("--quizzes", type=int, default=200)
+    parser.add_argument("--questions", type=int, default=10)
+    parser.add_argument("--answers", type=int, default=4)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument(
+        "--create-every",
+        type=int,
+        default=10,
+        help="Every N-th user also creates a quiz"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.2,
+        help="Allowed relative p95 growth against the baseline"
+    )
+    return parser.parse_args()
+
+def main() -> None:
+    args = parse_args()
+    results = asyncio.run(run_benchmark(args))
+    
+    report = json.dumps(results, indent=2)
+    print(report)
+    
+    if args.output:
+        Path(args.output).write_text(report, encoding="utf-8")
+        
+    missing = check_persisted(results)
+    if missing:
+        print(f"\nRows missing after shutdown: {'; '.join(missing)}")
+        sys.exit(1)
+        
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.max_regression)
+        
+        if regressions:
+            print(f"\np95 regressions: {', '.join(regressions)}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
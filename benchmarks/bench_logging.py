@@ -0,0 +1,165 @@
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bot.logger import (
+    LOG_FORMAT,
+    get_dropped_records,
+    setup_logging,
+    shutdown_logging
+)
+
+MODES = ("sync", "queue")
+
+def setup_sync_logging(log_dir: Path) -> None:
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [
+        logging.FileHandler(log_dir / "bot.log", encoding="utf-8"),
+        logging.StreamHandler(sys.stdout)
+    ]
+    
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+
+def teardown_sync_logging() -> None:
+    root = logging.getLogger()
+    
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+async def log_records(
+    logger: logging.Logger,
+    records: int,
+    pause_every: int
+) -> list[int]:
+    timings: list[int] = []
+    
+    for index in range(records):
+        started = time.perf_counter_ns()
+        logger.info(
+            f"Processed callback_query from user {10_000 + index % 500} "
+            f"in {index % 97 + 0.5:.2f}ms"
+        )
+        timings.append(time.perf_counter_ns() - started)
+        
+        if pause_every and index % pause_every == 0:
+            await asyncio.sleep(0)
+            
+    return timings
+
+def summarize(timings: list[int], elapsed: float) -> dict:
+    values = sorted(timings)
+    
+    def percentile(fraction: float) -> float:
+        index = min(len(values) - 1, int(len(values) * fraction))
+        return round(values[index] / 1000, 2)
+    
+    return {
+        'records': len(values),
+        'mean_us': round(statistics.fmean(values) / 1000, 2),
+        'p50_us': percentile(0.50),
+        'p99_us': percentile(0.99),
+        'max_us': round(values[-1] / 1000, 2),
+        'loop_time_ms': round(sum(values) / 1_000_000, 2),
+        'elapsed_ms': round(elapsed * 1000, 2)
+    }
+
+def run_mode(mode: str, args: argparse.Namespace) -> dict:
+    log_dir = Path(tempfile.mkdtemp(prefix=f"quiz-log-{mode}-"))
+    stdout = sys.stdout
+    sys.stdout = open(log_dir / "stdout.log", "w", encoding="utf-8")
+    
+    try:
+        if mode == "sync":
+            setup_sync_logging(log_dir)
+        else:
+            setup_logging(
+                log_dir=str(log_dir),
+                max_bytes=args.max_bytes,
+                queue_size=args.queue_size or args.records
+            )
+            
+        logger = logging.getLogger("benchmark")
+        
+        started = time.perf_counter()
+        timings = asyncio.run(
+            log_records(logger, args.records, args.pause_every)
+        )
+        
+        dropped = get_dropped_records()
+        
+        if mode == "sync":
+            teardown_sync_logging()
+        else:
+            shutdown_logging()
+        elapsed = time.perf_counter() - started
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+        
+    result = summarize(timings, elapsed)
+    result['dropped'] = dropped
+    
+    return result
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure event loop time spent per log call"
+    )
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument(
+        "--pause-every",
+        type=int,
+        default=100,
+        help="Yield to the event loop every N records"
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=None,
+        help="Logging queue size in queue mode (default: --records, so no "
+             "record is dropped and both modes write the same records)"
+    )
+    parser.add_argument("--max-bytes", type=int, default=10 * 1024 * 1024)
+    parser.add_argument("--output", default=None)
+    return parser.parse_args()
+
+def main() -> None:
+    args = parse_args()
+    
+    results = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'records': args.records,
+            'queue_size': args.queue_size or args.records
+        },
+        'modes': {mode: run_mode(mode, args) for mode in MODES}
+    }
+    
+    report = json.dumps(results, indent=2)
+    print(report)
+    
+    if results['modes']['queue']['dropped']:
+        sys.stderr.write(
+            f"Queue mode dropped {results['modes']['queue']['dropped']} "
+            f"records, its timings are not comparable with sync mode\n"
+        )
+    
+    if args.output:
+        Path(args.output).write_text(report, encoding="utf-8")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,142 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("BOT_TOKEN", "0:benchmark")
+
+from benchmarks.dataset import DatasetGenerator
+from bot.database.schema import init_db
+from bot.repositories.quiz_repository import QuizRepository
+
+def make_queries(vocabulary: list[str]) -> dict[str, list[str]]:
+    common = vocabulary[:20]
+    middle = vocabulary[len(vocabulary) // 10:len(vocabulary) // 10 + 20]
+    rare = vocabulary[-20:]
+    
+    return {
+        'common_word': common,
+        'medium_word': middle,
+        'rare_word': rare,
+        'prefix': [word[:3] for word in middle],
+        'two_words': [
+            f"{first} {second}" for first, second in zip(middle, rare)
+        ]
+    }
+
+async def measure(
+    repository: QuizRepository,
+    queries: list[str],
+    repeat: int,
+    limit: int
+) -> dict:
+    timings: list[float] = []
+    results: list[int] = []
+    
+    for _ in range(repeat):
+        for query in queries:
+            started = time.perf_counter()
+            found = await repository.search(query, limit)
+            timings.append((time.perf_counter() - started) * 1000)
+            results.append(len(found))
+            
+    timings.sort()
+    
+    return {
+        'queries': len(timings),
+        'mean_ms': round(statistics.fmean(timings), 3),
+        'p50_ms': round(timings[len(timings) // 2], 3),
+        'p95_ms': round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+        'max_ms': round(timings[-1], 3),
+        'mean_results': round(statistics.fmean(results), 1)
+    }
+
+async def run_benchmark(args: argparse.Namespace) -> dict:
+    work_dir = Path(tempfile.mkdtemp(prefix="quiz-search-"))
+    db_path = str(work_dir / "search.db")
+    
+    await init_db(db_path)
+    
+    seed_started = time.perf_counter()
+    generator = DatasetGenerator(
+        users=1,
+        quizzes=max(1, args.questions // args.questions_per_quiz),
+        questions_per_quiz=args.questions_per_quiz,
+        answers_per_question=0,
+        attempts=0,
+        vocabulary_size=args.vocabulary,
+        seed=args.seed
+    )
+    generator.generate(db_path)
+    seed_seconds = time.perf_counter() - seed_started
+    
+    repository = QuizRepository(db_path)
+    
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'sqlite': sqlite3.sqlite_version,
+            'questions': args.questions,
+            'questions_per_quiz': args.questions_per_quiz,
+            'vocabulary': args.vocabulary,
+            'limit': args.limit,
+            'seed': args.seed,
+            'seed_seconds': round(seed_seconds, 3),
+            'database_bytes': os.path.getsize(db_path),
+            'database_path': db_path
+        },
+        'searches': {
+            name: await measure(repository, queries, args.repeat, args.limit)
+            for name, queries in make_queries(generator.vocabulary).items()
+        }
+    }
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure QuizRepository.search on a synthetic catalogue"
+    )
+    parser.add_argument("--questions", type=int, default=1_000_000)
+    parser.add_argument("--questions-per-quiz", type=int, default=20)
+    parser.add_argument("--vocabulary", type=int, default=20_000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None)
+    parser.add_argument(
+        "--max-p95-ms",
+        type=float,
+        default=None,
+        help="Exit with an error if any search kind is slower at p95"
+    )
+    return parser.parse_args()
+
+def main() -> None:
+    args = parse_args()
+    results = asyncio.run(run_benchmark(args))
+    
+    report = json.dumps(results, indent=2)
+    print(report)
+    
+    if args.output:
+        Path(args.output).write_text(report, encoding="utf-8")
+        
+    if args.max_p95_ms is not None:
+        slow = [
+            name for name, stats in results['searches'].items()
+            if stats['p95_ms'] > args.max_p95_ms
+        ]
+        
+        if slow:
+            print(f"\np95 above {args.max_p95_ms} ms: {', '.join(slow)}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
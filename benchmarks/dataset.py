@@ -0,0 +1,358 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from pathlib import Path
+from typing import Iterator
+
+os.environ.setdefault("BOT_TOKEN", "0:benchmark")
+
+from bot.database.schema import (
+    CLEAR_QUIZ_SEARCH,
+    FILL_QUIZ_LEADERBOARD,
+    FILL_QUIZ_SEARCH,
+    FILL_USER_SCORES,
+    SCHEMA_VERSION,
+    init_db
+)
+from bot.logger import get_logger, setup_logging
+
+logger = get_logger(__name__)
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+TELEGRAM_ID_OFFSET = 1_000_000
+
+HISTORY_START = datetime(2025, 1, 1)
+HISTORY_SECONDS = 365 * 24 * 3600
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+TABLES = (
+    "users",
+    "quizzes",
+    "questions",
+    "answers",
+    "quiz_stats",
+    "attempts",
+    "quiz_leaderboard",
+    "user_scores"
+)
+
+def make_vocabulary(size: int, rng: random.Random) -> list[str]:
+    words: set[str] = set()
+    
+    while len(words) < size:
+        words.add("".join(rng.choices(LETTERS, k=rng.randint(3, 9))))
+        
+    return sorted(words)
+
+def make_text(
+    vocabulary: list[str],
+    cum_weights: list[float],
+    words: int,
+    rng: random.Random
+) -> str:
+    return " ".join(
+        rng.choices(vocabulary, cum_weights=cum_weights, k=words)
+    ).capitalize()
+
+def make_zipf_weights(size: int) -> list[float]:
+    return list(accumulate(1 / rank for rank in range(1, size + 1)))
+
+def format_offset(index: int, total: int) -> str:
+    seconds = index * HISTORY_SECONDS // max(1, total)
+    return (HISTORY_START + timedelta(seconds=seconds)).strftime(
+        TIMESTAMP_FORMAT
+    )
+
+class DatasetGenerator:
+    
+    def __init__(
+        self,
+        users: int,
+        quizzes: int,
+        questions_per_quiz: int,
+        answers_per_question: int,
+        attempts: int,
+        vocabulary_size: int = 20_000,
+        seed: int = 42
+    ) -> None:
+        if users < 1 or quizzes < 1 or questions_per_quiz < 1:
+            raise ValueError(
+                "users, quizzes and questions_per_quiz must be positive"
+            )
+        if answers_per_question < 0 or attempts < 0:
+            raise ValueError(
+                "answers_per_question and attempts must not be negative"
+            )
+            
+        self.users: int = users
+        self.quizzes: int = quizzes
+        self.questions_per_quiz: int = questions_per_quiz
+        self.answers_per_question: int = answers_per_question
+        self.attempts: int = attempts
+        self.seed: int = seed
+        
+        self._rng: random.Random = random.Random(seed)
+        self.vocabulary: list[str] = make_vocabulary(vocabulary_size, self._rng)
+        self._cum_weights: list[float] = make_zipf_weights(vocabulary_size)
+    
+    def generate(self, db_path: str) -> dict:
+        started = time.perf_counter()
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        
+        try:
+            if conn.execute("SELECT 1 FROM quizzes LIMIT 1").fetchone():
+                raise ValueError(f"Database {db_path} already contains quizzes")
+            
+            conn.execute("PRAGMA journal_mode = MEMORY")
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.execute("PRAGMA cache_size = -262144")
+            
+            conn.execute("BEGIN")
+            try:
+                self._insert(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+                
+            logger.info("Analyzing generated dataset...")
+            conn.execute("ANALYZE")
+            
+            rows = {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in TABLES
+            }
+        finally:
+            conn.close()
+            
+        return {
+            'generator': "benchmarks.dataset",
+            'created_at': datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT),
+            'seed': self.seed,
+            'parameters': {
+                'users': self.users,
+                'quizzes': self.quizzes,
+                'questions_per_quiz': self.questions_per_quiz,
+                'answers_per_question': self.answers_per_question,
+                'attempts': self.attempts,
+                'vocabulary': len(self.vocabulary)
+            },
+            'schema_version': SCHEMA_VERSION,
+            'sqlite': sqlite3.sqlite_version,
+            'rows': rows,
+            'elapsed_s': round(time.perf_counter() - started, 3),
+            'database_bytes': os.path.getsize(db_path),
+            'database_path': db_path
+        }
+    
+    def _insert(self, conn: sqlite3.Connection) -> None:
+        steps = (
+            ("users", "INSERT INTO users (id, telegram_id, username, first_name, "
+             "created_at) VALUES (?, ?, ?, ?, ?)", self._users),
+            ("quizzes", "INSERT INTO quizzes (id, title, creator_id, "
+             "created_at) VALUES (?, ?, ?, ?)", self._quizzes),
+            ("questions", "INSERT INTO questions (id, quiz_id, text, position, "
+             "correct_answer) VALUES (?, ?, ?, ?, ?)", self._questions),
+            ("answers", "INSERT INTO answers (question_id, text, position) "
+             "VALUES (?, ?, ?)", self._answers),
+            ("attempts", "INSERT INTO attempts (telegram_id, quiz_id, "
+             "correct_answers, total_questions, percentage, duration_seconds, "
+             "finished_at) VALUES (?, ?, ?, ?, ?, ?, ?)", self._attempts)
+        )
+        
+        for name, sql, rows in steps:
+            step_started = time.perf_counter()
+            conn.executemany(sql, rows())
+            logger.info(
+                f"Generated {name} in "
+                f"{time.perf_counter() - step_started:.1f}s"
+            )
+            
+        step_started = time.perf_counter()
+        conn.execute(
+            "INSERT INTO quiz_stats (quiz_id, starts) "
+            "SELECT quiz_id, COUNT(*) FROM attempts GROUP BY quiz_id"
+        )
+        conn.execute(FILL_QUIZ_LEADERBOARD)
+        conn.execute(FILL_USER_SCORES)
+        logger.info(
+            f"Built stats and leaderboards in "
+            f"{time.perf_counter() - step_started:.1f}s"
+        )
+        
+        step_started = time.perf_counter()
+        conn.execute(CLEAR_QUIZ_SEARCH)
+        conn.execute(FILL_QUIZ_SEARCH)
+        logger.info(
+            f"Built quiz search index in "
+            f"{time.perf_counter() - step_started:.1f}s"
+        )
+    
+    def _users(self) -> Iterator[tuple]:
+        for user_id in range(1, self.users + 1):
+            yield (
+                user_id,
+                TELEGRAM_ID_OFFSET + user_id,
+                f"user{user_id}",
+                self._rng.choice(self.vocabulary).capitalize(),
+                format_offset(user_id, self.users)
+            )
+    
+    def _quizzes(self) -> Iterator[tuple]:
+        creators = self._rng.choices(
+            range(1, self.users + 1),
+            cum_weights=make_zipf_weights(self.users),
+            k=self.quizzes
+        )
+        
+        for quiz_id, creator_id in enumerate(creators, start=1):
+            yield (
+                quiz_id,
+                make_text(self.vocabulary, self._cum_weights, 3, self._rng),
+                creator_id,
+                format_offset(quiz_id, self.quizzes)
+            )
+    
+    def _questions(self) -> Iterator[tuple]:
+        question_id = 0
+        
+        for quiz_id in range(1, self.quizzes + 1):
+            for position in range(1, self.questions_per_quiz + 1):
+                question_id += 1
+                yield (
+                    question_id,
+                    quiz_id,
+                    make_text(
+                        self.vocabulary,
+                        self._cum_weights,
+                        8,
+                        self._rng
+                    ) + "?",
+                    position,
+                    self._rng.randint(1, max(1, self.answers_per_question))
+                )
+    
+    def _answers(self) -> Iterator[tuple]:
+        answers = self.answers_per_question
+        positions = range(1, answers + 1)
+        
+        for question_id in range(1, self.quizzes * self.questions_per_quiz + 1):
+            words = self._rng.choices(
+                self.vocabulary,
+                cum_weights=self._cum_weights,
+                k=answers * 2
+            )
+            
+            for position in positions:
+                yield (
+                    question_id,
+                    f"{words[position * 2 - 2]} {words[position * 2 - 1]}"
+                    .capitalize(),
+                    position
+                )
+    
+    def _attempts(self) -> Iterator[tuple]:
+        quiz_ids = list(range(1, self.quizzes + 1))
+        telegram_ids = list(range(
+            TELEGRAM_ID_OFFSET + 1,
+            TELEGRAM_ID_OFFSET + self.users + 1
+        ))
+        self._rng.shuffle(quiz_ids)
+        self._rng.shuffle(telegram_ids)
+        
+        quizzes = self._rng.choices(
+            quiz_ids,
+            cum_weights=make_zipf_weights(self.quizzes),
+            k=self.attempts
+        )
+        players = self._rng.choices(
+            telegram_ids,
+            cum_weights=make_zipf_weights(self.users),
+            k=self.attempts
+        )
+        total = self.questions_per_quiz
+        
+        for index, (quiz_id, telegram_id) in enumerate(zip(quizzes, players)):
+            correct = round(self._rng.betavariate(4, 2) * total)
+            yield (
+                telegram_id,
+                quiz_id,
+                correct,
+                total,
+                round(correct / total * 100, 2),
+                round(self._rng.uniform(3, 30) * total, 3),
+                format_offset(index, self.attempts)
+            )
+
+def write_manifest(manifest: dict, path: str) -> None:
+    Path(path).write_text(
+        json.dumps(manifest, indent=2, ensure_ascii=False),
+        encoding="utf-8"
+    )
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate a reproducible synthetic database for benchmarks"
+    )
+    parser.add_argument("output", help="Path of the SQLite database to create")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--quizzes", type=int, default=100_000)
+    parser.add_argument("--questions", type=int, default=25)
+    parser.add_argument("--answers", type=int, default=4)
+    parser.add_argument("--attempts", type=int, default=1_000_000)
+    parser.add_argument("--vocabulary", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--manifest",
+        default=None,
+        help="Where to write the manifest (default: <output>.manifest.json)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Overwrite the database if it already exists"
+    )
+    return parser.parse_args()
+
+def main() -> None:
+    setup_logging()
+    args = parse_args()
+    
+    output = Path(args.output)
+    if output.exists():
+        if not args.force:
+            raise SystemExit(f"{output} already exists, use --force to replace it")
+        output.unlink()
+        
+    generator = DatasetGenerator(
+        users=args.users,
+        quizzes=args.quizzes,
+        questions_per_quiz=args.questions,
+        answers_per_question=args.answers,
+        attempts=args.attempts,
+        vocabulary_size=args.vocabulary,
+        seed=args.seed
+    )
+    
+    asyncio.run(init_db(str(output)))
+    manifest = generator.generate(str(output))
+    
+    manifest_path = args.manifest or f"{output}.manifest.json"
+    write_manifest(manifest, manifest_path)
+    
+    logger.info(
+        f"Dataset written to {output} in {manifest['elapsed_s']}s, "
+        f"manifest: {manifest_path}"
+    )
+    print(json.dumps(manifest, indent=2, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
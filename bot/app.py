@@ -0,0 +1,296 @@
+from typing import Optional
+
+from aiogram import Bot, Dispatcher
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import PRODUCTION, TelegramAPIServer
+from aiogram.fsm.storage.memory import MemoryStorage
+
+from bot.config import get_config
+from bot.database.query_stats import query_stats
+from bot.handlers.admin_handler import admin_router, register_admin_handlers
+from bot.handlers.analytics_handler import (
+    analytics_router,
+    register_analytics_handlers
+)
+from bot.handlers.export_handler import (
+    export_router,
+    register_export_handlers
+)
+from bot.handlers.inline_handler import (
+    inline_router,
+    register_inline_handlers
+)
+from bot.handlers.create_handler import (
+    create_router,
+    register_create_handlers
+)
+from bot.handlers.quiz_handler import (
+    get_active_sessions_count,
+    get_sessions_approx_size,
+    quiz_router,
+    register_quiz_handlers
+)
+from bot.handlers.results_handler import (
+    register_results_handlers,
+    results_router
+)
+from bot.handlers.start_handler import (
+    start_router,
+    register_start_handlers
+)
+from bot.keyboards.question_keyboard import keyboard_cache
+from bot.logger import get_dropped_records
+from bot.middlewares.concurrency_middleware import (
+    ConcurrencyLimiter,
+    ConcurrencyMiddleware
+)
+from bot.middlewares.logging_middleware import LoggingMiddleware
+from bot.middlewares.metrics_middleware import MetricsMiddleware
+from bot.monitoring.health import HealthChecker
+from bot.monitoring.loop_monitor import LoopLagMonitor
+from bot.monitoring.memory import MemoryProfiler, approx_size
+from bot.monitoring.metrics import (
+    ACTIVE_SESSIONS,
+    INTAKE_IN_FLIGHT,
+    INTAKE_QUEUED,
+    INTAKE_SHED,
+    LOG_DROPPED,
+    OUTBOUND_IN_FLIGHT
+)
+from bot.monitoring.outbound import outbound_tracker
+from bot.monitoring.profiler import UpdateProfiler
+from bot.repositories.analytics_repository import AnalyticsRepository
+from bot.repositories.answer_repository import AnswerRepository
+from bot.repositories.attempt_repository import AttemptRepository
+from bot.repositories.leaderboard_repository import LeaderboardRepository
+from bot.repositories.question_repository import QuestionRepository
+from bot.repositories.quiz_repository import QuizRepository
+from bot.repositories.quiz_stats_repository import QuizStatsRepository
+from bot.repositories.user_repository import UserRepository
+from bot.services.analytics_service import AnalyticsService
+from bot.services.attempt_service import AttemptService
+from bot.services.export_service import ExportService
+from bot.services.inline_search_service import InlineSearchService
+from bot.services.leaderboard_service import LeaderboardService
+from bot.services.quiz_service import QuizService
+from bot.services.stats_service import StatsService
+from bot.services.user_service import UserService
+from bot.services.warmup_service import WarmupService
+
+def get_api_server(api_url: Optional[str]) -> TelegramAPIServer:
+    if api_url is None:
+        return PRODUCTION
+    
+    return TelegramAPIServer.from_base(api_url.rstrip("/"))
+
+def create_bot(bot_token: str, api_url: Optional[str] = None) -> Bot:
+    if api_url is None:
+        bot = Bot(token=bot_token)
+    else:
+        session = AiohttpSession(api=get_api_server(api_url))
+        bot = Bot(token=bot_token, session=session)
+        
+    bot.session.middleware(outbound_tracker)
+    
+    return bot
+
+def create_dispatcher(database_path: str) -> Dispatcher:
+    config = get_config()
+    storage = MemoryStorage()
+    dp = Dispatcher(storage=storage)
+    
+    query_stats.configure(slow_query_ms=config.slow_query_ms)
+    
+    dp.update.middleware(LoggingMiddleware(
+        structured=config.log_format == "json",
+        sample_rate=config.log_sample_rate,
+        slow_threshold_ms=config.slow_update_ms
+    ))
+    dp.message.middleware(MetricsMiddleware("message"))
+    dp.callback_query.middleware(MetricsMiddleware("callback_query"))
+    dp.inline_query.middleware(MetricsMiddleware("inline_query"))
+    
+    user_repo = UserRepository(database_path)
+    quiz_repo = QuizRepository(database_path)
+    question_repo = QuestionRepository(database_path)
+    answer_repo = AnswerRepository(database_path)
+    quiz_stats_repo = QuizStatsRepository(database_path)
+    attempt_repo = AttemptRepository(database_path)
+    leaderboard_repo = LeaderboardRepository(database_path)
+    analytics_repo = AnalyticsRepository(database_path)
+    
+    user_service = UserService(user_repo)
+    quiz_service = QuizService(
+        quiz_repo,
+        question_repo,
+        answer_repo,
+        quiz_stats_repo,
+        database_path,
+        question_cache_size=config.question_cache_size,
+        question_window=config.question_window,
+        catalogue_cache_ttl=config.catalogue_cache_ttl,
+        starts_flush_interval=config.starts_flush_interval
+    )
+    leaderboard_service = LeaderboardService(
+        leaderboard_repo,
+        size=config.leaderboard_size,
+        max_quizzes=config.leaderboard_quizzes
+    )
+    attempt_service = AttemptService(
+        attempt_repo,
+        leaderboard_service,
+        batch_size=config.attempts_batch_size,
+        flush_interval=config.attempts_flush_interval
+    )
+    analytics_service = AnalyticsService(
+        analytics_repo,
+        buffer_size=config.analytics_buffer_size,
+        flush_interval=config.analytics_flush_interval,
+        rollup_interval=config.analytics_rollup_interval
+    )
+    export_service = ExportService(
+        database_path,
+        max_concurrent=config.export_max_concurrent
+    )
+    inline_search_service = InlineSearchService(
+        quiz_service,
+        debounce=config.inline_debounce,
+        cache_ttl=config.inline_cache_ttl,
+        cache_time=config.inline_cache_time
+    )
+    
+    register_admin_handlers(admin_router, config.admin_ids)
+    register_start_handlers(start_router, config.admin_ids)
+    register_quiz_handlers(quiz_router)
+    register_create_handlers(create_router)
+    register_inline_handlers(inline_router)
+    register_results_handlers(results_router)
+    register_analytics_handlers(analytics_router)
+    register_export_handlers(export_router)
+    
+    limiter = ConcurrencyLimiter(
+        max_concurrent=config.max_concurrent_updates,
+        max_queued=config.max_queued_updates,
+        router_limits=config.router_concurrency_limits
+    )
+    
+    for router in (
+        start_router,
+        quiz_router,
+        results_router,
+        analytics_router,
+        export_router,
+        create_router,
+        inline_router
+    ):
+        concurrency_middleware = ConcurrencyMiddleware(limiter, router.name)
+        router.message.middleware(concurrency_middleware)
+        router.callback_query.middleware(concurrency_middleware)
+        router.inline_query.middleware(concurrency_middleware)
+        
+    dp.include_router(admin_router)
+    dp.include_router(start_router)
+    dp.include_router(quiz_router)
+    dp.include_router(results_router)
+    dp.include_router(analytics_router)
+    dp.include_router(export_router)
+    dp.include_router(create_router)
+    dp.include_router(inline_router)
+    
+    dp["user_service"] = user_service
+    dp["quiz_service"] = quiz_service
+    dp["inline_search_service"] = inline_search_service
+    dp["attempt_service"] = attempt_service
+    dp["leaderboard_service"] = leaderboard_service
+    dp["analytics_service"] = analytics_service
+    dp["export_service"] = export_service
+    dp["concurrency_limiter"] = limiter
+    dp.startup.register(quiz_service.start)
+    dp.shutdown.register(quiz_service.stop)
+    dp.startup.register(attempt_service.start)
+    dp.shutdown.register(attempt_service.stop)
+    dp.startup.register(analytics_service.start)
+    dp.shutdown.register(analytics_service.stop)
+    
+    warmup = WarmupService(
+        quiz_service,
+        database_path,
+        catalogue_pages=config.warmup_catalogue_pages,
+        top_quizzes=config.warmup_top_quizzes
+    )
+    dp["warmup"] = warmup
+    dp.startup.register(warmup.start)
+    dp.shutdown.register(warmup.stop)
+    
+    loop_monitor = LoopLagMonitor(
+        interval=config.loop_lag_interval,
+        threshold_ms=config.loop_lag_threshold_ms
+    )
+    dp["loop_monitor"] = loop_monitor
+    dp.startup.register(loop_monitor.start)
+    dp.shutdown.register(loop_monitor.stop)
+    
+    profiler = UpdateProfiler(default_seconds=config.profile_seconds)
+    dp["profiler"] = profiler
+    dp.startup.register(profiler.install_signal_handler)
+    dp.shutdown.register(profiler.remove_signal_handler)
+    
+    caches = quiz_service.caches + [
+        inline_search_service.cache,
+        leaderboard_service.cache,
+        keyboard_cache
+    ]
+    
+    memory_profiler = MemoryProfiler(
+        report_interval=config.memory_report_interval,
+        frames=config.tracemalloc_frames
+    )
+    memory_profiler.register("quiz_sessions", get_sessions_approx_size)
+    memory_profiler.register("fsm_storage", lambda: approx_size(
+        [(record.state, record.data) for record in storage.storage.values()]
+    ))
+    for cache in caches:
+        memory_profiler.register(f"{cache.name}_cache", cache.approx_size)
+    dp["memory_profiler"] = memory_profiler
+    dp.startup.register(memory_profiler.start)
+    dp.shutdown.register(memory_profiler.stop)
+    
+    sessions = {
+        'quiz': get_active_sessions_count,
+        'create': lambda: sum(
+            1 for record in storage.storage.values()
+            if record.state is not None
+        )
+    }
+    
+    health = HealthChecker(
+        database_path,
+        loop_monitor,
+        limiter,
+        sessions,
+        max_loop_lag_ms=config.health_max_loop_lag_ms,
+        max_db_latency_ms=config.health_max_db_latency_ms,
+        max_outbound_requests=config.health_max_outbound_requests
+    )
+    dp["health"] = health
+    dp.update.middleware(health.track_update)
+    
+    stats_service = StatsService(
+        sessions,
+        caches,
+        loop_monitor=loop_monitor,
+        refresh_interval=config.stats_refresh_interval
+    )
+    dp["stats_service"] = stats_service
+    dp.startup.register(stats_service.start)
+    dp.shutdown.register(stats_service.stop)
+    
+    for kind, count in sessions.items():
+        ACTIVE_SESSIONS.set_function(count, kind)
+    INTAKE_QUEUED.set_function(lambda: limiter.queued)
+    INTAKE_IN_FLIGHT.set_function(lambda: limiter.in_flight)
+    INTAKE_SHED.set_function(lambda: limiter.shed_total)
+    LOG_DROPPED.set_function(get_dropped_records)
+    OUTBOUND_IN_FLIGHT.set_function(lambda: outbound_tracker.in_flight)
+    
+    return dp
\ No newline at end of file
@@ -0,0 +1,78 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from bot.monitoring.memory import approx_size
+from bot.monitoring.metrics import CACHE_REQUESTS
+
+class LRUCache:
+    
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        ttl: Optional[float] = None
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive integer")
+        
+        self.name: str = name
+        self._maxsize: int = maxsize
+        self._ttl: Optional[float] = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._hit_counter = CACHE_REQUESTS.labels(name, "hit")
+        self._miss_counter = CACHE_REQUESTS.labels(name, "miss")
+        
+        self.hits: int = 0
+        self.misses: int = 0
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._data.get(key)
+        
+        if entry is not None and (
+            self._ttl is None or entry[0] > time.monotonic()
+        ):
+            self._data.move_to_end(key)
+            self.hits += 1
+            self._hit_counter.inc()
+            return entry[1]
+        
+        if entry is not None:
+            del self._data[key]
+            
+        self.misses += 1
+        self._miss_counter.inc()
+        return None
+    
+    def peek(self, key: Hashable) -> Optional[Any]:
+        entry = self._data.get(key)
+        
+        if entry is None or (
+            self._ttl is not None and entry[0] <= time.monotonic()
+        ):
+            return None
+        
+        return entry[1]
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = (
+            time.monotonic() + self._ttl if self._ttl is not None else 0.0
+        )
+        
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+    
+    def approx_size(self) -> int:
+        return approx_size(self._data)
+    
+    def clear(self) -> None:
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
\ No newline at end of file
@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Literal, Optional
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -18,5 +21,262 @@ class Config(BaseSettings):
         default="quiz_bot.db",
         description="Path to SQLite database file"
     )
+    workers: int = Field(
+        default=1,
+        ge=1,
+        description="Number of worker processes, updates are sharded "
+                    "between them by user id"
+    )
+    max_concurrent_updates: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum number of updates handled at the same time"
+    )
+    max_queued_updates: int = Field(
+        default=1000,
+        ge=0,
+        description="Maximum number of updates of one router waiting for "
+                    "a free slot, further updates get a busy reply"
+    )
+    router_concurrency_limits: dict[str, int] = Field(
+        default={"start": 20, "create": 20, "inline": 20},
+        description="Per-router concurrency limits keyed by router name"
+    )
+    question_cache_size: int = Field(
+        default=4096,
+        ge=1,
+        description="How many questions with answers are kept in memory"
+    )
+    question_window: int = Field(
+        default=5,
+        ge=1,
+        description="Questions loaded with one query while a quiz is taken, "
+                    "the current one included"
+    )
+    catalogue_cache_ttl: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds a catalogue page is served from memory"
+    )
+    warmup_catalogue_pages: int = Field(
+        default=3,
+        ge=0,
+        description="Catalogue pages loaded into the cache after startup"
+    )
+    warmup_top_quizzes: int = Field(
+        default=20,
+        ge=0,
+        description="Most started quizzes loaded into the cache after "
+                    "startup"
+    )
+    inline_debounce: float = Field(
+        default=0.3,
+        ge=0,
+        description="Seconds an inline query waits for a newer keystroke "
+                    "from the same user before hitting the database"
+    )
+    inline_cache_ttl: float = Field(
+        default=60.0,
+        ge=0,
+        description="Seconds inline search results are kept in memory"
+    )
+    inline_cache_time: int = Field(
+        default=300,
+        ge=0,
+        description="Seconds Telegram may cache inline search results"
+    )
+    attempts_batch_size: int = Field(
+        default=100,
+        ge=1,
+        description="Finished attempts that trigger an immediate write"
+    )
+    attempts_flush_interval: float = Field(
+        default=1.0,
+        gt=0,
+        description="Longest time a finished attempt waits before it is "
+                    "written"
+    )
+    analytics_buffer_size: int = Field(
+        default=10000,
+        ge=1,
+        description="Answer events buffered in memory before the oldest "
+                    "are dropped"
+    )
+    analytics_flush_interval: float = Field(
+        default=2.0,
+        gt=0,
+        description="Seconds between bulk writes of buffered answer events"
+    )
+    analytics_rollup_interval: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds between answer distribution rollups"
+    )
+    export_max_concurrent: int = Field(
+        default=2,
+        ge=1,
+        description="Exports generated at the same time in worker threads"
+    )
+    leaderboard_size: int = Field(
+        default=10,
+        ge=1,
+        description="Players shown on a leaderboard"
+    )
+    leaderboard_quizzes: int = Field(
+        default=256,
+        ge=1,
+        description="Quiz leaderboards kept in memory"
+    )
+    starts_flush_interval: float = Field(
+        default=10.0,
+        gt=0,
+        description="Seconds between writes of buffered quiz start counts"
+    )
+    log_level: str = Field(
+        default="INFO",
+        description="Root logging level"
+    )
+    log_format: Literal["text", "json"] = Field(
+        default="text",
+        description="Log line format; json writes one compact object per "
+                    "record with structured update fields"
+    )
+    log_sample_rate: float = Field(
+        default=0.01,
+        ge=0,
+        le=1,
+        description="Share of successful updates that get a log line, "
+                    "failed and slow updates are always logged"
+    )
+    slow_update_ms: float = Field(
+        default=1000.0,
+        ge=0,
+        description="Updates handled slower than this are logged as slow"
+    )
+    loop_lag_interval: float = Field(
+        default=0.5,
+        gt=0,
+        description="Seconds between event loop lag probes"
+    )
+    loop_lag_threshold_ms: float = Field(
+        default=100.0,
+        gt=0,
+        description="Lag at which the loop counts as blocked and the stack "
+                    "of the blocking frame is logged"
+    )
+    profile_seconds: float = Field(
+        default=10.0,
+        gt=0,
+        le=300,
+        description="How long SIGUSR1 or /profile without an argument "
+                    "profiles the event loop thread"
+    )
+    memory_report_interval: float = Field(
+        default=300.0,
+        ge=0,
+        description="Seconds between memory reports in the log, "
+                    "0 disables them"
+    )
+    tracemalloc_frames: int = Field(
+        default=1,
+        ge=1,
+        description="Stack frames stored per allocation while /mem "
+                    "tracing is on"
+    )
+    stats_refresh_interval: float = Field(
+        default=15.0,
+        gt=0,
+        description="Seconds between refreshes of the /stats aggregates"
+    )
+    health_max_loop_lag_ms: float = Field(
+        default=500.0,
+        gt=0,
+        description="Event loop lag above which /health/ready fails"
+    )
+    health_max_db_latency_ms: float = Field(
+        default=500.0,
+        gt=0,
+        description="Database round trip above which /health/ready fails"
+    )
+    health_max_outbound_requests: int = Field(
+        default=100,
+        ge=1,
+        description="In-flight Bot API requests above which /health/ready "
+                    "fails"
+    )
+    log_max_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        ge=0,
+        description="Size at which logs/bot.log is rotated, 0 disables "
+                    "rotation"
+    )
+    log_backup_count: int = Field(
+        default=5,
+        ge=0,
+        description="How many rotated log files are kept"
+    )
+    log_queue_size: int = Field(
+        default=10000,
+        ge=1,
+        description="Log records buffered for the writer thread, further "
+                    "records are dropped and counted"
+    )
+    slow_query_ms: float = Field(
+        default=100.0,
+        ge=0,
+        description="SQL statements slower than this are logged together "
+                    "with their query plan"
+    )
+    admin_ids: list[int] = Field(
+        default=[],
+        description="Telegram ids of users allowed to run admin commands"
+    )
+    metrics_enabled: bool = Field(
+        default=True,
+        description="Serve Prometheus metrics over HTTP"
+    )
+    metrics_host: str = Field(
+        default="0.0.0.0",
+        description="Interface the metrics server binds to"
+    )
+    metrics_port: int = Field(
+        default=9090,
+        description="Port of the metrics server; worker N of the "
+                    "supervisor uses metrics_port + 1 + N"
+    )
+    telegram_api_url: Optional[str] = Field(
+        default=None,
+        description="Base URL of a Bot API server to use instead of "
+                    "api.telegram.org, e.g. a local stand-in for load tests"
+    )
+    webhook_url: Optional[str] = Field(
+        default=None,
+        description="Public webhook URL; when set the bot receives "
+                    "updates via webhook instead of polling"
+    )
+    webhook_path: str = Field(
+        default="/webhook",
+        description="Path the webhook server listens on"
+    )
+    webhook_host: str = Field(
+        default="0.0.0.0",
+        description="Interface the webhook server binds to"
+    )
+    webhook_port: int = Field(
+        default=8080,
+        description="Port the webhook server binds to"
+    )
+    webhook_secret: Optional[str] = Field(
+        default=None,
+        description="Secret token Telegram sends with every webhook request"
+    )
+
+@lru_cache(maxsize=None)
+def get_config() -> Config:
+    return Config()
 
-config: Config = Config()
\ No newline at end of file
+def __getattr__(name: str) -> Config:
+    if name == "config":
+        return get_config()
+    
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
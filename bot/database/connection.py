@@ -1,7 +1,118 @@
-from typing import Optional
+import sqlite3
+import time
+from typing import Any, Callable, Iterable, Optional
 
 import aiosqlite
 
+from bot.database.query_stats import get_statement_name, query_stats
+
+class InstrumentedCursor(sqlite3.Cursor):
+    
+    statement: Optional[str] = None
+    sql: str = ""
+    parameters: Any = ()
+    elapsed: float = 0.0
+    
+    def fetchone(self) -> Any:
+        return self._timed(super().fetchone)
+    
+    def fetchmany(self, size: int = 1) -> list[Any]:
+        return self._timed(super().fetchmany, size)
+    
+    def fetchall(self) -> list[Any]:
+        return self._timed(super().fetchall)
+    
+    def _timed(self, fetch: Callable[..., Any], *args: Any) -> Any:
+        started = time.perf_counter()
+        
+        try:
+            return fetch(*args)
+        finally:
+            if self.statement is not None:
+                self.connection.record_query(
+                    self.statement,
+                    self.sql,
+                    self.parameters,
+                    self.elapsed + time.perf_counter() - started
+                )
+                self.statement = None
+
+class InstrumentedConnection(sqlite3.Connection):
+    
+    def cursor(self, factory: type = InstrumentedCursor) -> sqlite3.Cursor:
+        return super().cursor(factory)
+    
+    def execute(
+        self,
+        sql: str,
+        parameters: Iterable[Any] = (),
+        /
+    ) -> sqlite3.Cursor:
+        started = time.perf_counter()
+        cursor = super().execute(sql, parameters)
+        elapsed = time.perf_counter() - started
+        
+        name = get_statement_name(sql)
+        
+        if cursor.description is None:
+            self.record_query(name, sql, parameters, elapsed)
+        else:
+            cursor.statement = name
+            cursor.sql = sql
+            cursor.parameters = parameters
+            cursor.elapsed = elapsed
+            
+        return cursor
+    
+    def executemany(
+        self,
+        sql: str,
+        parameters: Iterable[Iterable[Any]],
+        /
+    ) -> sqlite3.Cursor:
+        started = time.perf_counter()
+        cursor = super().executemany(sql, parameters)
+        
+        self.record_query(
+            get_statement_name(sql),
+            sql,
+            None,
+            time.perf_counter() - started
+        )
+        return cursor
+    
+    def record_query(
+        self,
+        name: str,
+        sql: str,
+        parameters: Any,
+        duration: float
+    ) -> None:
+        query_stats.record(name, sql, duration)
+        
+        if not query_stats.is_slow(duration):
+            return
+        
+        if query_stats.get_plan(name) is None:
+            query_stats.set_plan(name, self._explain(sql, parameters))
+            
+        query_stats.log_slow(name, sql, duration)
+    
+    def _explain(self, sql: str, parameters: Any) -> list[str]:
+        if parameters is None:
+            return ["<not available for executemany>"]
+        
+        try:
+            rows = sqlite3.Connection.execute(
+                self,
+                f"EXPLAIN QUERY PLAN {sql}",
+                parameters
+            ).fetchall()
+        except sqlite3.Error as e:
+            return [f"<failed: {e}>"]
+        
+        return [row[3] for row in rows]
+
 class DatabaseConnection:
     
     def __init__(self, db_path: str) -> None:
@@ -9,7 +120,10 @@ class DatabaseConnection:
         self._connection: Optional[aiosqlite.Connection] = None
     
     async def __aenter__(self) -> aiosqlite.Connection:
-        self._connection = await aiosqlite.connect(self._db_path)
+        self._connection = await aiosqlite.connect(
+            self._db_path,
+            factory=InstrumentedConnection
+        )
         await self._connection.execute("PRAGMA foreign_keys = ON")
         return self._connection
     
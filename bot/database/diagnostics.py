@@ -0,0 +1,301 @@
+import ast
+import re
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+STATEMENT_NAME_PATTERN = re.compile(r"\s*--\s*([\w.]+)[ \t]*\n")
+INDEX_USAGE_PATTERN = re.compile(r"USING (?:COVERING )?INDEX (\w+)")
+FULL_SCAN_PATTERN = re.compile(r"SCAN (\w+)$")
+MATERIALIZED_PATTERN = re.compile(r"(?:MATERIALIZE|CO-ROUTINE) (\w+)")
+
+PLACEHOLDER = "\0"
+
+PLAN_EXCEPTIONS: dict[str, str] = {
+    'analytics.roll_up_distribution': (
+        "groups only the events added since the previous roll-up"
+    ),
+    'export.iter_quizzes': "streams the whole catalogue",
+    'export.iter_results': "streams every attempt"
+}
+
+STALE_STATISTICS_RATIO = 0.25
+
+class _StatementCollector(ast.NodeVisitor):
+    
+    def __init__(self) -> None:
+        self.statements: dict[str, str] = {}
+    
+    def visit_Constant(self, node: ast.Constant) -> None:
+        if isinstance(node.value, str):
+            self._add(node.value)
+    
+    def visit_JoinedStr(self, node: ast.JoinedStr) -> None:
+        self._add("".join(
+            value.value if isinstance(value, ast.Constant) else PLACEHOLDER
+            for value in node.values
+        ))
+    
+    def _add(self, sql: str) -> None:
+        match = STATEMENT_NAME_PATTERN.match(sql)
+        
+        if match is None or PLACEHOLDER in match.group(0):
+            return
+        
+        self.statements[match.group(1)] = sql.replace(PLACEHOLDER, "")
+
+def collect_statements(root: Path) -> dict[str, str]:
+    collector = _StatementCollector()
+    
+    for path in sorted(root.rglob("*.py")):
+        collector.visit(ast.parse(path.read_text(encoding="utf-8")))
+        
+    return dict(sorted(collector.statements.items()))
+
+def explain(conn: sqlite3.Connection, sql: str) -> list[str]:
+    rows = conn.execute(
+        f"EXPLAIN QUERY PLAN {sql}",
+        (None,) * sql.count("?")
+    ).fetchall()
+    return [row[3] for row in rows]
+
+def find_plan_problems(plan: list[str]) -> list[str]:
+    materialized = {
+        match.group(1) for match in map(MATERIALIZED_PATTERN.match, plan)
+        if match
+    }
+    problems: list[str] = []
+    
+    for detail in plan:
+        if detail.startswith("USE TEMP B-TREE"):
+            problems.append(detail)
+            continue
+        
+        match = FULL_SCAN_PATTERN.match(detail)
+        if match and match.group(1) not in materialized:
+            problems.append(detail)
+            
+    return problems
+
+def check_query_plans(
+    conn: sqlite3.Connection,
+    statements: dict[str, str]
+) -> list[dict]:
+    results: list[dict] = []
+    
+    for name, sql in statements.items():
+        try:
+            plan = explain(conn, sql)
+            problems = find_plan_problems(plan)
+        except sqlite3.Error as e:
+            plan = []
+            problems = [f"cannot explain: {e}"]
+            
+        results.append({
+            'name': name,
+            'plan': plan,
+            'problems': problems,
+            'allowed': PLAN_EXCEPTIONS.get(name) if problems else None
+        })
+        
+    return results
+
+def get_row_counts(conn: sqlite3.Connection) -> dict[str, int]:
+    tables = conn.execute(
+        """
+        SELECT name FROM sqlite_master
+        WHERE type = 'table' AND name NOT LIKE 'sqlite_%'
+        ORDER BY name
+        """
+    ).fetchall()
+    
+    return {
+        name: conn.execute(f'SELECT COUNT(*) FROM "{name}"').fetchone()[0]
+        for (name,) in tables
+    }
+
+def get_object_sizes(conn: sqlite3.Connection) -> Optional[dict[str, dict]]:
+    try:
+        rows = conn.execute(
+            """
+            SELECT name, SUM(pgsize), SUM(unused), COUNT(*)
+            FROM dbstat
+            GROUP BY name
+            """
+        ).fetchall()
+    except sqlite3.OperationalError:
+        return None
+    
+    return {
+        name: {'bytes': size, 'unused_bytes': unused, 'pages': pages}
+        for name, size, unused, pages in rows
+    }
+
+def get_table_sizes(
+    conn: sqlite3.Connection,
+    row_counts: dict[str, int],
+    sizes: Optional[dict[str, dict]]
+) -> list[dict]:
+    index_bytes: dict[str, int] = {}
+    
+    if sizes is not None:
+        for name, table in conn.execute(
+            "SELECT name, tbl_name FROM sqlite_master WHERE type = 'index'"
+        ):
+            if name in sizes and name != table:
+                index_bytes[table] = (
+                    index_bytes.get(table, 0) + sizes[name]['bytes']
+                )
+                
+    return sorted(
+        (
+            {
+                'table': table,
+                'rows': rows,
+                'bytes': sizes.get(table, {}).get('bytes', 0)
+                if sizes is not None else None,
+                'index_bytes': index_bytes.get(table, 0)
+                if sizes is not None else None
+            }
+            for table, rows in row_counts.items()
+        ),
+        key=lambda item: (item['bytes'] or 0) + (item['index_bytes'] or 0),
+        reverse=True
+    )
+
+def get_index_usage(
+    conn: sqlite3.Connection,
+    plans: list[dict],
+    sizes: Optional[dict[str, dict]]
+) -> list[dict]:
+    used_by: dict[str, list[str]] = {}
+    
+    for result in plans:
+        for detail in result['plan']:
+            for index in INDEX_USAGE_PATTERN.findall(detail):
+                used_by.setdefault(index, []).append(result['name'])
+                
+    indexes: list[dict] = []
+    
+    for name, table in conn.execute(
+        """
+        SELECT name, tbl_name FROM sqlite_master
+        WHERE type = 'index'
+        ORDER BY tbl_name, name
+        """
+    ).fetchall():
+        info = conn.execute(f'PRAGMA index_list("{table}")').fetchall()
+        unique = any(row[1] == name and row[2] for row in info)
+        columns = [
+            row[2] for row in conn.execute(f'PRAGMA index_info("{name}")')
+        ]
+        indexes.append({
+            'name': name,
+            'table': table,
+            'columns': columns,
+            'unique': unique,
+            'bytes': sizes.get(name, {}).get('bytes')
+            if sizes is not None else None,
+            'used_by': sorted(set(used_by.get(name, []))),
+            'redundant_with': None
+        })
+        
+    for index in indexes:
+        if index['unique']:
+            continue
+        
+        for other in indexes:
+            if (
+                other is not index
+                and other['table'] == index['table']
+                and other['columns'][:len(index['columns'])]
+                == index['columns']
+                and (
+                    len(other['columns']) > len(index['columns'])
+                    or other['unique']
+                )
+            ):
+                index['redundant_with'] = other['name']
+                break
+    
+    return indexes
+
+def get_fragmentation(
+    conn: sqlite3.Connection,
+    sizes: Optional[dict[str, dict]],
+    min_pages: int = 8
+) -> dict:
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+    freelist_count = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    
+    objects: list[dict] = []
+    
+    if sizes is not None:
+        for name, size in sizes.items():
+            if size['pages'] >= min_pages:
+                objects.append({
+                    'name': name,
+                    'unused_percent': round(
+                        size['unused_bytes'] / size['bytes'] * 100,
+                        1
+                    )
+                })
+        objects.sort(key=lambda item: item['unused_percent'], reverse=True)
+        
+    return {
+        'page_size': page_size,
+        'page_count': page_count,
+        'freelist_count': freelist_count,
+        'free_percent': round(freelist_count / page_count * 100, 1)
+        if page_count else 0.0,
+        'objects': objects
+    }
+
+def get_analyze_freshness(
+    conn: sqlite3.Connection,
+    row_counts: dict[str, int]
+) -> list[dict]:
+    has_statistics = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+    ).fetchone() is not None
+    
+    estimates: dict[str, int] = {}
+    
+    if has_statistics:
+        for table, stat in conn.execute("SELECT tbl, stat FROM sqlite_stat1"):
+            if stat:
+                estimates[table] = max(
+                    estimates.get(table, 0),
+                    int(stat.split()[0])
+                )
+                
+    virtual = {
+        name for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE sql LIKE 'CREATE VIRTUAL%'"
+        )
+    }
+    freshness: list[dict] = []
+    
+    for table, rows in row_counts.items():
+        if table in virtual:
+            continue
+        
+        estimate = estimates.get(table)
+        
+        if estimate is None:
+            status = "missing" if rows else "empty"
+            drift = None
+        else:
+            drift = abs(rows - estimate) / max(estimate, 1)
+            status = "stale" if drift > STALE_STATISTICS_RATIO else "fresh"
+            
+        freshness.append({
+            'table': table,
+            'rows': rows,
+            'estimated_rows': estimate,
+            'drift': round(drift, 2) if drift is not None else None,
+            'status': status
+        })
+        
+    return freshness
\ No newline at end of file
@@ -0,0 +1,142 @@
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Optional
+
+from bot.logger import get_logger
+from bot.monitoring.metrics import DB_QUERIES, DB_QUERY_LATENCY
+
+logger = get_logger(__name__)
+
+@lru_cache(maxsize=1024)
+def get_statement_name(sql: str) -> str:
+    stripped = sql.lstrip()
+    
+    if stripped.startswith("--"):
+        return stripped[2:].split("\n", 1)[0].strip()
+    
+    return " ".join(stripped.split())[:60]
+
+def format_sql(sql: str) -> str:
+    lines = [
+        line.strip() for line in sql.strip().splitlines()
+        if not line.strip().startswith("--")
+    ]
+    return " ".join(line for line in lines if line)
+
+class StatementStats:
+    
+    __slots__ = (
+        "name", "sql", "count", "total", "max", "recent",
+        "_counter", "_histogram"
+    )
+    
+    def __init__(self, name: str, sql: str, sample_size: int) -> None:
+        self.name: str = name
+        self.sql: str = format_sql(sql)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+        self.recent: deque[float] = deque(maxlen=sample_size)
+        self._counter = DB_QUERIES.labels(name)
+        self._histogram = DB_QUERY_LATENCY.labels(name)
+    
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.recent.append(duration)
+        self._counter.inc()
+        self._histogram.observe(duration)
+    
+    def percentile(self, fraction: float) -> float:
+        values = sorted(self.recent)
+        
+        if not values:
+            return 0.0
+        
+        return values[min(len(values) - 1, int(len(values) * fraction))]
+    
+    def as_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'count': self.count,
+            'total_ms': round(self.total * 1000, 3),
+            'mean_ms': round(self.total * 1000 / self.count, 3),
+            'p95_ms': round(self.percentile(0.95) * 1000, 3),
+            'max_ms': round(self.max * 1000, 3)
+        }
+
+class QueryStats:
+    
+    def __init__(
+        self,
+        slow_query_ms: float = 100.0,
+        sample_size: int = 1000
+    ) -> None:
+        self.slow_query_ms: float = slow_query_ms
+        self._sample_size: int = sample_size
+        self._statements: dict[str, StatementStats] = {}
+        self._plans: dict[str, list[str]] = {}
+        self._lock: threading.Lock = threading.Lock()
+    
+    def configure(self, slow_query_ms: float) -> None:
+        self.slow_query_ms = slow_query_ms
+    
+    def is_slow(self, duration: float) -> bool:
+        return duration * 1000 >= self.slow_query_ms
+    
+    def record(self, name: str, sql: str, duration: float) -> None:
+        with self._lock:
+            stats = self._statements.get(name)
+            
+            if stats is None:
+                stats = StatementStats(name, sql, self._sample_size)
+                self._statements[name] = stats
+                
+            stats.add(duration)
+    
+    def get_plan(self, name: str) -> Optional[list[str]]:
+        return self._plans.get(name)
+    
+    def set_plan(self, name: str, plan: list[str]) -> None:
+        self._plans[name] = plan
+    
+    def log_slow(self, name: str, sql: str, duration: float) -> None:
+        plan = self._plans.get(name) or ["<empty>"]
+        
+        logger.warning(
+            f"Slow query {name}: {duration * 1000:.2f}ms\n"
+            f"  SQL: {format_sql(sql)}\n"
+            f"  Plan:\n" + "\n".join(f"    {line}" for line in plan)
+        )
+    
+    def percentile(self, fraction: float) -> float:
+        with self._lock:
+            values = sorted(
+                duration
+                for stats in self._statements.values()
+                for duration in stats.recent
+            )
+            
+        if not values:
+            return 0.0
+        
+        return values[min(len(values) - 1, int(len(values) * fraction))]
+    
+    def snapshot(self) -> list[dict]:
+        with self._lock:
+            statements = list(self._statements.values())
+            
+        return sorted(
+            (stats.as_dict() for stats in statements),
+            key=lambda item: item['total_ms'],
+            reverse=True
+        )
+    
+    def reset(self) -> None:
+        with self._lock:
+            self._statements.clear()
+            self._plans.clear()
+
+query_stats: QueryStats = QueryStats()
\ No newline at end of file
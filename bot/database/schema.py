@@ -51,9 +51,141 @@ CREATE TABLE IF NOT EXISTS answers (
 )
 """
 
-CREATE_USERS_TELEGRAM_ID_INDEX = """
-CREATE INDEX IF NOT EXISTS idx_users_telegram_id 
-ON users(telegram_id)
+CREATE_QUIZ_STATS_TABLE = """
+CREATE TABLE IF NOT EXISTS quiz_stats (
+    quiz_id INTEGER PRIMARY KEY,
+    starts INTEGER NOT NULL DEFAULT 0,
+    FOREIGN KEY (quiz_id) REFERENCES quizzes(id) ON DELETE CASCADE
+)
+"""
+
+CREATE_ATTEMPTS_TABLE = """
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    telegram_id INTEGER NOT NULL,
+    quiz_id INTEGER NOT NULL,
+    correct_answers INTEGER NOT NULL,
+    total_questions INTEGER NOT NULL,
+    percentage REAL NOT NULL,
+    duration_seconds REAL NOT NULL,
+    finished_at TIMESTAMP NOT NULL,
+    FOREIGN KEY (quiz_id) REFERENCES quizzes(id) ON DELETE CASCADE
+)
+"""
+
+CREATE_QUIZ_LEADERBOARD_TABLE = """
+CREATE TABLE IF NOT EXISTS quiz_leaderboard (
+    quiz_id INTEGER NOT NULL,
+    telegram_id INTEGER NOT NULL,
+    best_correct INTEGER NOT NULL,
+    best_percentage REAL NOT NULL,
+    best_duration REAL NOT NULL,
+    attempts INTEGER NOT NULL,
+    PRIMARY KEY (quiz_id, telegram_id),
+    FOREIGN KEY (quiz_id) REFERENCES quizzes(id) ON DELETE CASCADE
+) WITHOUT ROWID
+"""
+
+CREATE_USER_SCORES_TABLE = """
+CREATE TABLE IF NOT EXISTS user_scores (
+    telegram_id INTEGER PRIMARY KEY,
+    points INTEGER NOT NULL,
+    quizzes INTEGER NOT NULL
+)
+"""
+
+CREATE_QUIZ_IMPORTS_TABLE = """
+CREATE TABLE IF NOT EXISTS quiz_imports (
+    source_key TEXT PRIMARY KEY,
+    quiz_id INTEGER NOT NULL,
+    FOREIGN KEY (quiz_id) REFERENCES quizzes(id) ON DELETE CASCADE
+) WITHOUT ROWID
+"""
+
+CREATE_ANSWER_EVENTS_TABLE = """
+CREATE TABLE IF NOT EXISTS answer_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    quiz_id INTEGER NOT NULL,
+    question_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    is_correct BOOLEAN NOT NULL,
+    latency_seconds REAL NOT NULL,
+    answered_at TIMESTAMP NOT NULL
+)
+"""
+
+CREATE_ANSWER_DISTRIBUTION_TABLE = """
+CREATE TABLE IF NOT EXISTS answer_distribution (
+    question_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    answers INTEGER NOT NULL,
+    latency_sum REAL NOT NULL,
+    PRIMARY KEY (question_id, position),
+    FOREIGN KEY (question_id) REFERENCES questions(id) ON DELETE CASCADE
+) WITHOUT ROWID
+"""
+
+CREATE_ROLLUP_STATE_TABLE = """
+CREATE TABLE IF NOT EXISTS rollup_state (
+    name TEXT PRIMARY KEY,
+    last_event_id INTEGER NOT NULL
+)
+"""
+
+FILL_QUIZ_LEADERBOARD = """
+INSERT OR REPLACE INTO quiz_leaderboard (
+    quiz_id, telegram_id, best_correct, best_percentage, best_duration,
+    attempts
+)
+SELECT quiz_id, telegram_id, correct_answers, percentage, duration_seconds,
+       attempts
+FROM (
+    SELECT quiz_id, telegram_id, correct_answers, percentage,
+           duration_seconds,
+           COUNT(*) OVER player AS attempts,
+           ROW_NUMBER() OVER (
+               player ORDER BY percentage DESC, duration_seconds
+           ) AS place
+    FROM attempts
+    WINDOW player AS (PARTITION BY quiz_id, telegram_id)
+)
+WHERE place = 1
+"""
+
+FILL_USER_SCORES = """
+INSERT OR REPLACE INTO user_scores (telegram_id, points, quizzes)
+SELECT telegram_id, SUM(best_correct), COUNT(*)
+FROM quiz_leaderboard
+GROUP BY telegram_id
+"""
+
+CREATE_QUIZ_SEARCH_TABLE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS quiz_search USING fts5(
+    title,
+    questions,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+)
+"""
+
+CONFIGURE_QUIZ_SEARCH_RANK = """
+INSERT INTO quiz_search (quiz_search, rank)
+VALUES ('rank', 'bm25(10.0, 1.0)')
+"""
+
+CLEAR_QUIZ_SEARCH = """
+DELETE FROM quiz_search
+"""
+
+FILL_QUIZ_SEARCH = """
+INSERT INTO quiz_search (rowid, title, questions)
+SELECT q.id, q.title, coalesce(t.questions, '')
+FROM quizzes q
+LEFT JOIN (
+    SELECT quiz_id, group_concat(text, ' ') AS questions
+    FROM (SELECT quiz_id, text FROM questions ORDER BY quiz_id, position)
+    GROUP BY quiz_id
+) t ON t.quiz_id = q.id
 """
 
 CREATE_QUIZZES_CREATOR_ID_INDEX = """
@@ -61,21 +193,71 @@ CREATE INDEX IF NOT EXISTS idx_quizzes_creator_id
 ON quizzes(creator_id)
 """
 
-CREATE_QUESTIONS_QUIZ_ID_INDEX = """
-CREATE INDEX IF NOT EXISTS idx_questions_quiz_id 
-ON questions(quiz_id)
+CREATE_QUIZZES_CREATED_AT_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_quizzes_created_at 
+ON quizzes(created_at, title, creator_id)
 """
 
-CREATE_ANSWERS_QUESTION_ID_INDEX = """
-CREATE INDEX IF NOT EXISTS idx_answers_question_id 
-ON answers(question_id)
+CREATE_QUESTIONS_QUIZ_POSITION_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_questions_quiz_position 
+ON questions(quiz_id, position)
 """
 
+CREATE_ANSWERS_QUESTION_POSITION_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_answers_question_position 
+ON answers(question_id, position)
+"""
+
+CREATE_QUIZ_STATS_STARTS_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_quiz_stats_starts 
+ON quiz_stats(starts DESC)
+"""
+
+CREATE_ATTEMPTS_TELEGRAM_ID_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_attempts_telegram_id 
+ON attempts(telegram_id)
+"""
+
+CREATE_ATTEMPTS_QUIZ_ID_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_attempts_quiz_id 
+ON attempts(quiz_id)
+"""
+
+CREATE_QUIZ_LEADERBOARD_RANK_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_quiz_leaderboard_rank 
+ON quiz_leaderboard(quiz_id, best_percentage DESC, best_duration)
+"""
+
+CREATE_QUIZ_LEADERBOARD_TELEGRAM_ID_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_quiz_leaderboard_telegram_id 
+ON quiz_leaderboard(telegram_id)
+"""
+
+CREATE_USER_SCORES_POINTS_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_user_scores_points 
+ON user_scores(points DESC)
+"""
+
+REDUNDANT_INDEXES = (
+    "idx_users_telegram_id",
+    "idx_questions_quiz_id",
+    "idx_answers_question_id"
+)
+
+SCHEMA_VERSION = 8
+
 async def init_db(db_path: str) -> None:
     import logging
     logger = logging.getLogger(__name__)
     
     async with aiosqlite.connect(db_path) as db:
+        async with db.execute("PRAGMA user_version") as cursor:
+            (version,) = await cursor.fetchone()
+            
+        if version >= SCHEMA_VERSION:
+            logger.info(f"Database schema is up to date (version {version})")
+            return
+        
         await db.execute("PRAGMA foreign_keys = ON")
         
         logger.info("Creating users table...")
@@ -90,11 +272,52 @@ async def init_db(db_path: str) -> None:
         logger.info("Creating answers table...")
         await db.execute(CREATE_ANSWERS_TABLE)
         
+        logger.info("Creating quiz_stats table...")
+        await db.execute(CREATE_QUIZ_STATS_TABLE)
+        
+        logger.info("Creating attempts table...")
+        await db.execute(CREATE_ATTEMPTS_TABLE)
+        
+        logger.info("Creating quiz_imports table...")
+        await db.execute(CREATE_QUIZ_IMPORTS_TABLE)
+        
+        logger.info("Creating answer analytics tables...")
+        await db.execute(CREATE_ANSWER_EVENTS_TABLE)
+        await db.execute(CREATE_ANSWER_DISTRIBUTION_TABLE)
+        await db.execute(CREATE_ROLLUP_STATE_TABLE)
+        
+        logger.info("Building leaderboards...")
+        await db.execute(CREATE_QUIZ_LEADERBOARD_TABLE)
+        await db.execute(CREATE_USER_SCORES_TABLE)
+        await db.execute(FILL_QUIZ_LEADERBOARD)
+        await db.execute(FILL_USER_SCORES)
+        
+        logger.info("Building quiz search index...")
+        await db.execute(CREATE_QUIZ_SEARCH_TABLE)
+        await db.execute(CONFIGURE_QUIZ_SEARCH_RANK)
+        await db.execute(CLEAR_QUIZ_SEARCH)
+        await db.execute(FILL_QUIZ_SEARCH)
+        
         logger.info("Creating indexes...")
-        await db.execute(CREATE_USERS_TELEGRAM_ID_INDEX)
         await db.execute(CREATE_QUIZZES_CREATOR_ID_INDEX)
-        await db.execute(CREATE_QUESTIONS_QUIZ_ID_INDEX)
-        await db.execute(CREATE_ANSWERS_QUESTION_ID_INDEX)
+        await db.execute(CREATE_QUIZZES_CREATED_AT_INDEX)
+        await db.execute(CREATE_QUESTIONS_QUIZ_POSITION_INDEX)
+        await db.execute(CREATE_ANSWERS_QUESTION_POSITION_INDEX)
+        await db.execute(CREATE_QUIZ_STATS_STARTS_INDEX)
+        await db.execute(CREATE_ATTEMPTS_TELEGRAM_ID_INDEX)
+        await db.execute(CREATE_ATTEMPTS_QUIZ_ID_INDEX)
+        await db.execute(CREATE_QUIZ_LEADERBOARD_RANK_INDEX)
+        await db.execute(CREATE_QUIZ_LEADERBOARD_TELEGRAM_ID_INDEX)
+        await db.execute(CREATE_USER_SCORES_POINTS_INDEX)
+        
+        for index in REDUNDANT_INDEXES:
+            await db.execute(f"DROP INDEX IF EXISTS {index}")
+            
+        await db.execute("ANALYZE")
         
+        await db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         await db.commit()
-        logger.info("Database schema initialized successfully")
\ No newline at end of file
+        logger.info(
+            f"Database schema initialized successfully "
+            f"(version {SCHEMA_VERSION})"
+        )
\ No newline at end of file
@@ -1,15 +1,45 @@
+from bot.handlers.admin_handler import (
+    register_admin_handlers,
+    admin_router
+)
+from bot.handlers.analytics_handler import (
+    register_analytics_handlers,
+    analytics_router
+)
 from bot.handlers.create_handler import (
     register_create_handlers,
     create_router
 )
+from bot.handlers.export_handler import (
+    register_export_handlers,
+    export_router
+)
+from bot.handlers.inline_handler import (
+    register_inline_handlers,
+    inline_router
+)
+from bot.handlers.results_handler import (
+    register_results_handlers,
+    results_router
+)
 from bot.handlers.start_handler import (
     register_start_handlers,
     start_router
 )
 
 __all__ = [
+    "register_admin_handlers",
+    "admin_router",
     "register_start_handlers",
     "start_router",
     "register_create_handlers",
-    "create_router"
+    "create_router",
+    "register_inline_handlers",
+    "inline_router",
+    "register_results_handlers",
+    "results_router",
+    "register_analytics_handlers",
+    "analytics_router",
+    "register_export_handlers",
+    "export_router"
 ]
\ No newline at end of file
@@ -0,0 +1,184 @@
+import asyncio
+import time
+
+from aiogram import F, Router
+from aiogram.filters import Command, CommandObject
+from aiogram.types import Message
+
+from bot.database.query_stats import query_stats
+from bot.logger import get_logger
+from bot.monitoring.loop_monitor import LoopLagMonitor
+from bot.monitoring.memory import MemoryProfiler
+from bot.monitoring.profiler import (
+    MAX_PROFILE_SECONDS,
+    ProfileResult,
+    UpdateProfiler
+)
+
+logger = get_logger(__name__)
+
+admin_router = Router(name="admin")
+
+_background_tasks: set[asyncio.Task] = set()
+
+DBSTATS_LIMIT = 15
+LAG_REPORTS_LIMIT = 3
+LAG_STACK_LINES = 12
+
+async def cmd_dbstats(message: Message, command: CommandObject) -> None:
+    if command.args and command.args.strip() == "reset":
+        query_stats.reset()
+        logger.info(f"Query stats reset by telegram_id={message.from_user.id}")
+        await message.answer("🧹 Статистика SQL-запросов сброшена.")
+        return
+    
+    statements = query_stats.snapshot()
+    
+    if not statements:
+        await message.answer("📭 Запросов к базе данных пока не было.")
+        return
+    
+    lines = [
+        f"🗄 SQL-запросы по суммарному времени "
+        f"(порог медленных: {query_stats.slow_query_ms:g} мс):\n"
+    ]
+    
+    for item in statements[:DBSTATS_LIMIT]:
+        lines.append(
+            f"{item['name']}\n"
+            f"   {item['count']} шт., всего {item['total_ms']:.1f} мс, "
+            f"среднее {item['mean_ms']:.2f} мс, "
+            f"p95 {item['p95_ms']:.2f} мс, "
+            f"макс. {item['max_ms']:.2f} мс"
+        )
+        
+    if len(statements) > DBSTATS_LIMIT:
+        lines.append(f"\n… и ещё {len(statements) - DBSTATS_LIMIT}")
+        
+    lines.append("\n/dbstats reset — сбросить статистику")
+    
+    await message.answer("\n".join(lines))
+
+async def cmd_lag(message: Message, loop_monitor: LoopLagMonitor) -> None:
+    stats = loop_monitor.snapshot()
+    
+    lines = [
+        "⏱ Задержка цикла событий:\n",
+        f"Последняя: {stats['last_lag_ms']:.1f} мс",
+        f"Максимальная: {stats['max_lag_ms']:.1f} мс",
+        f"Блокировок дольше {stats['threshold_ms']:g} мс: {stats['blocks']}"
+    ]
+    
+    if not loop_monitor.running:
+        lines.append("\n⚠️ Монитор задержки не запущен.")
+        
+    for report in list(loop_monitor.reports)[-LAG_REPORTS_LIMIT:]:
+        stack = "".join(report.stack).rstrip().splitlines()
+        blocked_at = time.strftime("%H:%M:%S", time.localtime(report.timestamp))
+        lines.append(
+            f"\n🧱 {blocked_at}, {report.lag * 1000:.1f} мс:\n"
+            + "\n".join(stack[-LAG_STACK_LINES:])
+        )
+        
+    await message.answer("\n".join(lines)[:4096])
+
+async def cmd_profile(
+    message: Message,
+    command: CommandObject,
+    profiler: UpdateProfiler
+) -> None:
+    seconds = None
+    
+    if command.args:
+        try:
+            seconds = float(command.args.strip())
+        except ValueError:
+            await message.answer(
+                "❌ Укажите длительность в секундах, например: /profile 30"
+            )
+            return
+        
+        if seconds <= 0 or seconds > MAX_PROFILE_SECONDS:
+            await message.answer(
+                f"❌ Длительность должна быть от 0 до "
+                f"{MAX_PROFILE_SECONDS:g} секунд."
+            )
+            return
+        
+    if profiler.running:
+        await message.answer("⏳ Профилирование уже выполняется.")
+        return
+    
+    profile_task = profiler.start(seconds)
+    
+    logger.info(
+        f"Profiling requested by telegram_id={message.from_user.id}"
+    )
+    await message.answer("🔬 Профилирование запущено, результат придет позже.")
+    
+    reply_task = asyncio.create_task(_reply_with_profile(message, profile_task))
+    _background_tasks.add(reply_task)
+    reply_task.add_done_callback(_background_tasks.discard)
+
+async def _reply_with_profile(
+    message: Message,
+    profile_task: asyncio.Task
+) -> None:
+    try:
+        result: ProfileResult = await profile_task
+    except Exception as e:
+        logger.error(f"Profiling failed: {e}", exc_info=True)
+        await message.answer("❌ Не удалось выполнить профилирование.")
+        return
+    
+    await message.answer(
+        f"🔬 Топ функций по суммарному времени:\n\n{result.format()}"[:4096]
+    )
+
+async def cmd_mem(
+    message: Message,
+    command: CommandObject,
+    memory_profiler: MemoryProfiler
+) -> None:
+    action = (command.args or "").strip()
+    
+    if action == "start":
+        if memory_profiler.tracing:
+            await message.answer("⏳ Трассировка памяти уже запущена.")
+            return
+        
+        memory_profiler.start_tracing()
+        await memory_profiler.snapshot_diff()
+        
+        logger.info(
+            f"tracemalloc enabled by telegram_id={message.from_user.id}"
+        )
+        await message.answer(
+            "🔍 Трассировка памяти запущена, базовый снимок сохранён.\n"
+            "/mem — рост выделений с прошлого снимка\n"
+            "/mem stop — остановить трассировку"
+        )
+        return
+    
+    if action == "stop":
+        memory_profiler.stop_tracing()
+        await message.answer("🛑 Трассировка памяти остановлена.")
+        return
+    
+    if action:
+        await message.answer("❌ Использование: /mem [start|stop]")
+        return
+    
+    report = await memory_profiler.report()
+    
+    if not memory_profiler.tracing:
+        report += "\n\n/mem start — включить tracemalloc"
+        
+    await message.answer(f"🧠 {report}"[:4096])
+
+def register_admin_handlers(router: Router, admin_ids: list[int]) -> None:
+    router.message.filter(F.from_user.id.in_(set(admin_ids)))
+    router.message.register(cmd_dbstats, Command("dbstats"))
+    router.message.register(cmd_lag, Command("lag"))
+    router.message.register(cmd_profile, Command("profile"))
+    router.message.register(cmd_mem, Command("mem"))
\ No newline at end of file
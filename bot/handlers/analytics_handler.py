@@ -0,0 +1,109 @@
+from aiogram import Router
+from aiogram.filters import Command, CommandObject
+from aiogram.types import Message
+
+from bot.logger import get_logger
+from bot.services.analytics_service import AnalyticsService
+from bot.services.quiz_service import QuizService
+from bot.services.user_service import UserService
+
+logger = get_logger(__name__)
+
+analytics_router = Router(name="analytics")
+
+MESSAGE_LIMIT = 4000
+QUESTION_PREVIEW_LENGTH = 60
+HARD_QUESTION_RATE = 50
+
+def format_question_analytics(question: dict) -> str:
+    text = question['text']
+    if len(text) > QUESTION_PREVIEW_LENGTH:
+        text = text[:QUESTION_PREVIEW_LENGTH - 1] + "…"
+        
+    if not question['answers']:
+        return f"{question['position']}. {text}\n   Ответов пока нет"
+    
+    correct_rate = round(question['correct'] / question['answers'] * 100)
+    average_latency = question['latency_sum'] / question['answers']
+    marker = "⚠️ " if correct_rate < HARD_QUESTION_RATE else ""
+    
+    distribution = " · ".join(
+        f"{position}) "
+        f"{round(count / question['answers'] * 100)}%"
+        f"{' ✅' if position == question['correct_answer'] else ''}"
+        for position, count in sorted(question['distribution'].items())
+    )
+    
+    return (
+        f"{marker}{question['position']}. {text}\n"
+        f"   ✅ {correct_rate}% верных из {question['answers']}, "
+        f"⏱ {average_latency:.1f} с\n"
+        f"   {distribution}"
+    )
+
+async def cmd_analytics(
+    message: Message,
+    command: CommandObject,
+    user_service: UserService,
+    quiz_service: QuizService,
+    analytics_service: AnalyticsService
+) -> None:
+    if message.from_user is None:
+        await message.answer(
+            "❌ Не удалось определить пользователя. "
+            "Попробуйте позже."
+        )
+        return
+    
+    try:
+        quiz_id = int((command.args or "").strip())
+        
+        if quiz_id <= 0:
+            raise ValueError("Invalid quiz_id")
+    
+    except ValueError:
+        await message.answer(
+            "📈 Укажите ID своего квиза, например: /analytics 12"
+        )
+        return
+    
+    try:
+        quiz = await quiz_service.get_quiz_summary(quiz_id)
+        user = await user_service.get_or_create_user(
+            telegram_id=message.from_user.id,
+            username=message.from_user.username,
+            first_name=message.from_user.first_name
+        )
+        
+        if quiz is None or quiz['creator_id'] != user['id']:
+            await message.answer(
+                "❌ Квиз не найден среди ваших квизов"
+            )
+            return
+        
+        questions = await analytics_service.get_quiz_analytics(quiz_id)
+    except Exception as e:
+        logger.error(
+            f"Failed to load analytics for quiz {quiz_id}: {e}",
+            exc_info=True
+        )
+        await message.answer(
+            "❌ Произошла техническая ошибка. Попробуйте позже."
+        )
+        return
+    
+    text = f"📈 Статистика ответов: «{quiz['title']}»"
+    
+    for question in questions:
+        block = format_question_analytics(question)
+        
+        if len(text) + len(block) + 2 > MESSAGE_LIMIT:
+            text += "\n\n…"
+            break
+        
+        text += f"\n\n{block}"
+        
+    await message.answer(text)
+
+def register_analytics_handlers(router: Router) -> None:
+    router.message.register(cmd_analytics, Command("analytics"))
\ No newline at end of file
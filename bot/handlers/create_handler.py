@@ -325,7 +325,8 @@ async def handle_correct_answer_input(
                 f"🎉 Квиз успешно создан!\n\n"
                 f"📝 Название: {quiz_title}\n"
                 f"📊 Вопросов: {len(questions)}\n"
-                f"🆔 ID квиза: {quiz_id}\n\n"
+                f"🆔 ID квиза: {quiz_id}\n"
+                f"📈 Статистика ответов: /analytics {quiz_id}\n\n"
                 "Теперь другие пользователи могут пройти ваш квиз!",
                 reply_markup=get_main_menu()
             )
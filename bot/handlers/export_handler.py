@@ -0,0 +1,70 @@
+import os
+
+from aiogram import Router
+from aiogram.filters import Command, CommandObject
+from aiogram.types import FSInputFile, Message
+
+from bot.logger import get_logger
+from bot.services.export_service import EXPORT_KINDS, ExportService
+
+logger = get_logger(__name__)
+
+export_router = Router(name="export")
+
+EXPORT_FORMAT = "csv"
+EXPORT_CAPTIONS = {
+    'quizzes': "📦 Ваши квизы",
+    'results': "📦 Результаты прохождения ваших квизов"
+}
+
+async def cmd_export(
+    message: Message,
+    command: CommandObject,
+    export_service: ExportService
+) -> None:
+    if message.from_user is None:
+        await message.answer(
+            "❌ Не удалось определить пользователя. "
+            "Попробуйте позже."
+        )
+        return
+    
+    kind = (command.args or "quizzes").strip().lower()
+    
+    if kind not in EXPORT_KINDS:
+        await message.answer(
+            "📦 Экспорт данных:\n\n"
+            "/export - ваши квизы с вопросами и ответами\n"
+            "/export results - результаты прохождения ваших квизов"
+        )
+        return
+    
+    await message.answer("⏳ Готовлю файл, это может занять немного времени...")
+    
+    try:
+        path, count = await export_service.export_to_file(
+            kind,
+            EXPORT_FORMAT,
+            creator=message.from_user.id
+        )
+    except Exception as e:
+        logger.error(f"Export of {kind} failed: {e}", exc_info=True)
+        await message.answer(
+            "❌ Произошла техническая ошибка. Попробуйте позже."
+        )
+        return
+    
+    try:
+        if count == 0:
+            await message.answer("📭 Нет данных для экспорта.")
+            return
+        
+        await message.answer_document(
+            FSInputFile(path, filename=f"{kind}.{EXPORT_FORMAT}"),
+            caption=f"{EXPORT_CAPTIONS[kind]}: {count}"
+        )
+    finally:
+        os.remove(path)
+
+def register_export_handlers(router: Router) -> None:
+    router.message.register(cmd_export, Command("export"))
\ No newline at end of file
@@ -0,0 +1,64 @@
+from aiogram import Bot, Router
+from aiogram.types import (
+    InlineQuery,
+    InlineQueryResultArticle,
+    InputTextMessageContent
+)
+from aiogram.utils.deep_linking import create_start_link
+
+from bot.keyboards.quiz_list import get_quiz_share_keyboard
+from bot.logger import get_logger
+from bot.services.inline_search_service import InlineSearchService
+
+logger = get_logger(__name__)
+
+inline_router = Router(name="inline")
+
+DEEP_LINK_PREFIX = "quiz_"
+
+async def inline_quiz_search(
+    inline_query: InlineQuery,
+    bot: Bot,
+    inline_search_service: InlineSearchService
+) -> None:
+    try:
+        quizzes = await inline_search_service.search(
+            inline_query.from_user.id,
+            inline_query.id,
+            inline_query.query
+        )
+    except Exception as e:
+        logger.error(f"Inline search failed: {e}", exc_info=True)
+        return
+    
+    if quizzes is None:
+        return
+    
+    results = []
+    
+    for quiz in quizzes:
+        start_link = await create_start_link(
+            bot,
+            f"{DEEP_LINK_PREFIX}{quiz['id']}"
+        )
+        results.append(InlineQueryResultArticle(
+            id=str(quiz['id']),
+            title=quiz['title'],
+            description="Отправить квиз в чат",
+            input_message_content=InputTextMessageContent(
+                message_text=(
+                    f"📝 Квиз «{quiz['title']}»\n\n"
+                    f"Нажмите кнопку ниже, чтобы пройти его в боте."
+                )
+            ),
+            reply_markup=get_quiz_share_keyboard(start_link)
+        ))
+        
+    await inline_query.answer(
+        results,
+        cache_time=inline_search_service.cache_time,
+        is_personal=False
+    )
+
+def register_inline_handlers(router: Router) -> None:
+    router.inline_query.register(inline_quiz_search)
\ No newline at end of file
@@ -1,7 +1,9 @@
+import time
 from typing import Dict, Any
 
 from aiogram import Router, F
-from aiogram.types import CallbackQuery
+from aiogram.filters import Command, CommandObject
+from aiogram.types import CallbackQuery, Message
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 from bot.keyboards.main_menu import get_main_menu
@@ -10,7 +12,12 @@ from bot.keyboards.quiz_list import (
     get_quiz_list_keyboard,
     get_quiz_list_keyboard_paginated
 )
+from bot.keyboards.results_keyboard import get_finish_keyboard
 from bot.logger import get_logger
+from bot.monitoring.memory import approx_size
+from bot.monitoring.metrics import QUIZ_FINISHES, QUIZ_STARTS
+from bot.services.analytics_service import AnalyticsService
+from bot.services.attempt_service import AttemptService
 from bot.services.quiz_service import QuizService
 
 logger = get_logger(__name__)
@@ -19,6 +26,14 @@ quiz_router = Router(name="quiz")
 
 _user_progress: Dict[str, Dict[str, Any]] = {}
 
+SEARCH_RESULTS_LIMIT = 10
+
+def get_active_sessions_count() -> int:
+    return len(_user_progress)
+
+def get_sessions_approx_size() -> int:
+    return approx_size(_user_progress)
+
 async def callback_take_quiz(
     callback: CallbackQuery,
     quiz_service: QuizService
@@ -97,7 +112,7 @@ async def callback_start_quiz(
         return
     
     try:
-        quiz = await quiz_service.get_quiz_with_questions(quiz_id)
+        quiz = await quiz_service.get_quiz_summary(quiz_id)
         
         if quiz is None:
             logger.warning(f"Quiz not found: id={quiz_id}")
@@ -107,7 +122,9 @@ async def callback_start_quiz(
             )
             return
         
-        if not quiz.get('questions'):
+        first_question = await quiz_service.get_question(quiz_id, 1)
+        
+        if quiz['question_count'] == 0 or first_question is None:
             logger.warning(f"Quiz has no questions: id={quiz_id}")
             await callback.answer(
                 "❌ В квизе нет вопросов",
@@ -119,22 +136,23 @@ async def callback_start_quiz(
         _user_progress[progress_key] = {
             'quiz_id': quiz_id,
             'quiz_title': quiz['title'],
-            'questions': quiz['questions'],
-            'current_index': 0,
-            'answers': {}
+            'question_count': quiz['question_count'],
+            'position': 1,
+            'answers': {},
+            'started_at': time.monotonic(),
+            'shown_at': time.monotonic()
         }
         
         logger.info(
             f"Quiz started: id={quiz_id}, "
-            f"questions={len(quiz['questions'])}"
+            f"questions={quiz['question_count']}"
         )
-        
-        first_question = quiz['questions'][0]
-        total_questions = len(quiz['questions'])
+        QUIZ_STARTS.inc()
+        quiz_service.record_start(quiz_id)
         
         question_text = (
             f"📝 {quiz['title']}\n\n"
-            f"Вопрос 1 из {total_questions}\n\n"
+            f"Вопрос 1 из {quiz['question_count']}\n\n"
             f"{first_question['text']}"
         )
         
@@ -161,7 +179,8 @@ async def callback_start_quiz(
 
 async def callback_answer_question(
     callback: CallbackQuery,
-    quiz_service: QuizService
+    quiz_service: QuizService,
+    analytics_service: AnalyticsService
 ) -> None:
     if callback.message is None or callback.from_user is None:
         await callback.answer(
@@ -209,17 +228,46 @@ async def callback_answer_question(
     
     progress['answers'][question_id] = answer_pos
     
-    current_index = progress['current_index']
-    questions = progress['questions']
-    total_questions = len(questions)
+    quiz_id = progress['quiz_id']
+    position = progress['position']
+    total_questions = progress['question_count']
+    
+    try:
+        question = await quiz_service.get_question(quiz_id, position)
+        
+        if question is not None and question['id'] == question_id:
+            analytics_service.record(
+                quiz_id=quiz_id,
+                question_id=question_id,
+                position=answer_pos,
+                is_correct=answer_pos == question['correct_answer'],
+                latency_seconds=time.monotonic() - progress['shown_at']
+            )
     
-    next_index = current_index + 1
+        next_position = position + 1
+        next_question = None
+    
+        if next_position <= total_questions:
+            next_question = await quiz_service.get_question(
+                quiz_id,
+                next_position
+            )
+    except Exception as e:
+        logger.error(
+            f"Failed to load question {position + 1} of quiz {quiz_id}: {e}",
+            exc_info=True
+        )
+        await callback.answer(
+            "❌ Произошла техническая ошибка. Попробуйте позже.",
+            show_alert=True
+        )
+        return
     
-    if next_index >= total_questions:
+    if next_question is None:
         finish_keyboard = InlineKeyboardBuilder()
         finish_keyboard.button(
             text="✅ Завершить квиз",
-            callback_data=f"finish_quiz_{progress['quiz_id']}"
+            callback_data=f"finish_quiz_{quiz_id}"
         )
         finish_keyboard.adjust(1)
         
@@ -233,12 +281,12 @@ async def callback_answer_question(
             reply_markup=finish_keyboard.as_markup()
         )
     else:
-        progress['current_index'] = next_index
-        next_question = questions[next_index]
+        progress['position'] = next_position
+        progress['shown_at'] = time.monotonic()
         
         question_text = (
             f"📝 {progress['quiz_title']}\n\n"
-            f"Вопрос {next_index + 1} из {total_questions}\n\n"
+            f"Вопрос {next_position} из {total_questions}\n\n"
             f"{next_question['text']}"
         )
         
@@ -299,25 +347,47 @@ async def callback_back_question(
     progress_key = progress_keys[0]
     progress = _user_progress[progress_key]
     
-    current_index = progress['current_index']
+    position = progress['position']
     
-    if current_index <= 0:
+    if position <= 1:
         await callback.answer(
             "❌ Это первый вопрос",
             show_alert=True
         )
         return
     
-    prev_index = current_index - 1
-    progress['current_index'] = prev_index
+    prev_position = position - 1
+    
+    try:
+        prev_question = await quiz_service.get_question(
+            progress['quiz_id'],
+            prev_position
+        )
+    except Exception as e:
+        logger.error(
+            f"Failed to load question {prev_position} of quiz "
+            f"{progress['quiz_id']}: {e}",
+            exc_info=True
+        )
+        await callback.answer(
+            "❌ Произошла техническая ошибка. Попробуйте позже.",
+            show_alert=True
+        )
+        return
+    
+    if prev_question is None:
+        await callback.answer(
+            "❌ Вопрос не найден. Начните квиз заново.",
+            show_alert=True
+        )
+        return
     
-    questions = progress['questions']
-    total_questions = len(questions)
-    prev_question = questions[prev_index]
+    progress['position'] = prev_position
+    progress['shown_at'] = time.monotonic()
     
     question_text = (
         f"📝 {progress['quiz_title']}\n\n"
-        f"Вопрос {prev_index + 1} из {total_questions}\n\n"
+        f"Вопрос {prev_position} из {progress['question_count']}\n\n"
         f"{prev_question['text']}"
     )
     
@@ -330,7 +400,7 @@ async def callback_back_question(
         reply_markup=get_question_keyboard(
             question_id=prev_question['id'],
             answers=prev_question['answers'],
-            show_back=(prev_index > 0)
+            show_back=(prev_position > 1)
         )
     )
     
@@ -338,7 +408,8 @@ async def callback_back_question(
 
 async def callback_finish_quiz(
     callback: CallbackQuery,
-    quiz_service: QuizService
+    quiz_service: QuizService,
+    attempt_service: AttemptService
 ) -> None:
     if callback.message is None or callback.from_user is None:
         await callback.answer(
@@ -389,6 +460,13 @@ async def callback_finish_quiz(
             f"score={result['correct_answers']}/{result['total_questions']}, "
             f"percentage={result['percentage']}%"
         )
+        QUIZ_FINISHES.inc()
+        attempt_service.record(
+            telegram_id=callback.from_user.id,
+            quiz_id=quiz_id,
+            result=result,
+            duration_seconds=time.monotonic() - progress['started_at']
+        )
         
         result_text = (
             f"🎉 Квиз завершен!\n\n"
@@ -411,7 +489,7 @@ async def callback_finish_quiz(
         
         await callback.message.edit_text(
             text=result_text,
-            reply_markup=get_main_menu()
+            reply_markup=get_finish_keyboard(quiz_id)
         )
         
         await callback.answer()
@@ -488,6 +566,40 @@ async def callback_quiz_page(
             show_alert=True
         )
 
+async def cmd_search(
+    message: Message,
+    command: CommandObject,
+    quiz_service: QuizService
+) -> None:
+    if not command.args or not command.args.strip():
+        await message.answer(
+            "🔎 Укажите, что искать, например: /search python"
+        )
+        return
+    
+    try:
+        quizzes = await quiz_service.search_quizzes(
+            command.args,
+            limit=SEARCH_RESULTS_LIMIT
+        )
+    except Exception as e:
+        logger.error(f"Quiz search failed: {e}", exc_info=True)
+        await message.answer(
+            "❌ Произошла техническая ошибка. Попробуйте позже."
+        )
+        return
+    
+    if not quizzes:
+        await message.answer(
+            "📭 Ничего не найдено. Попробуйте другой запрос."
+        )
+        return
+    
+    await message.answer(
+        f"🔎 Найдено квизов: {len(quizzes)}. Выберите квиз:",
+        reply_markup=get_quiz_list_keyboard(quizzes)
+    )
+
 async def callback_back_to_menu(callback: CallbackQuery) -> None:
     if callback.message is None:
         await callback.answer(
@@ -509,6 +621,7 @@ async def callback_back_to_menu(callback: CallbackQuery) -> None:
     await callback.answer()
 
 def register_quiz_handlers(router: Router) -> None:
+    router.message.register(cmd_search, Command("search"))
     router.callback_query.register(
         callback_take_quiz,
         F.data == "take_quiz"
@@ -0,0 +1,156 @@
+from typing import Optional
+
+from aiogram import F, Router
+from aiogram.types import CallbackQuery
+
+from bot.keyboards.results_keyboard import (
+    get_leaderboard_keyboard,
+    get_results_keyboard
+)
+from bot.logger import get_logger
+from bot.services.attempt_service import AttemptService
+from bot.services.leaderboard_service import (
+    LeaderboardService,
+    format_duration
+)
+
+logger = get_logger(__name__)
+
+results_router = Router(name="results")
+
+RESULTS_PAGE_SIZE = 5
+
+async def callback_my_results(
+    callback: CallbackQuery,
+    attempt_service: AttemptService
+) -> None:
+    if callback.message is None or callback.data is None:
+        await callback.answer(
+            "❌ Ошибка обработки запроса",
+            show_alert=True
+        )
+        return
+    
+    before_id: Optional[int] = None
+    
+    if callback.data != "my_results":
+        try:
+            before_id = int(callback.data.split("_")[2])
+        except (IndexError, ValueError):
+            await callback.answer(
+                "❌ Некорректные данные",
+                show_alert=True
+            )
+            return
+    
+    try:
+        page = await attempt_service.get_user_attempts(
+            callback.from_user.id,
+            before_id=before_id,
+            page_size=RESULTS_PAGE_SIZE
+        )
+    except Exception as e:
+        logger.error(f"Failed to load attempts: {e}", exc_info=True)
+        await callback.answer(
+            "❌ Произошла техническая ошибка. Попробуйте позже.",
+            show_alert=True
+        )
+        return
+    
+    if not page['attempts']:
+        text = (
+            "📭 Вы еще не прошли ни одного квиза.\n\n"
+            "Нажмите «Пройти тест» в главном меню, чтобы начать."
+        )
+    else:
+        lines = ["📊 Ваши результаты:\n"]
+        
+        for attempt in page['attempts']:
+            lines.append(
+                f"📝 {attempt['title']}\n"
+                f"   ✅ {attempt['correct_answers']} из "
+                f"{attempt['total_questions']} "
+                f"({attempt['percentage']}%), "
+                f"⏱ {format_duration(attempt['duration_seconds'])}, "
+                f"{attempt['finished_at'][:16]} UTC"
+            )
+            
+        text = "\n".join(lines)
+        
+    await callback.message.edit_text(
+        text=text,
+        reply_markup=get_results_keyboard(
+            page['next_before_id'],
+            page['is_first']
+        )
+    )
+    
+    await callback.answer()
+
+async def callback_leaderboard(
+    callback: CallbackQuery,
+    attempt_service: AttemptService,
+    leaderboard_service: LeaderboardService
+) -> None:
+    if callback.message is None or callback.data is None:
+        await callback.answer(
+            "❌ Ошибка обработки запроса",
+            show_alert=True
+        )
+        return
+    
+    quiz_id: Optional[int] = None
+    
+    if callback.data != "leaderboard":
+        try:
+            quiz_id = int(callback.data.split("_")[1])
+        except (IndexError, ValueError):
+            await callback.answer(
+                "❌ Некорректный ID квиза",
+                show_alert=True
+            )
+            return
+    
+    try:
+        await attempt_service.flush_pending(quiz_id)
+        
+        if quiz_id is None:
+            text = await leaderboard_service.get_global_leaderboard()
+        else:
+            text = await leaderboard_service.get_quiz_leaderboard(quiz_id)
+    except Exception as e:
+        logger.error(f"Failed to load leaderboard: {e}", exc_info=True)
+        await callback.answer(
+            "❌ Произошла техническая ошибка. Попробуйте позже.",
+            show_alert=True
+        )
+        return
+    
+    if text is None:
+        await callback.answer("❌ Квиз не найден", show_alert=True)
+        return
+    
+    await callback.message.edit_text(
+        text=text,
+        reply_markup=get_leaderboard_keyboard(show_global=quiz_id is not None)
+    )
+    
+    await callback.answer()
+
+def register_results_handlers(router: Router) -> None:
+    router.callback_query.register(
+        callback_my_results,
+        F.data == "my_results"
+    )
+    router.callback_query.register(
+        callback_my_results,
+        F.data.startswith("my_results_")
+    )
+    router.callback_query.register(
+        callback_leaderboard,
+        F.data == "leaderboard"
+    )
+    router.callback_query.register(
+        callback_leaderboard,
+        F.data.startswith("leaderboard_")
+    )
\ No newline at end of file
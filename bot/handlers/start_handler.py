@@ -1,16 +1,28 @@
-from aiogram import Router
-from aiogram.filters import Command
+import time
+from typing import Optional
+
+from aiogram import F, Router
+from aiogram.filters import Command, CommandObject
 from aiogram.types import Message
 
+from bot.handlers.inline_handler import DEEP_LINK_PREFIX
 from bot.keyboards.main_menu import get_main_menu
+from bot.keyboards.quiz_list import get_quiz_start_keyboard
 from bot.logger import get_logger
+from bot.services.quiz_service import QuizService
+from bot.services.stats_service import StatsService
 from bot.services.user_service import UserService
 
 logger = get_logger(__name__)
 
 start_router = Router(name="start")
 
-async def cmd_start(message: Message, user_service: UserService) -> None:
+async def cmd_start(
+    message: Message,
+    command: CommandObject,
+    user_service: UserService,
+    quiz_service: QuizService
+) -> None:
     if message.from_user is None:
         await message.answer(
             "❌ Не удалось определить пользователя. "
@@ -30,6 +42,14 @@ async def cmd_start(message: Message, user_service: UserService) -> None:
             f"telegram_id={message.from_user.id}"
         )
         
+        if command.args and command.args.startswith(DEEP_LINK_PREFIX):
+            await send_shared_quiz(
+                message,
+                quiz_service,
+                command.args[len(DEEP_LINK_PREFIX):]
+            )
+            return
+        
         welcome_text = (
             "👋 Добро пожаловать в Quiz Bot!\n\n"
             "Этот бот позволяет:\n"
@@ -54,12 +74,38 @@ async def cmd_start(message: Message, user_service: UserService) -> None:
             "Пожалуйста, попробуйте позже."
         )
 
+async def send_shared_quiz(
+    message: Message,
+    quiz_service: QuizService,
+    quiz_id_str: str
+) -> None:
+    quiz = None
+    
+    if quiz_id_str.isdigit() and int(quiz_id_str) > 0:
+        quiz = await quiz_service.get_quiz_summary(int(quiz_id_str))
+        
+    if quiz is None or quiz['question_count'] == 0:
+        await message.answer(
+            "❌ Квиз не найден",
+            reply_markup=get_main_menu()
+        )
+        return
+    
+    await message.answer(
+        f"📝 Квиз «{quiz['title']}»\n"
+        f"Вопросов: {quiz['question_count']}",
+        reply_markup=get_quiz_start_keyboard(quiz['id'])
+    )
+
 async def cmd_help(message: Message) -> None:
     help_text = (
         "📚 Доступные команды:\n\n"
         "/start - Запустить бота и показать главное меню\n"
         "/help - Показать это сообщение\n"
         "/create_quiz - Создать новый квиз\n"
+        "/search <запрос> - Найти квиз по названию и вопросам\n"
+        "/analytics <ID> - Статистика ответов по вашему квизу\n"
+        "/export [results] - Выгрузить свои квизы или их результаты\n"
         "/cancel - Отменить текущее действие\n\n"
         "🎯 Как использовать бота:\n\n"
         "1️⃣ Прохождение тестов:\n"
@@ -83,6 +129,68 @@ async def cmd_help(message: Message) -> None:
     
     await message.answer(text=help_text)
 
-def register_start_handlers(router: Router) -> None:
+async def cmd_stats(message: Message, stats_service: StatsService) -> None:
+    stats = stats_service.snapshot()
+    
+    def format_rate(value: Optional[float]) -> str:
+        return f"{value:.1f}/мин" if value is not None else "нет данных"
+    
+    cache_lines = [
+        f"   • {name}: "
+        + (
+            f"{cache['hit_rate']:.1%} попаданий"
+            if cache['hit_rate'] is not None else "нет обращений"
+        )
+        + f", записей: {cache['size']}"
+        for name, cache in stats['caches'].items()
+    ]
+    
+    lag = stats['loop_lag']
+    
+    if lag is None or not lag['running']:
+        lag_line = "⏱ Задержка цикла событий: монитор не запущен\n"
+    else:
+        lag_line = (
+            f"⏱ Задержка цикла событий: {lag['last_lag_ms']:.1f} мс, "
+            f"максимум {lag['max_lag_ms']:.1f} мс\n"
+        )
+        if lag['last_block_at'] is not None:
+            blocked_at = time.strftime(
+                "%H:%M:%S",
+                time.localtime(lag['last_block_at'])
+            )
+            lag_line += (
+                f"   • блокировок: {lag['blocks']}, последняя в "
+                f"{blocked_at} на {lag['last_block_ms']:.1f} мс\n"
+            )
+        else:
+            lag_line += "   • блокировок не было\n"
+            
+    stats_text = (
+        f"📊 Статистика бота\n\n"
+        f"👥 Активные сессии: прохождение {stats['sessions']['quiz']}, "
+        f"создание {stats['sessions']['create']}\n"
+        f"▶️ Начато квизов: {format_rate(stats['starts_per_minute'])}\n"
+        f"🏁 Завершено квизов: {format_rate(stats['finishes_per_minute'])}\n"
+        f"🗃 Кэши:\n" + "\n".join(cache_lines) + "\n"
+        f"🗄 p95 SQL-запросов: {stats['db_p95_ms']:.2f} мс\n"
+        + lag_line +
+        f"📤 Очередь отправки: {stats['outbound_in_flight']}\n"
+        f"💾 Память: {stats['memory_bytes'] / 1024 / 1024:.1f} МБ\n\n"
+        f"🕒 Агрегаты обновлены "
+        f"{time.time() - stats['refreshed_at']:.0f} с назад"
+    )
+    
+    await message.answer(text=stats_text)
+
+def register_start_handlers(
+    router: Router,
+    admin_ids: Optional[list[int]] = None
+) -> None:
     router.message.register(cmd_start, Command("start"))
-    router.message.register(cmd_help, Command("help"))
\ No newline at end of file
+    router.message.register(cmd_help, Command("help"))
+    router.message.register(
+        cmd_stats,
+        Command("stats"),
+        F.from_user.id.in_(set(admin_ids or []))
+    )
\ No newline at end of file
@@ -1,9 +1,23 @@
 from bot.keyboards.main_menu import get_main_menu
 from bot.keyboards.question_keyboard import get_question_keyboard
-from bot.keyboards.quiz_list import get_quiz_list_keyboard
+from bot.keyboards.quiz_list import (
+    get_quiz_list_keyboard,
+    get_quiz_share_keyboard,
+    get_quiz_start_keyboard
+)
+from bot.keyboards.results_keyboard import (
+    get_finish_keyboard,
+    get_leaderboard_keyboard,
+    get_results_keyboard
+)
 
 __all__ = [
+    "get_finish_keyboard",
+    "get_leaderboard_keyboard",
     "get_main_menu",
     "get_quiz_list_keyboard",
+    "get_quiz_share_keyboard",
+    "get_quiz_start_keyboard",
     "get_question_keyboard",
+    "get_results_keyboard",
 ]
\ No newline at end of file
@@ -12,6 +12,14 @@ def get_main_menu() -> InlineKeyboardMarkup:
         text="➕ Создать тест",
         callback_data="create_quiz"
     )
+    builder.button(
+        text="📊 Мои результаты",
+        callback_data="my_results"
+    )
+    builder.button(
+        text="🏆 Рейтинг",
+        callback_data="leaderboard"
+    )
     
     builder.adjust(1)
     
@@ -1,11 +1,21 @@
 from aiogram.types import InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
+from bot.cache import LRUCache
+
+keyboard_cache: LRUCache = LRUCache("question_keyboard", maxsize=1024)
+
 def get_question_keyboard(
     question_id: int,
     answers: list[dict],
     show_back: bool = False
 ) -> InlineKeyboardMarkup:
+    key = (question_id, show_back)
+    markup = keyboard_cache.get(key)
+    
+    if markup is not None:
+        return markup
+    
     builder = InlineKeyboardBuilder()
     
     for answer in answers:
@@ -22,4 +32,7 @@ def get_question_keyboard(
     
     builder.adjust(1)
     
-    return builder.as_markup()
\ No newline at end of file
+    markup = builder.as_markup()
+    keyboard_cache.set(key, markup)
+    
+    return markup
\ No newline at end of file
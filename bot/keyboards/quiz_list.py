@@ -65,4 +65,27 @@ def get_quiz_list_keyboard_paginated(
     
     builder.adjust(1, *([len(nav_buttons)] if nav_buttons else []), 1)
     
+    return builder.as_markup()
+
+def get_quiz_start_keyboard(quiz_id: int) -> InlineKeyboardMarkup:
+    builder = InlineKeyboardBuilder()
+    
+    builder.button(
+        text="▶️ Начать квиз",
+        callback_data=f"quiz_{quiz_id}"
+    )
+    builder.button(
+        text="🔙 Назад в меню",
+        callback_data="back_to_menu"
+    )
+    
+    builder.adjust(1)
+    
+    return builder.as_markup()
+
+def get_quiz_share_keyboard(start_link: str) -> InlineKeyboardMarkup:
+    builder = InlineKeyboardBuilder()
+    
+    builder.button(text="▶️ Пройти квиз", url=start_link)
+    
     return builder.as_markup()
\ No newline at end of file
@@ -0,0 +1,68 @@
+from typing import Optional
+
+from aiogram.types import InlineKeyboardMarkup
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+
+def get_results_keyboard(
+    next_before_id: Optional[int],
+    is_first: bool
+) -> InlineKeyboardMarkup:
+    builder = InlineKeyboardBuilder()
+    nav_buttons = 0
+    
+    if not is_first:
+        builder.button(
+            text="⏮ К последним",
+            callback_data="my_results"
+        )
+        nav_buttons += 1
+        
+    if next_before_id is not None:
+        builder.button(
+            text="Раньше ➡️",
+            callback_data=f"my_results_{next_before_id}"
+        )
+        nav_buttons += 1
+        
+    builder.button(
+        text="🔙 Назад в меню",
+        callback_data="back_to_menu"
+    )
+    
+    builder.adjust(*([nav_buttons] if nav_buttons else []), 1)
+    
+    return builder.as_markup()
+
+def get_finish_keyboard(quiz_id: int) -> InlineKeyboardMarkup:
+    builder = InlineKeyboardBuilder()
+    
+    builder.button(
+        text="🏆 Рейтинг квиза",
+        callback_data=f"leaderboard_{quiz_id}"
+    )
+    builder.button(
+        text="🔙 Назад в меню",
+        callback_data="back_to_menu"
+    )
+    
+    builder.adjust(1)
+    
+    return builder.as_markup()
+
+def get_leaderboard_keyboard(show_global: bool) -> InlineKeyboardMarkup:
+    builder = InlineKeyboardBuilder()
+    
+    if show_global:
+        builder.button(
+            text="🏆 Общий рейтинг",
+            callback_data="leaderboard"
+        )
+        
+    builder.button(
+        text="🔙 Назад в меню",
+        callback_data="back_to_menu"
+    )
+    
+    builder.adjust(1)
+    
+    return builder.as_markup()
\ No newline at end of file
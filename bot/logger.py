@@ -1,27 +1,142 @@
+import atexit
+import json
 import logging
+import queue
 import sys
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler
+)
 from pathlib import Path
+from typing import Optional, TextIO
 
-def setup_logging(log_level: str = "INFO") -> None:
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-    
-    log_file = log_dir / "bot.log"
-    
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper(), logging.INFO),
-        format=(
-            "%(asctime)s - %(name)s - %(levelname)s - "
-            "%(filename)s:%(lineno)d - %(message)s"
-        ),
-        handlers=[
-            logging.FileHandler(log_file, encoding="utf-8"),
-            logging.StreamHandler(sys.stdout)
-        ]
+LOG_FORMAT = (
+    "%(asctime)s - %(name)s - %(levelname)s - "
+    "%(filename)s:%(lineno)d - %(message)s"
+)
+
+class JsonFormatter(logging.Formatter):
+    
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'ts': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        
+        fields = getattr(record, "fields", None)
+        if fields:
+            payload.update(fields)
+            
+        if record.exc_info:
+            payload['exc_info'] = self.formatException(record.exc_info)
+            
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+class DroppingQueueHandler(QueueHandler):
+    
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped: int = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class LogQueueListener(QueueListener):
+    
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+_queue_handler: Optional[DroppingQueueHandler] = None
+_listener: Optional[LogQueueListener] = None
+
+def setup_logging(
+    log_level: str = "INFO",
+    log_format: str = "text",
+    log_dir: str = "logs",
+    log_file: str = "bot.log",
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5,
+    queue_size: int = 10000,
+    stream: Optional[TextIO] = None
+) -> None:
+    global _queue_handler, _listener
+    
+    shutdown_logging()
+    
+    log_path = Path(log_dir)
+    log_path.mkdir(exist_ok=True)
+    
+    if log_format == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(LOG_FORMAT)
+    
+    file_handler = RotatingFileHandler(
+        log_path / log_file,
+        maxBytes=max_bytes,
+        backupCount=backup_count,
+        encoding="utf-8"
+    )
+    stream_handler = logging.StreamHandler(stream or sys.stdout)
+    
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+        
+    _queue_handler = DroppingQueueHandler(queue.Queue(maxsize=queue_size))
+    _listener = LogQueueListener(
+        _queue_handler.queue,
+        file_handler,
+        stream_handler,
+        respect_handler_level=True
     )
+    _listener.start()
+    
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+    
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
     
     logging.getLogger("aiogram").setLevel(logging.WARNING)
     logging.getLogger("aiosqlite").setLevel(logging.WARNING)
 
+def shutdown_logging() -> None:
+    global _queue_handler, _listener
+    
+    if _listener is None:
+        return
+    
+    logging.getLogger().removeHandler(_queue_handler)
+    _listener.stop()
+    
+    for handler in _listener.handlers:
+        handler.close()
+        
+    if _queue_handler.dropped:
+        sys.stderr.write(
+            f"Logging queue overflowed, {_queue_handler.dropped} "
+            f"records were dropped\n"
+        )
+        
+    _queue_handler = None
+    _listener = None
+
+def get_dropped_records() -> int:
+    return _queue_handler.dropped if _queue_handler is not None else 0
+
+atexit.register(shutdown_logging)
+
 def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
\ No newline at end of file
@@ -0,0 +1,137 @@
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+from aiogram import BaseMiddleware
+from aiogram.exceptions import TelegramAPIError
+from aiogram.types import CallbackQuery, InlineQuery, Message, TelegramObject
+
+from bot.logger import get_logger
+
+logger = get_logger(__name__)
+
+BUSY_TEXT = (
+    "⏳ Бот сейчас перегружен. "
+    "Пожалуйста, повторите попытку через несколько секунд."
+)
+
+class ConcurrencyLimiter:
+    
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queued: int,
+        router_limits: Optional[dict[str, int]] = None
+    ) -> None:
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be positive integer")
+        
+        self._global: asyncio.Semaphore = asyncio.Semaphore(max_concurrent)
+        self._routers: dict[str, asyncio.Semaphore] = {
+            name: asyncio.Semaphore(limit)
+            for name, limit in (router_limits or {}).items()
+        }
+        self._max_queued: int = max_queued
+        
+        self.queued: int = 0
+        self.in_flight: int = 0
+        self.shed_total: int = 0
+        self.queued_by_router: dict[str, int] = defaultdict(int)
+        self.in_flight_by_router: dict[str, int] = defaultdict(int)
+        self.shed_by_router: dict[str, int] = defaultdict(int)
+    
+    def is_full(self, router_name: Optional[str] = None) -> bool:
+        if router_name is None:
+            return any(map(self.is_full, list(self.queued_by_router)))
+        
+        if self.queued_by_router[router_name] < self._max_queued:
+            return False
+        
+        router_semaphore = self._routers.get(router_name)
+        
+        return self._global.locked() or (
+            router_semaphore is not None and router_semaphore.locked()
+        )
+    
+    def record_shed(self, router_name: str) -> None:
+        self.shed_total += 1
+        self.shed_by_router[router_name] += 1
+        
+        if self.shed_total == 1 or self.shed_total % 100 == 0:
+            logger.warning(
+                f"Intake queue of router {router_name} full "
+                f"({self.queued_by_router[router_name]} queued), "
+                f"shed {self.shed_total} updates so far"
+            )
+    
+    @asynccontextmanager
+    async def slot(self, router_name: str) -> AsyncIterator[None]:
+        router_semaphore = self._routers.get(router_name)
+        
+        self.queued += 1
+        self.queued_by_router[router_name] += 1
+        
+        try:
+            if router_semaphore is not None:
+                await router_semaphore.acquire()
+            try:
+                await self._global.acquire()
+            except BaseException:
+                if router_semaphore is not None:
+                    router_semaphore.release()
+                raise
+        finally:
+            self.queued -= 1
+            self.queued_by_router[router_name] -= 1
+            
+        self.in_flight += 1
+        self.in_flight_by_router[router_name] += 1
+        
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self.in_flight_by_router[router_name] -= 1
+            self._global.release()
+            if router_semaphore is not None:
+                router_semaphore.release()
+    
+    def snapshot(self) -> dict:
+        return {
+            'queued': self.queued,
+            'in_flight': self.in_flight,
+            'shed_total': self.shed_total,
+            'queued_by_router': dict(self.queued_by_router),
+            'in_flight_by_router': dict(self.in_flight_by_router),
+            'shed_by_router': dict(self.shed_by_router)
+        }
+
+class ConcurrencyMiddleware(BaseMiddleware):
+    
+    def __init__(self, limiter: ConcurrencyLimiter, router_name: str) -> None:
+        self._limiter: ConcurrencyLimiter = limiter
+        self._router_name: str = router_name
+    
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        if self._limiter.is_full(self._router_name):
+            self._limiter.record_shed(self._router_name)
+            await self._reply_busy(event)
+            return None
+        
+        async with self._limiter.slot(self._router_name):
+            return await handler(event, data)
+    
+    async def _reply_busy(self, event: TelegramObject) -> None:
+        try:
+            if isinstance(event, InlineQuery):
+                await event.answer([], cache_time=0, is_personal=True)
+            elif isinstance(event, (CallbackQuery, Message)):
+                await event.answer(BUSY_TEXT)
+        except TelegramAPIError as e:
+            logger.debug(f"Failed to send busy reply: {e}")
\ No newline at end of file
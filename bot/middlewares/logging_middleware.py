@@ -1,8 +1,10 @@
+import logging
+import random
 import time
-from typing import Callable, Dict, Any, Awaitable
+from typing import Callable, Dict, Any, Awaitable, Optional
 
 from aiogram import BaseMiddleware
-from aiogram.types import Update, Message, CallbackQuery
+from aiogram.types import Update
 
 from bot.logger import get_logger
 
@@ -10,70 +12,103 @@ logger = get_logger(__name__)
 
 class LoggingMiddleware(BaseMiddleware):
     
+    def __init__(
+        self,
+        structured: bool = False,
+        sample_rate: float = 0.0,
+        slow_threshold_ms: float = 1000.0
+    ) -> None:
+        self._structured: bool = structured
+        self._sample_rate: float = sample_rate
+        self._slow_threshold_ns: int = int(slow_threshold_ms * 1_000_000)
+    
     async def __call__(
         self,
         handler: Callable[[Update, Dict[str, Any]], Awaitable[Any]],
         event: Update,
         data: Dict[str, Any]
     ) -> Any:
-        start_time = time.time()
-        
-        update_type = self._get_update_type(event)
-        user_id = self._get_user_id(event)
-        
-        logger.debug(
-            f"Processing {update_type} from user {user_id}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Processing {event.event_type} "
+                f"from user {self._get_user_id(data)}"
+            )
+            
+        start_time = time.perf_counter_ns()
         
         try:
             result = await handler(event, data)
+        except Exception as e:
+            self._log(logging.ERROR, event, data, start_time, e)
+            raise
             
-            processing_time = (time.time() - start_time) * 1000
-            
-            logger.info(
-                f"Processed {update_type} from user {user_id} "
-                f"in {processing_time:.2f}ms"
-            )
-            
-            if processing_time > 1000:
-                logger.warning(
-                    f"Slow processing detected: {update_type} "
-                    f"took {processing_time:.2f}ms"
-                )
-            
-            return result
+        elapsed = time.perf_counter_ns() - start_time
+        
+        if elapsed >= self._slow_threshold_ns:
+            self._log(logging.WARNING, event, data, start_time)
+        elif self._sample_rate and random.random() < self._sample_rate:
+            self._log(logging.INFO, event, data, start_time)
             
-        except Exception as e:
-            processing_time = (time.time() - start_time) * 1000
+        return result
+    
+    def _log(
+        self,
+        level: int,
+        event: Update,
+        data: Dict[str, Any],
+        start_time: int,
+        error: Optional[Exception] = None
+    ) -> None:
+        if not logger.isEnabledFor(level):
+            return
+        
+        processing_time = (time.perf_counter_ns() - start_time) / 1_000_000
+        update_type = event.event_type
+        user_id = self._get_user_id(data)
+        
+        if self._structured:
+            fields = {
+                'update_id': event.update_id,
+                'update_type': update_type,
+                'user_id': user_id,
+                'duration_ms': round(processing_time, 2)
+            }
             
+            if error is not None:
+                message = "update_failed"
+                fields['error_type'] = type(error).__name__
+                fields['error'] = str(error)
+            elif level == logging.WARNING:
+                message = "update_slow"
+            else:
+                message = "update"
+                fields['sample_rate'] = self._sample_rate
+                
+            logger.log(
+                level,
+                message,
+                exc_info=error is not None,
+                extra={'fields': fields}
+            )
+            return
+        
+        if error is not None:
             logger.error(
                 f"Error processing {update_type} from user {user_id} "
-                f"after {processing_time:.2f}ms: {e}",
+                f"after {processing_time:.2f}ms: {error}",
                 exc_info=True
             )
-            
-            raise
-    
-    def _get_update_type(self, event: Update) -> str:
-        if event.message:
-            return "message"
-        elif event.callback_query:
-            return "callback_query"
-        elif event.edited_message:
-            return "edited_message"
-        elif event.inline_query:
-            return "inline_query"
+        elif level == logging.WARNING:
+            logger.warning(
+                f"Slow processing detected: {update_type} "
+                f"took {processing_time:.2f}ms"
+            )
         else:
-            return "unknown"
+            logger.info(
+                f"Processed {update_type} from user {user_id} "
+                f"in {processing_time:.2f}ms"
+            )
     
-    def _get_user_id(self, event: Update) -> int:
-        if event.message and event.message.from_user:
-            return event.message.from_user.id
-        elif event.callback_query and event.callback_query.from_user:
-            return event.callback_query.from_user.id
-        elif event.edited_message and event.edited_message.from_user:
-            return event.edited_message.from_user.id
-        elif event.inline_query and event.inline_query.from_user:
-            return event.inline_query.from_user.id
-        else:
-            return 0
\ No newline at end of file
+    def _get_user_id(self, data: Dict[str, Any]) -> int:
+        user = data.get("event_from_user")
+        return user.id if user is not None else 0
\ No newline at end of file
@@ -0,0 +1,36 @@
+import time
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from bot.monitoring.metrics import HANDLER_ERRORS, HANDLER_LATENCY
+
+class MetricsMiddleware(BaseMiddleware):
+    
+    def __init__(self, update_type: str) -> None:
+        self._update_type: str = update_type
+    
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        handler_object = data.get("handler")
+        handler_name = (
+            getattr(handler_object.callback, "__name__", "unknown")
+            if handler_object is not None else "unknown"
+        )
+        
+        start_time = time.perf_counter()
+        
+        try:
+            return await handler(event, data)
+        except Exception:
+            HANDLER_ERRORS.labels(self._update_type, handler_name).inc()
+            raise
+        finally:
+            HANDLER_LATENCY.labels(self._update_type, handler_name).observe(
+                time.perf_counter() - start_time
+            )
\ No newline at end of file
@@ -0,0 +1,8 @@
+from bot.monitoring.metrics import MetricsRegistry, registry
+from bot.monitoring.server import start_monitoring_server
+
+__all__ = [
+    "MetricsRegistry",
+    "registry",
+    "start_monitoring_server",
+]
\ No newline at end of file
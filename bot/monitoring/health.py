@@ -0,0 +1,137 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from aiogram.types import TelegramObject
+from aiohttp import web
+
+from bot.database.connection import DatabaseConnection
+from bot.middlewares.concurrency_middleware import ConcurrencyLimiter
+from bot.monitoring.loop_monitor import LoopLagMonitor
+from bot.monitoring.outbound import outbound_tracker
+
+class HealthChecker:
+    
+    def __init__(
+        self,
+        database_path: str,
+        loop_monitor: LoopLagMonitor,
+        limiter: ConcurrencyLimiter,
+        sessions: dict[str, Callable[[], int]],
+        max_loop_lag_ms: float = 500.0,
+        max_db_latency_ms: float = 500.0,
+        max_outbound_requests: int = 100,
+        db_timeout: float = 2.0
+    ) -> None:
+        self._database_path: str = database_path
+        self._loop_monitor: LoopLagMonitor = loop_monitor
+        self._limiter: ConcurrencyLimiter = limiter
+        self._sessions: dict[str, Callable[[], int]] = sessions
+        self._max_loop_lag_ms: float = max_loop_lag_ms
+        self._max_db_latency_ms: float = max_db_latency_ms
+        self._max_outbound_requests: int = max_outbound_requests
+        self._db_timeout: float = db_timeout
+        self._started_at: float = time.time()
+        
+        self.last_update_at: Optional[float] = None
+    
+    async def track_update(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        try:
+            return await handler(event, data)
+        finally:
+            self.last_update_at = time.time()
+    
+    def routes(self) -> list[web.RouteDef]:
+        return [
+            web.get("/health/live", self.handle_live),
+            web.get("/health/ready", self.handle_ready)
+        ]
+    
+    async def handle_live(self, request: web.Request) -> web.Response:
+        alive, report = self.liveness()
+        return web.json_response(report, status=200 if alive else 503)
+    
+    async def handle_ready(self, request: web.Request) -> web.Response:
+        ready, report = await self.readiness()
+        return web.json_response(report, status=200 if ready else 503)
+    
+    def liveness(self) -> tuple[bool, dict]:
+        lag = self._loop_monitor.snapshot()
+        alive = self._loop_monitor.running
+        
+        return alive, {
+            'status': "ok" if alive else "failing",
+            'uptime_s': round(time.time() - self._started_at, 1),
+            'loop_monitor_running': alive,
+            'event_loop_lag_ms': lag['last_lag_ms']
+        }
+    
+    async def readiness(self) -> tuple[bool, dict]:
+        lag_ms = self._loop_monitor.snapshot()['last_lag_ms']
+        database = await self._check_database()
+        
+        checks = {
+            'event_loop': {
+                'ok': lag_ms < self._max_loop_lag_ms,
+                'lag_ms': lag_ms
+            },
+            'database': database,
+            'intake': {
+                'ok': not self._limiter.is_full(),
+                'queued': self._limiter.queued,
+                'queued_by_router': dict(self._limiter.queued_by_router),
+                'in_flight': self._limiter.in_flight
+            },
+            'outbound': {
+                'ok': outbound_tracker.in_flight < self._max_outbound_requests,
+                'in_flight': outbound_tracker.in_flight,
+                'failed_total': outbound_tracker.failed
+            }
+        }
+        ready = all(check['ok'] for check in checks.values())
+        
+        return ready, {
+            'status': "ok" if ready else "degraded",
+            'checks': checks,
+            'sessions': {
+                name: count() for name, count in self._sessions.items()
+            },
+            'last_update_at': self.last_update_at,
+            'seconds_since_last_update': (
+                round(time.time() - self.last_update_at, 1)
+                if self.last_update_at is not None else None
+            )
+        }
+    
+    async def _check_database(self) -> dict:
+        started = time.perf_counter()
+        
+        try:
+            await asyncio.wait_for(self._ping_database(), self._db_timeout)
+        except Exception as e:
+            return {
+                'ok': False,
+                'error': f"{type(e).__name__}: {e}"
+            }
+            
+        latency_ms = (time.perf_counter() - started) * 1000
+        
+        return {
+            'ok': latency_ms < self._max_db_latency_ms,
+            'latency_ms': round(latency_ms, 2)
+        }
+    
+    async def _ping_database(self) -> None:
+        async with DatabaseConnection(self._database_path) as conn:
+            cursor = await conn.execute(
+                """
+                -- health.ping
+                SELECT 1
+                """
+            )
+            await cursor.fetchone()
\ No newline at end of file
@@ -0,0 +1,147 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Optional
+
+from bot.logger import get_logger
+from bot.monitoring.metrics import LOOP_BLOCKS, LOOP_LAG
+
+logger = get_logger(__name__)
+
+class BlockReport:
+    
+    __slots__ = ("timestamp", "lag", "stack")
+    
+    def __init__(self, timestamp: float, lag: float, stack: list[str]) -> None:
+        self.timestamp: float = timestamp
+        self.lag: float = lag
+        self.stack: list[str] = stack
+
+class LoopLagMonitor:
+    
+    def __init__(
+        self,
+        interval: float = 0.5,
+        threshold_ms: float = 100.0,
+        stack_limit: int = 15,
+        max_reports: int = 20
+    ) -> None:
+        self._interval: float = interval
+        self._threshold: float = threshold_ms / 1000
+        self._stack_limit: int = stack_limit
+        
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped: threading.Event = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat: float = 0.0
+        self._captured_beat: float = 0.0
+        self._captured_stack: Optional[list[str]] = None
+        
+        self.last_lag: float = 0.0
+        self.max_lag: float = 0.0
+        self.blocks: int = 0
+        self.reports: deque[BlockReport] = deque(maxlen=max_reports)
+    
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+    
+    async def start(self) -> None:
+        if self.running:
+            return
+        
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stopped.clear()
+        
+        self._task = asyncio.create_task(self._run())
+        self._watchdog = threading.Thread(
+            target=self._watch,
+            name="loop-lag-watchdog",
+            daemon=True
+        )
+        self._watchdog.start()
+        
+        logger.info(
+            f"Event loop lag monitor started: interval={self._interval}s, "
+            f"threshold={self._threshold * 1000:.0f}ms"
+        )
+    
+    async def stop(self) -> None:
+        self._stopped.set()
+        
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+            
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+    
+    def snapshot(self) -> dict:
+        return {
+            'last_lag_ms': round(self.last_lag * 1000, 2),
+            'max_lag_ms': round(self.max_lag * 1000, 2),
+            'blocks': self.blocks,
+            'threshold_ms': round(self._threshold * 1000, 2)
+        }
+    
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self._interval
+            await asyncio.sleep(self._interval)
+            
+            now = time.perf_counter()
+            lag = max(0.0, now - expected)
+            beat = self._last_beat
+            self._last_beat = now
+            
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            LOOP_LAG.observe(lag)
+            
+            if lag >= self._threshold:
+                stack = (
+                    self._captured_stack
+                    if self._captured_beat == beat else None
+                )
+                self._report(lag, stack)
+    
+    def _watch(self) -> None:
+        check_interval = min(self._threshold, self._interval) / 2
+        
+        while not self._stopped.wait(check_interval):
+            beat = self._last_beat
+            
+            if beat == self._captured_beat:
+                continue
+            
+            if time.perf_counter() - beat < self._interval + self._threshold:
+                continue
+            
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            
+            self._captured_stack = traceback.format_stack(
+                frame,
+                limit=self._stack_limit
+            )
+            self._captured_beat = beat
+    
+    def _report(self, lag: float, stack: Optional[list[str]]) -> None:
+        self.blocks += 1
+        LOOP_BLOCKS.inc()
+        
+        stack = stack or ["<stack was not captured>\n"]
+        self.reports.append(BlockReport(time.time(), lag, stack))
+        
+        logger.warning(
+            f"Event loop blocked for {lag * 1000:.1f}ms, "
+            f"stack of the blocking frame:\n{''.join(stack).rstrip()}"
+        )
\ No newline at end of file
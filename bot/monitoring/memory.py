@@ -0,0 +1,195 @@
+import asyncio
+import sys
+import tracemalloc
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel
+
+from bot.logger import get_logger
+from bot.monitoring.metrics import MEMORY_SUBSYSTEM_BYTES
+
+logger = get_logger(__name__)
+
+IGNORED_TRACES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>")
+)
+
+def approx_size(obj: Any) -> int:
+    seen: set[int] = set()
+    stack = [obj]
+    total = 0
+    
+    while stack:
+        current = stack.pop()
+        
+        if id(current) in seen:
+            continue
+        
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif isinstance(current, BaseModel):
+            stack.append(current.__dict__)
+            
+    return total
+
+class AllocationGrowth:
+    
+    __slots__ = ("location", "size_diff", "size", "count_diff")
+    
+    def __init__(
+        self,
+        location: str,
+        size_diff: int,
+        size: int,
+        count_diff: int
+    ) -> None:
+        self.location: str = location
+        self.size_diff: int = size_diff
+        self.size: int = size
+        self.count_diff: int = count_diff
+    
+    def format(self) -> str:
+        return (
+            f"{self.size_diff / 1024:+.1f} KiB "
+            f"(total {self.size / 1024:.1f} KiB, "
+            f"{self.count_diff:+d} blocks) {self.location}"
+        )
+
+class MemoryProfiler:
+    
+    def __init__(
+        self,
+        report_interval: float = 300.0,
+        frames: int = 1,
+        top: int = 10
+    ) -> None:
+        self._report_interval: float = report_interval
+        self._frames: int = frames
+        self._top: int = top
+        self._reporters: dict[str, Callable[[], int]] = {}
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+    
+    def register(self, name: str, reporter: Callable[[], int]) -> None:
+        self._reporters[name] = reporter
+    
+    def sizes(self) -> dict[str, int]:
+        sizes: dict[str, int] = {}
+        
+        for name, reporter in self._reporters.items():
+            sizes[name] = reporter()
+            MEMORY_SUBSYSTEM_BYTES.labels(name).set(sizes[name])
+            
+        return sizes
+    
+    def start_tracing(self, frames: Optional[int] = None) -> None:
+        if self.tracing:
+            return
+        
+        tracemalloc.start(frames or self._frames)
+        self._previous = None
+        
+        logger.info("tracemalloc started")
+    
+    def stop_tracing(self) -> None:
+        if not self.tracing:
+            return
+        
+        tracemalloc.stop()
+        self._previous = None
+        
+        logger.info("tracemalloc stopped")
+    
+    async def snapshot_diff(self) -> list[AllocationGrowth]:
+        if not self.tracing:
+            raise RuntimeError("tracemalloc is not running")
+        
+        snapshot = await asyncio.to_thread(self._take_snapshot)
+        previous = self._previous
+        self._previous = snapshot
+        
+        if previous is None:
+            statistics = snapshot.statistics("lineno")
+            return [
+                AllocationGrowth(
+                    self._format_trace(stat.traceback),
+                    stat.size,
+                    stat.size,
+                    stat.count
+                )
+                for stat in statistics[:self._top]
+            ]
+            
+        statistics = await asyncio.to_thread(
+            snapshot.compare_to,
+            previous,
+            "lineno"
+        )
+        
+        return [
+            AllocationGrowth(
+                self._format_trace(stat.traceback),
+                stat.size_diff,
+                stat.size,
+                stat.count_diff
+            )
+            for stat in statistics[:self._top]
+            if stat.size_diff > 0
+        ]
+    
+    async def start(self) -> None:
+        if self._task is None and self._report_interval > 0:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+    
+    async def report(self) -> str:
+        lines = ["Memory by subsystem (approximate):"]
+        
+        for name, size in self.sizes().items():
+            lines.append(f"  {name}: {size / 1024:.1f} KiB")
+            
+        if self.tracing:
+            growth = await self.snapshot_diff()
+            lines.append("Top allocation growth since previous snapshot:")
+            lines.extend(f"  {entry.format()}" for entry in growth)
+            
+        return "\n".join(lines)
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._report_interval)
+            
+            try:
+                logger.info(await self.report())
+            except Exception as e:
+                logger.error(
+                    f"Failed to build memory report: {e}",
+                    exc_info=True
+                )
+    
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(IGNORED_TRACES)
+    
+    def _format_trace(self, traceback: tracemalloc.Traceback) -> str:
+        frame = traceback[0]
+        return f"{frame.filename}:{frame.lineno}"
\ No newline at end of file
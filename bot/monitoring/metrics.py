@@ -0,0 +1,365 @@
+import threading
+from bisect import bisect_left
+from typing import Callable, Optional
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+def _escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\n", "\\n")
+        .replace('"', '\\"')
+    )
+
+class _CounterChild:
+    
+    __slots__ = ("_value", "_lock")
+    
+    def __init__(self) -> None:
+        self._value: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+    
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+    
+    def get(self) -> float:
+        return self._value
+
+class _GaugeChild(_CounterChild):
+    
+    __slots__ = ()
+    
+    def set(self, value: float) -> None:
+        self._value = value
+    
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+class _HistogramChild:
+    
+    __slots__ = ("_bounds", "_counts", "_sum", "_count", "_lock")
+    
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self._bounds: tuple[float, ...] = bounds
+        self._counts: list[int] = [0] * (len(bounds) + 1)
+        self._sum: float = 0.0
+        self._count: int = 0
+        self._lock: threading.Lock = threading.Lock()
+    
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+    
+    def snapshot(self) -> tuple[list[int], float, int]:
+        with self._lock:
+            return list(self._counts), self._sum, self._count
+
+class _Metric:
+    
+    type_name: str = "untyped"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = ()
+    ) -> None:
+        self.name: str = name
+        self.documentation: str = documentation
+        self.labelnames: tuple[str, ...] = labelnames
+        self._children: dict[tuple[str, ...], object] = {}
+        self._functions: dict[tuple[str, ...], Callable[[], float]] = {}
+        self._lock: threading.Lock = threading.Lock()
+    
+    def labels(self, *values: str):
+        child = self._children.get(values)
+        
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}"
+                )
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+                
+        return child
+    
+    def set_function(self, function: Callable[[], float], *values: str) -> None:
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        
+        self._functions[values] = function
+    
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}"
+        ]
+        
+        for values, child in list(self._children.items()):
+            lines.extend(self._render_child(values, child))
+            
+        for values, function in list(self._functions.items()):
+            lines.append(
+                f"{self.name}{self._format_labels(values)} "
+                f"{_format_value(float(function()))}"
+            )
+            
+        return lines
+    
+    def _new_child(self) -> object:
+        raise NotImplementedError
+    
+    def _render_child(
+        self,
+        values: tuple[str, ...],
+        child: object
+    ) -> list[str]:
+        return [
+            f"{self.name}{self._format_labels(values)} "
+            f"{_format_value(child.get())}"
+        ]
+    
+    def _format_labels(
+        self,
+        values: tuple[str, ...],
+        extra: Optional[tuple[str, str]] = None
+    ) -> str:
+        pairs = list(zip(self.labelnames, values))
+        if extra is not None:
+            pairs.append(extra)
+            
+        if not pairs:
+            return ""
+        
+        return "{" + ",".join(
+            f'{name}="{_escape(str(value))}"' for name, value in pairs
+        ) + "}"
+
+class Counter(_Metric):
+    
+    type_name = "counter"
+    
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+    
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+class Gauge(_Metric):
+    
+    type_name = "gauge"
+    
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+    
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+    
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+    
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+class Histogram(_Metric):
+    
+    type_name = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+    
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+    
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+    
+    def _render_child(
+        self,
+        values: tuple[str, ...],
+        child: object
+    ) -> list[str]:
+        counts, total, count = child.snapshot()
+        lines = []
+        cumulative = 0
+        
+        for bound, bucket_count in zip(
+            self.buckets + (float("inf"),),
+            counts
+        ):
+            cumulative += bucket_count
+            labels = self._format_labels(
+                values,
+                ("le", _format_value(bound))
+            )
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            
+        labels = self._format_labels(values)
+        lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{self.name}_count{labels} {count}")
+        
+        return lines
+
+class MetricsRegistry:
+    
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+    
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = ()
+    ) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+    
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = ()
+    ) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+    
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(
+            Histogram(name, documentation, labelnames, buckets)
+        )
+    
+    def render(self) -> str:
+        lines: list[str] = []
+        
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+            
+        return "\n".join(lines) + "\n"
+    
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        
+        self._metrics[metric.name] = metric
+        return metric
+
+registry: MetricsRegistry = MetricsRegistry()
+
+HANDLER_LATENCY: Histogram = registry.histogram(
+    "bot_handler_duration_seconds",
+    "Time spent in update handlers",
+    ("update_type", "handler")
+)
+HANDLER_ERRORS: Counter = registry.counter(
+    "bot_handler_errors_total",
+    "Exceptions raised by update handlers",
+    ("update_type", "handler")
+)
+CACHE_REQUESTS: Counter = registry.counter(
+    "bot_cache_requests_total",
+    "In-process cache lookups",
+    ("cache", "result")
+)
+DB_QUERIES: Counter = registry.counter(
+    "bot_db_queries_total",
+    "SQL statements executed through DatabaseConnection",
+    ("statement",)
+)
+DB_QUERY_LATENCY: Histogram = registry.histogram(
+    "bot_db_query_duration_seconds",
+    "Time spent executing and fetching SQL statements",
+    ("statement",),
+    (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+     0.1, 0.25, 0.5, 1.0)
+)
+QUIZ_STARTS: Counter = registry.counter(
+    "bot_quiz_starts_total",
+    "Quizzes started by users"
+)
+QUIZ_FINISHES: Counter = registry.counter(
+    "bot_quiz_finishes_total",
+    "Quizzes finished by users"
+)
+ANSWER_EVENTS_DROPPED: Counter = registry.counter(
+    "bot_answer_events_dropped_total",
+    "Answer events dropped because the analytics buffer was full"
+)
+ACTIVE_SESSIONS: Gauge = registry.gauge(
+    "bot_active_sessions",
+    "Users with an active quiz or quiz creation session",
+    ("kind",)
+)
+INTAKE_QUEUED: Gauge = registry.gauge(
+    "bot_intake_queued_updates",
+    "Updates waiting for a concurrency slot"
+)
+INTAKE_IN_FLIGHT: Gauge = registry.gauge(
+    "bot_intake_in_flight_updates",
+    "Updates currently being handled"
+)
+INTAKE_SHED: Counter = registry.counter(
+    "bot_intake_shed_total",
+    "Updates rejected with a busy reply because the intake queue was full"
+)
+LOOP_LAG: Histogram = registry.histogram(
+    "bot_event_loop_lag_seconds",
+    "Delay between the scheduled and the actual wake-up of the lag probe"
+)
+LOOP_BLOCKS: Counter = registry.counter(
+    "bot_event_loop_blocks_total",
+    "Lag probes that exceeded the blocking threshold"
+)
+OUTBOUND_REQUESTS: Counter = registry.counter(
+    "bot_outbound_requests_total",
+    "Bot API requests made by the bot",
+    ("method", "result")
+)
+OUTBOUND_IN_FLIGHT: Gauge = registry.gauge(
+    "bot_outbound_in_flight_requests",
+    "Bot API requests waiting for a response, long polling excluded"
+)
+LOG_DROPPED: Counter = registry.counter(
+    "bot_log_records_dropped_total",
+    "Log records dropped because the logging queue was full"
+)
+MEMORY_SUBSYSTEM_BYTES: Gauge = registry.gauge(
+    "bot_memory_subsystem_bytes",
+    "Approximate memory held by in-process caches and stores",
+    ("subsystem",)
+)
+SUPERVISOR_UPDATES: Counter = registry.counter(
+    "bot_supervisor_updates_total",
+    "Updates routed by the supervisor",
+    ("shard",)
+)
+SUPERVISOR_RESTARTS: Counter = registry.counter(
+    "bot_supervisor_worker_restarts_total",
+    "Worker processes restarted by the supervisor",
+    ("shard",)
+)
\ No newline at end of file
@@ -0,0 +1,45 @@
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType
+)
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+
+from bot.monitoring.metrics import OUTBOUND_REQUESTS
+
+LONG_POLLING_METHODS = frozenset({"getUpdates"})
+
+class OutboundRequestTracker(BaseRequestMiddleware):
+    
+    def __init__(self) -> None:
+        self.in_flight: int = 0
+        self.total: int = 0
+        self.failed: int = 0
+    
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType]
+    ) -> Response[TelegramType]:
+        api_method = method.__api_method__
+        sending = api_method not in LONG_POLLING_METHODS
+        result = "ok"
+        
+        if sending:
+            self.in_flight += 1
+            
+        try:
+            return await make_request(bot, method)
+        except Exception:
+            self.failed += 1
+            result = "error"
+            raise
+        finally:
+            if sending:
+                self.in_flight -= 1
+            self.total += 1
+            OUTBOUND_REQUESTS.labels(api_method, result).inc()
+
+outbound_tracker: OutboundRequestTracker = OutboundRequestTracker()
\ No newline at end of file
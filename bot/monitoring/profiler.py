@@ -0,0 +1,194 @@
+import asyncio
+import cProfile
+import os
+import pstats
+import signal
+import time
+from pathlib import Path
+from typing import Optional
+
+from bot.logger import get_logger
+
+logger = get_logger(__name__)
+
+MAX_PROFILE_SECONDS = 300.0
+
+EVENT_LOOP_BUILTINS = (
+    "'select.",
+    "select.select",
+    "'_contextvars.Context'",
+    "_asyncio.",
+    "_lsprof."
+)
+
+class ProfileEntry:
+    
+    __slots__ = ("function", "calls", "total_time", "cumulative_time")
+    
+    def __init__(
+        self,
+        function: str,
+        calls: int,
+        total_time: float,
+        cumulative_time: float
+    ) -> None:
+        self.function: str = function
+        self.calls: int = calls
+        self.total_time: float = total_time
+        self.cumulative_time: float = cumulative_time
+
+class ProfileResult:
+    
+    def __init__(
+        self,
+        path: Path,
+        seconds: float,
+        top: list[ProfileEntry]
+    ) -> None:
+        self.path: Path = path
+        self.seconds: float = seconds
+        self.top: list[ProfileEntry] = top
+    
+    def format(self) -> str:
+        lines = [
+            f"Profile of {self.seconds:g}s written to {self.path}",
+            f"{'cumtime':>9} {'tottime':>9} {'calls':>8}  function"
+        ]
+        
+        for entry in self.top:
+            lines.append(
+                f"{entry.cumulative_time:>9.3f} {entry.total_time:>9.3f} "
+                f"{entry.calls:>8}  {entry.function}"
+            )
+            
+        return "\n".join(lines)
+
+class UpdateProfiler:
+    
+    def __init__(
+        self,
+        output_dir: str = "logs",
+        default_seconds: float = 10.0,
+        top: int = 15
+    ) -> None:
+        self._output_dir: Path = Path(output_dir)
+        self._default_seconds: float = default_seconds
+        self._top: int = top
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+    
+    def start(self, seconds: Optional[float] = None) -> asyncio.Task:
+        if self.running:
+            raise RuntimeError("Profiler is already running")
+        
+        seconds = min(seconds or self._default_seconds, MAX_PROFILE_SECONDS)
+        self._task = asyncio.create_task(self._profile(seconds))
+        return self._task
+    
+    async def install_signal_handler(self) -> None:
+        try:
+            asyncio.get_running_loop().add_signal_handler(
+                signal.SIGUSR1,
+                self._on_signal
+            )
+        except (NotImplementedError, RuntimeError, AttributeError) as e:
+            logger.debug(f"SIGUSR1 profiling is unavailable: {e}")
+    
+    async def remove_signal_handler(self) -> None:
+        try:
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGUSR1)
+        except (NotImplementedError, RuntimeError, AttributeError):
+            pass
+    
+    async def _profile(self, seconds: float) -> ProfileResult:
+        logger.info(f"Profiling event loop thread for {seconds:g}s")
+        
+        profiler = cProfile.Profile()
+        profiler.enable()
+        
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.disable()
+            
+        self._output_dir.mkdir(exist_ok=True)
+        path = self._output_dir / (
+            f"profile-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.pstats"
+        )
+        
+        result = await asyncio.to_thread(
+            self._summarize,
+            profiler,
+            path,
+            seconds
+        )
+        
+        logger.info(result.format())
+        
+        return result
+    
+    def _summarize(
+        self,
+        profiler: cProfile.Profile,
+        path: Path,
+        seconds: float
+    ) -> ProfileResult:
+        profiler.dump_stats(path)
+        
+        stats = pstats.Stats(profiler).stats
+        entries = [
+            ProfileEntry(
+                self._format_function(function),
+                calls,
+                total_time,
+                cumulative_time
+            )
+            for function, (_, calls, total_time, cumulative_time, _)
+            in stats.items()
+            if not self._is_event_loop_internal(function)
+        ]
+        entries.sort(key=lambda entry: entry.cumulative_time, reverse=True)
+        
+        return ProfileResult(path, seconds, entries[:self._top])
+    
+    def _on_signal(self) -> None:
+        if self.running:
+            logger.warning("SIGUSR1 ignored, profiler is already running")
+            return
+        
+        self.start().add_done_callback(self._on_signal_profile_done)
+    
+    def _on_signal_profile_done(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                f"Profiling failed: {task.exception()}",
+                exc_info=task.exception()
+            )
+    
+    def _is_event_loop_internal(self, function: tuple[str, int, str]) -> bool:
+        filename, _, name = function
+        
+        if filename == "~":
+            return any(marker in name for marker in EVENT_LOOP_BUILTINS)
+        
+        return (
+            f"{os.sep}asyncio{os.sep}" in filename
+            or filename.endswith(f"{os.sep}cProfile.py")
+        )
+    
+    def _format_function(self, function: tuple[str, int, str]) -> str:
+        filename, line, name = function
+        
+        try:
+            filename = os.path.relpath(filename)
+        except ValueError:
+            pass
+        
+        if filename.startswith(".."):
+            parts = Path(filename).parts
+            filename = os.path.join(*parts[-2:])
+            
+        return f"{filename}:{line}({name})"
\ No newline at end of file
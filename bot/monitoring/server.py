@@ -0,0 +1,39 @@
+from typing import Optional
+
+from aiohttp import web
+
+from bot.logger import get_logger
+from bot.monitoring.metrics import registry
+
+logger = get_logger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+async def handle_metrics(request: web.Request) -> web.Response:
+    return web.Response(
+        body=registry.render().encode("utf-8"),
+        headers={"Content-Type": CONTENT_TYPE}
+    )
+
+def create_monitoring_app(
+    routes: Optional[list[web.RouteDef]] = None
+) -> web.Application:
+    app = web.Application()
+    app.router.add_get("/metrics", handle_metrics)
+    app.router.add_routes(routes or [])
+    return app
+
+async def start_monitoring_server(
+    host: str,
+    port: int,
+    routes: Optional[list[web.RouteDef]] = None
+) -> web.AppRunner:
+    runner = web.AppRunner(create_monitoring_app(routes), access_log=None)
+    await runner.setup()
+    
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    
+    logger.info(f"Metrics available on http://{host}:{port}/metrics")
+    
+    return runner
\ No newline at end of file
@@ -0,0 +1,75 @@
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import NextRequestMiddlewareType
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+
+from bot.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+class StartupTimer:
+    
+    def __init__(self, started_at: Optional[float] = None) -> None:
+        self.started_at: float = (
+            started_at if started_at is not None else time.perf_counter()
+        )
+        self.phases: dict[str, float] = {}
+        self.ready_after: Optional[float] = None
+        self.ready_on: Optional[str] = None
+    
+    def record(self, name: str, since: float) -> None:
+        self.phases[name] = time.perf_counter() - since
+    
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        
+        try:
+            yield
+        finally:
+            self.record(name, started)
+    
+    async def measure(self, name: str, awaitable: Awaitable[T]) -> T:
+        with self.phase(name):
+            return await awaitable
+    
+    def ready(self, name: str) -> None:
+        if self.ready_after is not None:
+            return
+        
+        self.ready_after = time.perf_counter() - self.started_at
+        self.ready_on = name
+        
+        logger.info(self.format())
+    
+    async def track_first_poll(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType]
+    ) -> Response[TelegramType]:
+        if method.__api_method__ == "getUpdates":
+            bot.session.middleware.unregister(self.track_first_poll)
+            self.ready("first getUpdates")
+            
+        return await make_request(bot, method)
+    
+    def format(self) -> str:
+        phases = ", ".join(
+            f"{name} {seconds * 1000:.0f} ms"
+            for name, seconds in self.phases.items()
+        )
+        
+        if self.ready_after is None:
+            return f"Startup phases: {phases}"
+        
+        return (
+            f"Startup phases: {phases}; ready after "
+            f"{self.ready_after * 1000:.0f} ms ({self.ready_on})"
+        )
\ No newline at end of file
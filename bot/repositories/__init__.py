@@ -1,11 +1,19 @@
+from bot.repositories.analytics_repository import AnalyticsRepository
 from bot.repositories.answer_repository import AnswerRepository
+from bot.repositories.attempt_repository import AttemptRepository
+from bot.repositories.leaderboard_repository import LeaderboardRepository
 from bot.repositories.question_repository import QuestionRepository
 from bot.repositories.quiz_repository import QuizRepository
+from bot.repositories.quiz_stats_repository import QuizStatsRepository
 from bot.repositories.user_repository import UserRepository
 
 __all__ = [
+    "AnalyticsRepository",
     "AnswerRepository",
+    "AttemptRepository",
+    "LeaderboardRepository",
     "QuestionRepository",
     "QuizRepository",
+    "QuizStatsRepository",
     "UserRepository",
 ]
\ No newline at end of file
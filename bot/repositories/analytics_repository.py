@@ -0,0 +1,99 @@
+import aiosqlite
+
+from bot.database.connection import DatabaseConnection
+
+ANSWER_DISTRIBUTION_ROLLUP = "answer_distribution"
+
+class AnalyticsRepository:
+    
+    def __init__(self, db_path: str) -> None:
+        self._db_path: str = db_path
+    
+    async def add_events(self, events: list[tuple]) -> None:
+        async with DatabaseConnection(self._db_path) as conn:
+            await conn.executemany(
+                """
+                -- analytics.add_events
+                INSERT INTO answer_events (
+                    quiz_id, question_id, position, is_correct,
+                    latency_seconds, answered_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                events
+            )
+            await conn.commit()
+    
+    async def roll_up(self) -> int:
+        async with DatabaseConnection(self._db_path) as conn:
+            await conn.execute("BEGIN IMMEDIATE")
+            
+            try:
+                cursor = await conn.execute(
+                    """
+                    -- analytics.get_rollup_range
+                    SELECT
+                        (SELECT last_event_id FROM rollup_state WHERE name = ?),
+                        (SELECT MAX(id) FROM answer_events)
+                    """,
+                    (ANSWER_DISTRIBUTION_ROLLUP,)
+                )
+                last_event_id, max_event_id = await cursor.fetchone()
+                last_event_id = last_event_id or 0
+                
+                if max_event_id is None or max_event_id <= last_event_id:
+                    await conn.rollback()
+                    return 0
+                
+                await conn.execute(
+                    """
+                    -- analytics.roll_up_distribution
+                    INSERT INTO answer_distribution (
+                        question_id, position, answers, latency_sum
+                    )
+                    SELECT question_id, position, COUNT(*), SUM(latency_seconds)
+                    FROM answer_events
+                    WHERE id > ? AND id <= ?
+                    GROUP BY question_id, position
+                    ON CONFLICT (question_id, position) DO UPDATE SET
+                        answers = answers + excluded.answers,
+                        latency_sum = latency_sum + excluded.latency_sum
+                    """,
+                    (last_event_id, max_event_id)
+                )
+                await conn.execute(
+                    """
+                    -- analytics.save_rollup_position
+                    INSERT INTO rollup_state (name, last_event_id)
+                    VALUES (?, ?)
+                    ON CONFLICT (name) DO UPDATE SET
+                        last_event_id = excluded.last_event_id
+                    """,
+                    (ANSWER_DISTRIBUTION_ROLLUP, max_event_id)
+                )
+                await conn.commit()
+            except BaseException:
+                await conn.rollback()
+                raise
+            
+            return max_event_id - last_event_id
+    
+    async def get_question_distribution(self, quiz_id: int) -> list[dict]:
+        async with DatabaseConnection(self._db_path) as conn:
+            conn.row_factory = aiosqlite.Row
+            cursor = await conn.execute(
+                """
+                -- analytics.get_question_distribution
+                SELECT q.id AS question_id, q.position AS question_position,
+                       q.text, q.correct_answer, d.position, d.answers,
+                       d.latency_sum
+                FROM questions q
+                LEFT JOIN answer_distribution d ON d.question_id = q.id
+                WHERE q.quiz_id = ?
+                ORDER BY q.position, q.id, d.position
+                """,
+                (quiz_id,)
+            )
+            rows = await cursor.fetchall()
+            
+            return [dict(row) for row in rows]
\ No newline at end of file
@@ -1,3 +1,5 @@
+import json
+
 import aiosqlite
 
 from bot.database.connection import DatabaseConnection
@@ -16,6 +18,7 @@ class AnswerRepository:
         async with DatabaseConnection(self._db_path) as conn:
             cursor = await conn.execute(
                 """
+                -- answer.create_answer
                 INSERT INTO answers (question_id, text, position)
                 VALUES (?, ?, ?)
                 """,
@@ -28,21 +31,28 @@ class AnswerRepository:
             
             return cursor.lastrowid
     
-    async def get_answers_by_question_id(
+    async def get_answers_by_question_ids(
         self,
-        question_id: int
-    ) -> list[dict]:
+        question_ids: list[int]
+    ) -> dict[int, list[dict]]:
         async with DatabaseConnection(self._db_path) as conn:
             conn.row_factory = aiosqlite.Row
             cursor = await conn.execute(
                 """
+                -- answer.get_answers_by_question_ids
                 SELECT id, question_id, text, position
                 FROM answers
-                WHERE question_id = ?
-                ORDER BY position ASC
+                WHERE question_id IN (SELECT value FROM json_each(?))
+                ORDER BY question_id, position
                 """,
-                (question_id,)
+                (json.dumps(question_ids),)
             )
             rows = await cursor.fetchall()
             
-            return [dict(row) for row in rows]
\ No newline at end of file
+            answers: dict[int, list[dict]] = {
+                question_id: [] for question_id in question_ids
+            }
+            for row in rows:
+                answers[row['question_id']].append(dict(row))
+                
+            return answers
\ No newline at end of file
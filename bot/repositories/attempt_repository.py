@@ -0,0 +1,121 @@
+import json
+from typing import Optional
+
+import aiosqlite
+
+from bot.database.connection import DatabaseConnection
+
+class AttemptRepository:
+    
+    def __init__(self, db_path: str) -> None:
+        self._db_path: str = db_path
+    
+    async def add_attempts(
+        self,
+        attempts: list[tuple]
+    ) -> tuple[list[tuple], int]:
+        async with DatabaseConnection(self._db_path) as conn:
+            await conn.executemany(
+                """
+                -- attempt.add_attempts
+                INSERT INTO attempts (
+                    telegram_id, quiz_id, correct_answers, total_questions,
+                    percentage, duration_seconds, finished_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                attempts
+            )
+            cursor = await conn.execute(
+                """
+                -- attempt.last_attempt_id
+                SELECT last_insert_rowid()
+                """
+            )
+            last_id = (await cursor.fetchone())[0]
+            await conn.executemany(
+                """
+                -- attempt.update_quiz_leaderboard
+                INSERT INTO quiz_leaderboard (
+                    quiz_id, telegram_id, best_correct, best_percentage,
+                    best_duration, attempts
+                )
+                VALUES (?, ?, ?, ?, ?, 1)
+                ON CONFLICT (quiz_id, telegram_id) DO UPDATE SET
+                    attempts = attempts + 1,
+                    best_correct = CASE
+                        WHEN (excluded.best_percentage, best_duration)
+                            > (best_percentage, excluded.best_duration)
+                        THEN excluded.best_correct ELSE best_correct
+                    END,
+                    best_duration = CASE
+                        WHEN (excluded.best_percentage, best_duration)
+                            > (best_percentage, excluded.best_duration)
+                        THEN excluded.best_duration ELSE best_duration
+                    END,
+                    best_percentage = MAX(
+                        best_percentage,
+                        excluded.best_percentage
+                    )
+                """,
+                [
+                    (attempt[1], attempt[0], attempt[2], attempt[4],
+                     attempt[5])
+                    for attempt in attempts
+                ]
+            )
+            cursor = await conn.execute(
+                """
+                -- attempt.sum_user_scores
+                SELECT telegram_id, SUM(best_correct), COUNT(*)
+                FROM quiz_leaderboard
+                WHERE telegram_id IN (SELECT value FROM json_each(?))
+                GROUP BY telegram_id
+                """,
+                (json.dumps(list({attempt[0] for attempt in attempts})),)
+            )
+            scores = [tuple(row) for row in await cursor.fetchall()]
+            await conn.executemany(
+                """
+                -- attempt.update_user_scores
+                INSERT INTO user_scores (telegram_id, points, quizzes)
+                VALUES (?, ?, ?)
+                ON CONFLICT (telegram_id) DO UPDATE SET
+                    points = excluded.points,
+                    quizzes = excluded.quizzes
+                """,
+                scores
+            )
+            await conn.commit()
+            
+            return scores, last_id
+    
+    async def get_user_attempts(
+        self,
+        telegram_id: int,
+        before_id: Optional[int] = None,
+        limit: int = 5
+    ) -> list[dict]:
+        async with DatabaseConnection(self._db_path) as conn:
+            conn.row_factory = aiosqlite.Row
+            cursor = await conn.execute(
+                """
+                -- attempt.get_user_attempts
+                SELECT a.id, a.quiz_id, q.title, a.correct_answers,
+                       a.total_questions, a.percentage, a.duration_seconds,
+                       a.finished_at
+                FROM attempts a
+                JOIN quizzes q ON q.id = a.quiz_id
+                WHERE a.telegram_id = ? AND a.id < ?
+                ORDER BY a.id DESC
+                LIMIT ?
+                """,
+                (
+                    telegram_id,
+                    before_id if before_id is not None else 2 ** 63 - 1,
+                    limit
+                )
+            )
+            rows = await cursor.fetchall()
+            
+            return [dict(row) for row in rows]
\ No newline at end of file
@@ -0,0 +1,90 @@
+import json
+from typing import Optional
+
+import aiosqlite
+
+from bot.database.connection import DatabaseConnection
+
+class LeaderboardRepository:
+    
+    def __init__(self, db_path: str) -> None:
+        self._db_path: str = db_path
+    
+    async def get_last_attempt_id(self) -> int:
+        async with DatabaseConnection(self._db_path) as conn:
+            cursor = await conn.execute(
+                """
+                -- leaderboard.get_last_attempt_id
+                SELECT COALESCE(MAX(id), 0) FROM attempts
+                """
+            )
+            row = await cursor.fetchone()
+            
+            return row[0]
+    
+    async def get_quiz_top(self, quiz_id: int, limit: int) -> Optional[dict]:
+        async with DatabaseConnection(self._db_path) as conn:
+            conn.row_factory = aiosqlite.Row
+            cursor = await conn.execute(
+                """
+                -- leaderboard.get_quiz_title
+                SELECT title FROM quizzes WHERE id = ?
+                """,
+                (quiz_id,)
+            )
+            quiz = await cursor.fetchone()
+            
+            if quiz is None:
+                return None
+            
+            cursor = await conn.execute(
+                """
+                -- leaderboard.get_quiz_top
+                SELECT telegram_id, best_correct AS correct_answers,
+                       best_percentage AS percentage,
+                       best_duration AS duration_seconds
+                FROM quiz_leaderboard
+                WHERE quiz_id = ?
+                ORDER BY best_percentage DESC, best_duration, telegram_id
+                LIMIT ?
+                """,
+                (quiz_id, limit)
+            )
+            rows = await cursor.fetchall()
+            
+            return {
+                'title': quiz['title'],
+                'entries': [dict(row) for row in rows]
+            }
+    
+    async def get_global_top(self, limit: int) -> list[dict]:
+        async with DatabaseConnection(self._db_path) as conn:
+            conn.row_factory = aiosqlite.Row
+            cursor = await conn.execute(
+                """
+                -- leaderboard.get_global_top
+                SELECT telegram_id, points, quizzes
+                FROM user_scores
+                ORDER BY points DESC, telegram_id
+                LIMIT ?
+                """,
+                (limit,)
+            )
+            rows = await cursor.fetchall()
+            
+            return [dict(row) for row in rows]
+    
+    async def get_player_names(self, telegram_ids: list[int]) -> dict[int, str]:
+        async with DatabaseConnection(self._db_path) as conn:
+            cursor = await conn.execute(
+                """
+                -- leaderboard.get_player_names
+                SELECT telegram_id, COALESCE(first_name, username)
+                FROM users
+                WHERE telegram_id IN (SELECT value FROM json_each(?))
+                """,
+                (json.dumps(telegram_ids),)
+            )
+            rows = await cursor.fetchall()
+            
+            return {row[0]: row[1] for row in rows if row[1]}
\ No newline at end of file
@@ -19,6 +19,7 @@ class QuestionRepository:
         async with DatabaseConnection(self._db_path) as conn:
             cursor = await conn.execute(
                 """
+                -- question.create_question
                 INSERT INTO questions (quiz_id, text, position, correct_answer)
                 VALUES (?, ?, ?, ?)
                 """,
@@ -36,6 +37,7 @@ class QuestionRepository:
             conn.row_factory = aiosqlite.Row
             cursor = await conn.execute(
                 """
+                -- question.get_questions_by_quiz_id
                 SELECT id, quiz_id, text, position, correct_answer
                 FROM questions
                 WHERE quiz_id = ?
@@ -47,11 +49,35 @@ class QuestionRepository:
             
             return [dict(row) for row in rows]
     
+    async def get_questions_window(
+        self,
+        quiz_id: int,
+        first_position: int,
+        limit: int
+    ) -> list[dict]:
+        async with DatabaseConnection(self._db_path) as conn:
+            conn.row_factory = aiosqlite.Row
+            cursor = await conn.execute(
+                """
+                -- question.get_questions_window
+                SELECT id, quiz_id, text, position, correct_answer
+                FROM questions
+                WHERE quiz_id = ? AND position >= ?
+                ORDER BY position ASC
+                LIMIT ?
+                """,
+                (quiz_id, first_position, limit)
+            )
+            rows = await cursor.fetchall()
+            
+            return [dict(row) for row in rows]
+    
     async def get_question_by_id(self, question_id: int) -> Optional[dict]:
         async with DatabaseConnection(self._db_path) as conn:
             conn.row_factory = aiosqlite.Row
             cursor = await conn.execute(
                 """
+                -- question.get_question_by_id
                 SELECT id, quiz_id, text, position, correct_answer
                 FROM questions
                 WHERE id = ?
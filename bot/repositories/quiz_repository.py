@@ -1,9 +1,28 @@
+import re
 from typing import Optional
 
 import aiosqlite
 
 from bot.database.connection import DatabaseConnection
 
+SEARCH_TOKEN_PATTERN = re.compile(r"\w+")
+
+SEARCH_MIN_PREFIX_LENGTH = 2
+SEARCH_FULL_RANK_LIMIT = 10000
+SEARCH_CANDIDATE_LIMIT = 1000
+
+def build_search_query(text: str) -> Optional[str]:
+    tokens = SEARCH_TOKEN_PATTERN.findall(text.lower())
+    
+    if not tokens:
+        return None
+    
+    terms = [f'"{token}"' for token in tokens]
+    if len(tokens[-1]) >= SEARCH_MIN_PREFIX_LENGTH:
+        terms[-1] += "*"
+    
+    return " ".join(terms)
+
 class QuizRepository:
     
     def __init__(self, db_path: str) -> None:
@@ -13,6 +32,7 @@ class QuizRepository:
         async with DatabaseConnection(self._db_path) as conn:
             cursor = await conn.execute(
                 """
+                -- quiz.create_quiz
                 INSERT INTO quizzes (title, creator_id)
                 VALUES (?, ?)
                 """,
@@ -30,6 +50,7 @@ class QuizRepository:
             conn.row_factory = aiosqlite.Row
             cursor = await conn.execute(
                 """
+                -- quiz.get_all_quizzes
                 SELECT id, title, creator_id, created_at
                 FROM quizzes
                 ORDER BY created_at DESC
@@ -44,6 +65,7 @@ class QuizRepository:
             conn.row_factory = aiosqlite.Row
             cursor = await conn.execute(
                 """
+                -- quiz.get_quiz_by_id
                 SELECT id, title, creator_id, created_at
                 FROM quizzes
                 WHERE id = ?
@@ -57,6 +79,30 @@ class QuizRepository:
             
             return dict(row)
     
+    async def get_quiz_summary(self, quiz_id: int) -> Optional[dict]:
+        async with DatabaseConnection(self._db_path) as conn:
+            conn.row_factory = aiosqlite.Row
+            cursor = await conn.execute(
+                """
+                -- quiz.get_quiz_summary
+                SELECT id, title, creator_id, created_at,
+                       (
+                           SELECT COALESCE(MAX(position), 0)
+                           FROM questions
+                           WHERE quiz_id = quizzes.id
+                       ) AS question_count
+                FROM quizzes
+                WHERE id = ?
+                """,
+                (quiz_id,)
+            )
+            row = await cursor.fetchone()
+            
+            if row is None:
+                return None
+            
+            return dict(row)
+    
     async def get_quizzes_paginated(
         self,
         page: int = 1,
@@ -73,13 +119,17 @@ class QuizRepository:
             conn.row_factory = aiosqlite.Row
             
             count_cursor = await conn.execute(
-                "SELECT COUNT(*) as total FROM quizzes"
+                """
+                -- quiz.count_quizzes
+                SELECT COUNT(*) as total FROM quizzes
+                """
             )
             count_row = await count_cursor.fetchone()
             total = count_row['total'] if count_row else 0
             
             cursor = await conn.execute(
                 """
+                -- quiz.get_quizzes_paginated
                 SELECT id, title, creator_id, created_at
                 FROM quizzes
                 ORDER BY created_at DESC
@@ -100,4 +150,67 @@ class QuizRepository:
                 'total_pages': total_pages,
                 'has_next': page < total_pages,
                 'has_prev': page > 1
-            }
\ No newline at end of file
+            }
+    
+    async def search(self, text: str, limit: int = 10) -> list[dict]:
+        query = build_search_query(text)
+        
+        if query is None:
+            return []
+        
+        async with DatabaseConnection(self._db_path) as conn:
+            conn.row_factory = aiosqlite.Row
+            cursor = await conn.execute(
+                """
+                -- quiz.count_search_hits
+                SELECT COUNT(*)
+                FROM quiz_search
+                WHERE quiz_search MATCH ?
+                """,
+                (query,)
+            )
+            (total,) = await cursor.fetchone()
+            rank_all = total <= SEARCH_FULL_RANK_LIMIT
+            
+            cursor = await conn.execute(
+                """
+                -- quiz.search
+                SELECT q.id, q.title, q.creator_id, q.created_at
+                FROM quiz_search s
+                JOIN quizzes q ON q.id = s.rowid
+                WHERE quiz_search MATCH ?
+                ORDER BY s.rank
+                LIMIT ?
+                """,
+                (query if rank_all else f"{{title}} : ({query})", limit)
+            )
+            quizzes = [dict(row) for row in await cursor.fetchall()]
+            
+            if rank_all or len(quizzes) >= limit:
+                return quizzes
+            
+            cursor = await conn.execute(
+                """
+                -- quiz.search_recent
+                SELECT q.id, q.title, q.creator_id, q.created_at
+                FROM quiz_search s
+                JOIN quizzes q ON q.id = s.rowid
+                WHERE quiz_search MATCH ? AND s.rowid >= (
+                    SELECT rowid
+                    FROM quiz_search
+                    WHERE quiz_search MATCH ?
+                    ORDER BY rowid DESC
+                    LIMIT 1 OFFSET ?
+                )
+                ORDER BY s.rank
+                LIMIT ?
+                """,
+                (query, query, SEARCH_CANDIDATE_LIMIT - 1, limit + len(quizzes))
+            )
+            found = {quiz['id'] for quiz in quizzes}
+            quizzes.extend(
+                dict(row) for row in await cursor.fetchall()
+                if row['id'] not in found
+            )
+            
+            return quizzes[:limit]
\ No newline at end of file
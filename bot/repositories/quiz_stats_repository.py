@@ -0,0 +1,36 @@
+from bot.database.connection import DatabaseConnection
+
+class QuizStatsRepository:
+    
+    def __init__(self, db_path: str) -> None:
+        self._db_path: str = db_path
+    
+    async def add_starts(self, starts: dict[int, int]) -> None:
+        async with DatabaseConnection(self._db_path) as conn:
+            await conn.executemany(
+                """
+                -- quiz_stats.add_starts
+                INSERT INTO quiz_stats (quiz_id, starts)
+                SELECT id, ? FROM quizzes WHERE id = ?
+                ON CONFLICT (quiz_id)
+                DO UPDATE SET starts = starts + excluded.starts
+                """,
+                [(count, quiz_id) for quiz_id, count in starts.items()]
+            )
+            await conn.commit()
+    
+    async def get_most_started_ids(self, limit: int) -> list[int]:
+        async with DatabaseConnection(self._db_path) as conn:
+            cursor = await conn.execute(
+                """
+                -- quiz_stats.get_most_started_ids
+                SELECT quiz_id
+                FROM quiz_stats
+                ORDER BY starts DESC
+                LIMIT ?
+                """,
+                (limit,)
+            )
+            rows = await cursor.fetchall()
+            
+            return [row[0] for row in rows]
\ No newline at end of file
@@ -18,6 +18,7 @@ class UserRepository:
         async with DatabaseConnection(self._db_path) as conn:
             cursor = await conn.execute(
                 """
+                -- user.create_user
                 INSERT INTO users (telegram_id, username, first_name)
                 VALUES (?, ?, ?)
                 """,
@@ -38,6 +39,7 @@ class UserRepository:
             conn.row_factory = aiosqlite.Row
             cursor = await conn.execute(
                 """
+                -- user.get_user_by_telegram_id
                 SELECT id, telegram_id, username, first_name, created_at
                 FROM users
                 WHERE telegram_id = ?
@@ -55,6 +57,7 @@ class UserRepository:
         async with DatabaseConnection(self._db_path) as conn:
             cursor = await conn.execute(
                 """
+                -- user.user_exists
                 SELECT COUNT(*) FROM users WHERE telegram_id = ?
                 """,
                 (telegram_id,)
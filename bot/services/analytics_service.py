@@ -0,0 +1,148 @@
+import asyncio
+import time
+from collections import deque
+
+from bot.logger import get_logger
+from bot.monitoring.metrics import ANSWER_EVENTS_DROPPED
+from bot.repositories.analytics_repository import AnalyticsRepository
+
+logger = get_logger(__name__)
+
+class AnalyticsService:
+    
+    def __init__(
+        self,
+        analytics_repository: AnalyticsRepository,
+        buffer_size: int = 10000,
+        flush_interval: float = 2.0,
+        rollup_interval: float = 60.0
+    ) -> None:
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be positive integer")
+        
+        self._analytics_repository: AnalyticsRepository = analytics_repository
+        self._buffer_size: int = buffer_size
+        self._flush_interval: float = flush_interval
+        self._rollup_interval: float = rollup_interval
+        self._events: deque[tuple] = deque(maxlen=buffer_size)
+        self._flush_lock: asyncio.Lock = asyncio.Lock()
+        self._tasks: list[asyncio.Task] = []
+        
+        self.dropped: int = 0
+        self.written: int = 0
+        self.rolled_up: int = 0
+    
+    @property
+    def pending(self) -> int:
+        return len(self._events)
+    
+    async def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._flush_periodically()),
+                asyncio.create_task(self._roll_up_periodically())
+            ]
+    
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        
+        await self.flush()
+        await self.roll_up()
+    
+    def record(
+        self,
+        quiz_id: int,
+        question_id: int,
+        position: int,
+        is_correct: bool,
+        latency_seconds: float
+    ) -> None:
+        if len(self._events) == self._buffer_size:
+            self.dropped += 1
+            ANSWER_EVENTS_DROPPED.inc()
+            
+        self._events.append((
+            quiz_id,
+            question_id,
+            position,
+            is_correct,
+            round(latency_seconds, 3),
+            time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+        ))
+    
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if not self._events:
+                return
+            
+            events = list(self._events)
+            self._events.clear()
+            
+            try:
+                await self._analytics_repository.add_events(events)
+            except Exception as e:
+                self._events = deque(
+                    events + list(self._events),
+                    maxlen=self._buffer_size
+                )
+                logger.error(
+                    f"Failed to write {len(events)} answer events: {e}",
+                    exc_info=True
+                )
+                return
+            
+            self.written += len(events)
+    
+    async def roll_up(self) -> None:
+        try:
+            self.rolled_up += await self._analytics_repository.roll_up()
+        except Exception as e:
+            logger.error(f"Failed to roll up answer events: {e}", exc_info=True)
+    
+    async def get_quiz_analytics(self, quiz_id: int) -> list[dict]:
+        if quiz_id <= 0:
+            raise ValueError("quiz_id must be positive integer")
+        
+        rows = await self._analytics_repository.get_question_distribution(
+            quiz_id
+        )
+        questions: list[dict] = []
+        
+        for row in rows:
+            if not questions or questions[-1]['id'] != row['question_id']:
+                questions.append({
+                    'id': row['question_id'],
+                    'position': row['question_position'],
+                    'text': row['text'],
+                    'correct_answer': row['correct_answer'],
+                    'answers': 0,
+                    'correct': 0,
+                    'latency_sum': 0.0,
+                    'distribution': {}
+                })
+                
+            if row['position'] is None:
+                continue
+            
+            question = questions[-1]
+            question['answers'] += row['answers']
+            question['latency_sum'] += row['latency_sum']
+            question['distribution'][row['position']] = row['answers']
+            
+            if row['position'] == question['correct_answer']:
+                question['correct'] += row['answers']
+                
+        return questions
+    
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
+    
+    async def _roll_up_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._rollup_interval)
+            await self.roll_up()
\ No newline at end of file
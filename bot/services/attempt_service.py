@@ -0,0 +1,138 @@
+import asyncio
+import time
+from typing import Optional
+
+from bot.logger import get_logger
+from bot.repositories.attempt_repository import AttemptRepository
+from bot.services.leaderboard_service import LeaderboardService
+
+logger = get_logger(__name__)
+
+class AttemptService:
+    
+    def __init__(
+        self,
+        attempt_repository: AttemptRepository,
+        leaderboard_service: Optional[LeaderboardService] = None,
+        batch_size: int = 100,
+        flush_interval: float = 1.0
+    ) -> None:
+        self._attempt_repository: AttemptRepository = attempt_repository
+        self._leaderboard_service: Optional[LeaderboardService] = (
+            leaderboard_service
+        )
+        self._batch_size: int = batch_size
+        self._flush_interval: float = flush_interval
+        self._pending: list[tuple] = []
+        self._batch_ready: asyncio.Event = asyncio.Event()
+        self._flush_lock: asyncio.Lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        
+        self.flushes: int = 0
+        self.written: int = 0
+    
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+    
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+            
+        await self.flush()
+    
+    def record(
+        self,
+        telegram_id: int,
+        quiz_id: int,
+        result: dict,
+        duration_seconds: float
+    ) -> None:
+        self._pending.append((
+            telegram_id,
+            quiz_id,
+            result['correct_answers'],
+            result['total_questions'],
+            result['percentage'],
+            round(duration_seconds, 3),
+            time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+        ))
+        
+        if len(self._pending) >= self._batch_size:
+            self._batch_ready.set()
+    
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            
+            attempts = self._pending
+            self._pending = []
+            
+            try:
+                scores, last_id = await self._attempt_repository.add_attempts(
+                    attempts
+                )
+            except Exception as e:
+                self._pending[:0] = attempts
+                logger.error(
+                    f"Failed to write {len(attempts)} attempts: {e}",
+                    exc_info=True
+                )
+                return
+            
+            self.flushes += 1
+            self.written += len(attempts)
+            
+            if self._leaderboard_service is not None:
+                self._leaderboard_service.apply(attempts, scores, last_id)
+    
+    async def flush_pending(self, quiz_id: Optional[int] = None) -> None:
+        if any(
+            quiz_id is None or attempt[1] == quiz_id
+            for attempt in self._pending
+        ):
+            await self.flush()
+    
+    async def get_user_attempts(
+        self,
+        telegram_id: int,
+        before_id: Optional[int] = None,
+        page_size: int = 5
+    ) -> dict:
+        if any(attempt[0] == telegram_id for attempt in self._pending):
+            await self.flush()
+            
+        attempts = await self._attempt_repository.get_user_attempts(
+            telegram_id,
+            before_id,
+            page_size + 1
+        )
+        has_next = len(attempts) > page_size
+        attempts = attempts[:page_size]
+        
+        return {
+            'attempts': attempts,
+            'has_next': has_next,
+            'next_before_id': attempts[-1]['id'] if has_next else None,
+            'is_first': before_id is None
+        }
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._batch_ready.wait(),
+                    self._flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            
+            self._batch_ready.clear()
+            await self.flush()
\ No newline at end of file
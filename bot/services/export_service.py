@@ -0,0 +1,277 @@
+import asyncio
+import csv
+import json
+import os
+import sqlite3
+import tempfile
+from datetime import date
+from typing import Any, Iterator, Optional, TextIO
+
+from bot.logger import get_logger
+from bot.services.import_service import CSV_ANSWER_COLUMNS
+
+logger = get_logger(__name__)
+
+EXPORT_KINDS = ("quizzes", "results")
+EXPORT_FORMATS = ("jsonl", "csv")
+
+RESULT_COLUMNS = (
+    "id",
+    "telegram_id",
+    "quiz_id",
+    "quiz_title",
+    "correct_answers",
+    "total_questions",
+    "percentage",
+    "duration_seconds",
+    "finished_at"
+)
+
+def build_filters(
+    column: str,
+    creator: Optional[int],
+    since: Optional[date],
+    until: Optional[date]
+) -> tuple[str, list[Any]]:
+    conditions: list[str] = []
+    parameters: list[Any] = []
+    
+    if creator is not None:
+        conditions.append("u.telegram_id = ?")
+        parameters.append(creator)
+    if since is not None:
+        conditions.append(f"{column} >= ?")
+        parameters.append(since.isoformat())
+    if until is not None:
+        conditions.append(f"{column} < date(?, '+1 day')")
+        parameters.append(until.isoformat())
+        
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return where, parameters
+
+def iter_rows(
+    cursor: sqlite3.Cursor,
+    chunk_size: int
+) -> Iterator[sqlite3.Row]:
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        
+        if not rows:
+            return
+        
+        yield from rows
+
+def iter_quizzes(
+    conn: sqlite3.Connection,
+    creator: Optional[int] = None,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    chunk_size: int = 1000
+) -> Iterator[dict]:
+    where, parameters = build_filters("qz.created_at", creator, since, until)
+    cursor = conn.execute(
+        f"""
+        -- export.iter_quizzes
+        SELECT qz.id, qz.title, u.telegram_id AS creator, qz.created_at,
+               qu.id AS question_id, qu.text, qu.correct_answer,
+               a.text AS answer
+        FROM quizzes qz
+        JOIN users u ON u.id = qz.creator_id
+        CROSS JOIN questions qu ON qu.quiz_id = qz.id
+        CROSS JOIN answers a ON a.question_id = qu.id
+        {where}
+        ORDER BY qz.id, qu.position, qu.id, a.position
+        """,
+        parameters
+    )
+    quiz: Optional[dict] = None
+    question: Optional[dict] = None
+    
+    for row in iter_rows(cursor, chunk_size):
+        if quiz is None or quiz['id'] != row['id']:
+            if quiz is not None:
+                yield quiz
+            quiz = {
+                'id': row['id'],
+                'title': row['title'],
+                'creator': row['creator'],
+                'created_at': row['created_at'],
+                'questions': []
+            }
+            question = None
+            
+        if question is None or question['id'] != row['question_id']:
+            question = {
+                'id': row['question_id'],
+                'text': row['text'],
+                'answers': [],
+                'correct_answer': row['correct_answer']
+            }
+            quiz['questions'].append(question)
+            
+        question['answers'].append(row['answer'])
+        
+    if quiz is not None:
+        yield quiz
+
+def iter_results(
+    conn: sqlite3.Connection,
+    creator: Optional[int] = None,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    chunk_size: int = 1000
+) -> Iterator[dict]:
+    where, parameters = build_filters("at.finished_at", creator, since, until)
+    cursor = conn.execute(
+        f"""
+        -- export.iter_results
+        SELECT at.id, at.telegram_id, at.quiz_id, qz.title AS quiz_title,
+               at.correct_answers, at.total_questions, at.percentage,
+               at.duration_seconds, at.finished_at
+        FROM attempts at
+        JOIN quizzes qz ON qz.id = at.quiz_id
+        JOIN users u ON u.id = qz.creator_id
+        {where}
+        ORDER BY at.id
+        """,
+        parameters
+    )
+    
+    for row in iter_rows(cursor, chunk_size):
+        yield dict(row)
+
+def write_quizzes(
+    quizzes: Iterator[dict],
+    handle: TextIO,
+    export_format: str
+) -> int:
+    count = 0
+    
+    if export_format == "jsonl":
+        for quiz in quizzes:
+            handle.write(json.dumps(quiz, ensure_ascii=False) + "\n")
+            count += 1
+        return count
+    
+    writer = csv.writer(handle)
+    writer.writerow(
+        ("key", "title", "question", *CSV_ANSWER_COLUMNS, "correct_answer")
+    )
+    
+    for quiz in quizzes:
+        for question in quiz['questions']:
+            answers = question['answers'][:len(CSV_ANSWER_COLUMNS)]
+            writer.writerow((
+                quiz['id'],
+                quiz['title'],
+                question['text'],
+                *answers,
+                *[""] * (len(CSV_ANSWER_COLUMNS) - len(answers)),
+                question['correct_answer']
+            ))
+        count += 1
+        
+    return count
+
+def write_results(
+    results: Iterator[dict],
+    handle: TextIO,
+    export_format: str
+) -> int:
+    count = 0
+    
+    if export_format == "jsonl":
+        for result in results:
+            handle.write(json.dumps(result, ensure_ascii=False) + "\n")
+            count += 1
+        return count
+    
+    writer = csv.DictWriter(handle, fieldnames=RESULT_COLUMNS)
+    writer.writeheader()
+    
+    for result in results:
+        writer.writerow(result)
+        count += 1
+        
+    return count
+
+def export_data(
+    db_path: str,
+    kind: str,
+    handle: TextIO,
+    export_format: str = "jsonl",
+    creator: Optional[int] = None,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    chunk_size: int = 1000
+) -> int:
+    if kind not in EXPORT_KINDS:
+        raise ValueError(f"kind must be one of {EXPORT_KINDS}")
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"export_format must be one of {EXPORT_FORMATS}")
+    
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    
+    try:
+        if kind == "quizzes":
+            return write_quizzes(
+                iter_quizzes(conn, creator, since, until, chunk_size),
+                handle,
+                export_format
+            )
+            
+        return write_results(
+            iter_results(conn, creator, since, until, chunk_size),
+            handle,
+            export_format
+        )
+    finally:
+        conn.close()
+
+class ExportService:
+    
+    def __init__(self, db_path: str, max_concurrent: int = 2) -> None:
+        self._db_path: str = db_path
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrent)
+    
+    async def export_to_file(
+        self,
+        kind: str,
+        export_format: str,
+        creator: Optional[int] = None
+    ) -> tuple[str, int]:
+        async with self._semaphore:
+            return await asyncio.to_thread(
+                self._export_to_file,
+                kind,
+                export_format,
+                creator
+            )
+    
+    def _export_to_file(
+        self,
+        kind: str,
+        export_format: str,
+        creator: Optional[int]
+    ) -> tuple[str, int]:
+        fd, path = tempfile.mkstemp(
+            prefix=f"{kind}-",
+            suffix=f".{export_format}"
+        )
+        
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as handle:
+                count = export_data(
+                    self._db_path,
+                    kind,
+                    handle,
+                    export_format,
+                    creator=creator
+                )
+        except BaseException:
+            os.remove(path)
+            raise
+            
+        logger.info(f"Exported {count} {kind} to {path}")
+        return path, count
\ No newline at end of file
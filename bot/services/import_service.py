@@ -0,0 +1,281 @@
+import csv
+import hashlib
+import json
+import time
+from typing import Any, Callable, Iterable, Iterator, Optional, TextIO
+
+import aiosqlite
+
+from bot.database.connection import DatabaseConnection
+from bot.logger import get_logger
+from bot.services.quiz_service import validate_quiz
+
+logger = get_logger(__name__)
+
+CSV_ANSWER_COLUMNS = tuple(f"answer_{position}" for position in range(1, 7))
+MAX_REPORTED_ERRORS = 20
+
+def iter_jsonl(handle: TextIO) -> Iterator[tuple[int, Any]]:
+    for line_number, line in enumerate(handle, 1):
+        if line.strip():
+            yield line_number, line
+
+def iter_csv(handle: TextIO) -> Iterator[tuple[int, Any]]:
+    reader = csv.DictReader(handle)
+    quiz: Optional[dict] = None
+    group: Optional[str] = None
+    quiz_line = 0
+    
+    for row in reader:
+        row_group = row.get('key') or row.get('title')
+        
+        if quiz is None or row_group != group:
+            if quiz is not None:
+                yield quiz_line, quiz
+            quiz = {'title': row.get('title'), 'questions': []}
+            if row.get('key'):
+                quiz['key'] = row['key']
+            group = row_group
+            quiz_line = reader.line_num
+            
+        correct_answer = (row.get('correct_answer') or "").strip()
+        quiz['questions'].append({
+            'text': row.get('question'),
+            'answers': [
+                row[column] for column in CSV_ANSWER_COLUMNS
+                if row.get(column)
+            ],
+            'correct_answer': (
+                int(correct_answer) if correct_answer.isdigit()
+                else correct_answer
+            )
+        })
+        
+    if quiz is not None:
+        yield quiz_line, quiz
+
+def get_source_key(quiz: dict) -> str:
+    if quiz.get('key'):
+        return str(quiz['key'])
+    
+    content = json.dumps(
+        [quiz.get('title'), quiz.get('questions')],
+        ensure_ascii=False,
+        sort_keys=True
+    )
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+def prepare_quiz(record: Any) -> tuple[str, str, list[dict]]:
+    quiz = json.loads(record) if isinstance(record, str) else record
+    
+    if not isinstance(quiz, dict):
+        raise ValueError("Quiz must be an object")
+    
+    title = quiz.get('title')
+    questions = quiz.get('questions')
+    
+    if not isinstance(title, str) or not isinstance(questions, list):
+        raise ValueError("Quiz must have a title and a list of questions")
+    
+    validate_quiz(title, questions)
+    
+    return get_source_key(quiz), title.strip(), [
+        {
+            'text': question['text'].strip(),
+            'answers': [str(answer).strip() for answer in question['answers']],
+            'correct_answer': question['correct_answer']
+        }
+        for question in questions
+    ]
+
+class QuizImporter:
+    
+    def __init__(
+        self,
+        db_path: str,
+        creator_id: int,
+        batch_size: int = 1000
+    ) -> None:
+        if creator_id <= 0:
+            raise ValueError("creator_id must be positive integer")
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive integer")
+        
+        self._db_path: str = db_path
+        self._creator_id: int = creator_id
+        self._batch_size: int = batch_size
+        
+        self.imported: int = 0
+        self.skipped: int = 0
+        self.invalid: int = 0
+    
+    async def run(
+        self,
+        records: Iterable[tuple[int, Any]],
+        progress: Optional[Callable[[], float]] = None
+    ) -> None:
+        started = time.perf_counter()
+        batch: list[tuple[str, str, list[dict]]] = []
+        
+        async with DatabaseConnection(self._db_path) as conn:
+            for line_number, record in records:
+                try:
+                    batch.append(prepare_quiz(record))
+                except (
+                    ValueError,
+                    TypeError,
+                    KeyError,
+                    AttributeError
+                ) as e:
+                    self.invalid += 1
+                    if self.invalid <= MAX_REPORTED_ERRORS:
+                        logger.warning(
+                            f"Skipping invalid quiz at line {line_number}: {e}"
+                        )
+                    continue
+                
+                if len(batch) >= self._batch_size:
+                    await self._write_batch(conn, batch)
+                    batch = []
+                    self._report(started, progress)
+                    
+            if batch:
+                await self._write_batch(conn, batch)
+                self._report(started, progress)
+    
+    async def _write_batch(
+        self,
+        conn: aiosqlite.Connection,
+        batch: list[tuple[str, str, list[dict]]]
+    ) -> None:
+        await conn.execute("BEGIN IMMEDIATE")
+        
+        try:
+            cursor = await conn.execute(
+                """
+                -- import.get_imported_keys
+                SELECT source_key
+                FROM quiz_imports
+                WHERE source_key IN (SELECT value FROM json_each(?))
+                """,
+                (json.dumps([key for key, _, _ in batch]),)
+            )
+            seen = {row[0] for row in await cursor.fetchall()}
+            
+            cursor = await conn.execute(
+                """
+                -- import.get_next_ids
+                SELECT
+                    MAX(
+                        (SELECT COALESCE(MAX(id), 0) FROM quizzes),
+                        (SELECT COALESCE(MAX(seq), 0) FROM sqlite_sequence
+                         WHERE name = 'quizzes')
+                    ),
+                    MAX(
+                        (SELECT COALESCE(MAX(id), 0) FROM questions),
+                        (SELECT COALESCE(MAX(seq), 0) FROM sqlite_sequence
+                         WHERE name = 'questions')
+                    )
+                """
+            )
+            quiz_id, question_id = await cursor.fetchone()
+            
+            quizzes: list[tuple] = []
+            questions: list[tuple] = []
+            answers: list[tuple] = []
+            search: list[tuple] = []
+            imports: list[tuple] = []
+            
+            for key, title, questions_data in batch:
+                if key in seen:
+                    self.skipped += 1
+                    continue
+                
+                seen.add(key)
+                quiz_id += 1
+                quizzes.append((quiz_id, title, self._creator_id))
+                search.append((
+                    quiz_id,
+                    title,
+                    " ".join(question['text'] for question in questions_data)
+                ))
+                imports.append((key, quiz_id))
+                
+                for position, question in enumerate(questions_data, 1):
+                    question_id += 1
+                    questions.append((
+                        question_id,
+                        quiz_id,
+                        question['text'],
+                        position,
+                        question['correct_answer']
+                    ))
+                    answers.extend(
+                        (question_id, text, answer_position)
+                        for answer_position, text in enumerate(
+                            question['answers'], 1
+                        )
+                    )
+                    
+            await conn.executemany(
+                """
+                -- import.insert_quizzes
+                INSERT INTO quizzes (id, title, creator_id)
+                VALUES (?, ?, ?)
+                """,
+                quizzes
+            )
+            await conn.executemany(
+                """
+                -- import.insert_questions
+                INSERT INTO questions
+                (id, quiz_id, text, position, correct_answer)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                questions
+            )
+            await conn.executemany(
+                """
+                -- import.insert_answers
+                INSERT INTO answers (question_id, text, position)
+                VALUES (?, ?, ?)
+                """,
+                answers
+            )
+            await conn.executemany(
+                """
+                -- import.index_quizzes
+                INSERT INTO quiz_search (rowid, title, questions)
+                VALUES (?, ?, ?)
+                """,
+                search
+            )
+            await conn.executemany(
+                """
+                -- import.record_imports
+                INSERT INTO quiz_imports (source_key, quiz_id)
+                VALUES (?, ?)
+                """,
+                imports
+            )
+            await conn.commit()
+        except BaseException:
+            await conn.rollback()
+            raise
+            
+        self.imported += len(quizzes)
+    
+    def _report(
+        self,
+        started: float,
+        progress: Optional[Callable[[], float]]
+    ) -> None:
+        elapsed = time.perf_counter() - started
+        processed = self.imported + self.skipped + self.invalid
+        done = f"{progress():.0%} of input, " if progress is not None else ""
+        
+        logger.info(
+            f"Imported {self.imported} quizzes, skipped {self.skipped} "
+            f"already imported, {self.invalid} invalid "
+            f"({done}{processed / max(elapsed, 1e-9):.0f} quizzes/s)"
+        )
\ No newline at end of file
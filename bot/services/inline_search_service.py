@@ -0,0 +1,68 @@
+import asyncio
+from typing import Optional
+
+from bot.cache import LRUCache
+from bot.services.quiz_service import QuizService
+
+class InlineSearchService:
+    
+    def __init__(
+        self,
+        quiz_service: QuizService,
+        debounce: float = 0.3,
+        cache_size: int = 1024,
+        cache_ttl: float = 60.0,
+        cache_time: int = 300,
+        limit: int = 20
+    ) -> None:
+        self._quiz_service: QuizService = quiz_service
+        self._debounce: float = debounce
+        self._limit: int = limit
+        self._latest: dict[int, str] = {}
+        
+        self.cache: LRUCache = LRUCache(
+            "inline_search",
+            maxsize=cache_size,
+            ttl=cache_ttl
+        )
+        self.cache_time: int = cache_time
+        self.superseded: int = 0
+    
+    async def search(
+        self,
+        user_id: int,
+        query_id: str,
+        text: str
+    ) -> Optional[list[dict]]:
+        key = " ".join(text.lower().split())
+        
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        if self._debounce > 0:
+            self._latest[user_id] = query_id
+            await asyncio.sleep(self._debounce)
+            
+            if self._latest.get(user_id) != query_id:
+                self.superseded += 1
+                return None
+            
+            del self._latest[user_id]
+            
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        if key:
+            quizzes = await self._quiz_service.search_quizzes(key, self._limit)
+        else:
+            pagination = await self._quiz_service.get_quizzes_paginated(
+                page=1,
+                page_size=self._limit
+            )
+            quizzes = pagination['quizzes']
+            
+        self.cache.set(key, quizzes)
+        
+        return quizzes
\ No newline at end of file
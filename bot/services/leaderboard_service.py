@@ -0,0 +1,237 @@
+from typing import Callable, Optional
+
+from bot.cache import LRUCache
+from bot.logger import get_logger
+from bot.repositories.leaderboard_repository import LeaderboardRepository
+
+logger = get_logger(__name__)
+
+MEDALS = ("🥇", "🥈", "🥉")
+
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}:{seconds:02d}"
+
+def format_place(index: int) -> str:
+    return MEDALS[index] if index < len(MEDALS) else f"{index + 1}."
+
+def quiz_rank(entry: dict) -> tuple:
+    return (
+        -entry['percentage'],
+        entry['duration_seconds'],
+        entry['telegram_id']
+    )
+
+def global_rank(entry: dict) -> tuple:
+    return (-entry['points'], entry['telegram_id'])
+
+class LeaderboardService:
+    
+    def __init__(
+        self,
+        leaderboard_repository: LeaderboardRepository,
+        size: int = 10,
+        max_quizzes: int = 256
+    ) -> None:
+        self._leaderboard_repository: LeaderboardRepository = (
+            leaderboard_repository
+        )
+        self._size: int = size
+        self._global: Optional[dict] = None
+        self._version: int = 0
+        self._last_attempt_id: Optional[int] = None
+        
+        self.cache: LRUCache = LRUCache("leaderboard", maxsize=max_quizzes)
+    
+    def apply(
+        self,
+        attempts: list[tuple],
+        scores: list[tuple],
+        last_attempt_id: int
+    ) -> None:
+        self._version += 1
+        
+        if self._last_attempt_id == last_attempt_id - len(attempts):
+            self._last_attempt_id = last_attempt_id
+        
+        for attempt in attempts:
+            board = self.cache.peek(attempt[1])
+            
+            if board is None:
+                continue
+            
+            entry = {
+                'telegram_id': attempt[0],
+                'correct_answers': attempt[2],
+                'percentage': attempt[4],
+                'duration_seconds': attempt[5]
+            }
+            current = self._find(board, entry['telegram_id'])
+            
+            if current is None or quiz_rank(entry) < quiz_rank(current):
+                self._insert(board, entry, quiz_rank)
+                
+        if self._global is None:
+            return
+        
+        for telegram_id, points, quizzes in scores:
+            entry = {
+                'telegram_id': telegram_id,
+                'points': points,
+                'quizzes': quizzes
+            }
+            
+            if self._find(self._global, telegram_id) != entry:
+                self._insert(self._global, entry, global_rank)
+    
+    async def get_quiz_leaderboard(self, quiz_id: int) -> Optional[str]:
+        await self._sync()
+        board = self.cache.get(quiz_id)
+        
+        if board is None:
+            version = self._version
+            board = await self._leaderboard_repository.get_quiz_top(
+                quiz_id,
+                self._size
+            )
+            
+            if board is None:
+                return None
+            
+            board['text'] = None
+            if version == self._version:
+                self.cache.set(quiz_id, board)
+                
+        if board['text'] is not None:
+            return board['text']
+        
+        return await self._render(board, self._render_quiz)
+    
+    async def get_global_leaderboard(self) -> str:
+        await self._sync()
+        board = self._global
+        
+        if board is None:
+            version = self._version
+            board = {
+                'entries': await self._leaderboard_repository.get_global_top(
+                    self._size
+                ),
+                'text': None
+            }
+            
+            if version == self._version:
+                self._global = board
+                
+        if board['text'] is not None:
+            return board['text']
+        
+        return await self._render(board, self._render_global)
+    
+    async def _sync(self) -> None:
+        last_attempt_id = (
+            await self._leaderboard_repository.get_last_attempt_id()
+        )
+        
+        if last_attempt_id == self._last_attempt_id:
+            return
+        
+        if self._last_attempt_id is not None:
+            logger.debug(
+                f"Attempts written elsewhere up to id={last_attempt_id}, "
+                f"dropping cached leaderboards"
+            )
+            
+        self._version += 1
+        self._last_attempt_id = last_attempt_id
+        self._global = None
+        self.cache.clear()
+    
+    def _find(self, board: dict, telegram_id: int) -> Optional[dict]:
+        for entry in board['entries']:
+            if entry['telegram_id'] == telegram_id:
+                return entry
+        
+        return None
+    
+    def _insert(
+        self,
+        board: dict,
+        entry: dict,
+        rank: Callable[[dict], tuple]
+    ) -> None:
+        entries = [
+            current for current in board['entries']
+            if current['telegram_id'] != entry['telegram_id']
+        ]
+        entries.append(entry)
+        entries.sort(key=rank)
+        
+        if len(entries) > self._size:
+            if entries[self._size] is entry:
+                return
+            del entries[self._size:]
+            
+        board['entries'] = entries
+        board['text'] = None
+    
+    async def _render(
+        self,
+        board: dict,
+        render: Callable[[dict, list[dict], dict[int, str]], str]
+    ) -> str:
+        entries = board['entries']
+        names = await self._leaderboard_repository.get_player_names(
+            [entry['telegram_id'] for entry in entries]
+        )
+        text = render(board, entries, names)
+        
+        if board['entries'] is entries:
+            board['text'] = text
+            
+        return text
+    
+    def _render_quiz(
+        self,
+        board: dict,
+        entries: list[dict],
+        names: dict[int, str]
+    ) -> str:
+        if not entries:
+            return (
+                f"🏆 Рейтинг квиза «{board['title']}»\n\n"
+                f"Пока никто не прошел этот квиз."
+            )
+            
+        lines = [f"🏆 Рейтинг квиза «{board['title']}»\n"]
+        
+        for index, entry in enumerate(entries):
+            lines.append(
+                f"{format_place(index)} "
+                f"{names.get(entry['telegram_id'], 'Игрок')} — "
+                f"✅ {entry['correct_answers']} "
+                f"({entry['percentage']}%), "
+                f"⏱ {format_duration(entry['duration_seconds'])}"
+            )
+            
+        return "\n".join(lines)
+    
+    def _render_global(
+        self,
+        board: dict,
+        entries: list[dict],
+        names: dict[int, str]
+    ) -> str:
+        if not entries:
+            return "🏆 Общий рейтинг\n\nПока нет ни одного результата."
+        
+        lines = ["🏆 Общий рейтинг\n"]
+        
+        for index, entry in enumerate(entries):
+            lines.append(
+                f"{format_place(index)} "
+                f"{names.get(entry['telegram_id'], 'Игрок')} — "
+                f"⭐ {entry['points']}, квизов: {entry['quizzes']}"
+            )
+            
+        return "\n".join(lines)
\ No newline at end of file
@@ -1,11 +1,48 @@
+import asyncio
+from collections import Counter
 from typing import Optional
 
 import aiosqlite
 
+from bot.cache import LRUCache
 from bot.database.connection import DatabaseConnection
+from bot.logger import get_logger
 from bot.repositories.answer_repository import AnswerRepository
 from bot.repositories.question_repository import QuestionRepository
 from bot.repositories.quiz_repository import QuizRepository
+from bot.repositories.quiz_stats_repository import QuizStatsRepository
+
+logger = get_logger(__name__)
+
+def validate_quiz(title: str, questions_data: list[dict]) -> None:
+    if not title or not title.strip():
+        raise ValueError("Quiz title cannot be empty")
+    
+    if not questions_data:
+        raise ValueError("Quiz must have at least one question")
+    
+    for idx, question in enumerate(questions_data, 1):
+        if not question.get('text') or not question['text'].strip():
+            raise ValueError(
+                f"Question {idx} text cannot be empty"
+            )
+        
+        answers = question.get('answers', [])
+        if len(answers) < 2:
+            raise ValueError(
+                f"Question {idx} must have at least 2 answers"
+            )
+        if len(answers) > 6:
+            raise ValueError(
+                f"Question {idx} cannot have more than 6 answers"
+            )
+        
+        correct_answer = question.get('correct_answer', 0)
+        if correct_answer < 1 or correct_answer > len(answers):
+            raise ValueError(
+                f"Question {idx} correct_answer must be between "
+                f"1 and {len(answers)}"
+            )
 
 class QuizService:
     
@@ -14,13 +51,78 @@ class QuizService:
         quiz_repository: QuizRepository,
         question_repository: QuestionRepository,
         answer_repository: AnswerRepository,
-        db_path: str
+        quiz_stats_repository: QuizStatsRepository,
+        db_path: str,
+        question_cache_size: int = 4096,
+        question_window: int = 5,
+        catalogue_cache_ttl: float = 30.0,
+        starts_flush_interval: float = 10.0
     ) -> None:
+        if question_window < 1:
+            raise ValueError("question_window must be positive integer")
+        
         self._quiz_repository: QuizRepository = quiz_repository
         self._question_repository: QuestionRepository = question_repository
         self._answer_repository: AnswerRepository = answer_repository
+        self._quiz_stats_repository: QuizStatsRepository = (
+            quiz_stats_repository
+        )
         self._db_path: str = db_path
+        self._question_window: int = question_window
+        self._question_cache: LRUCache = LRUCache(
+            "question",
+            question_cache_size
+        )
+        self._catalogue_cache: LRUCache = LRUCache(
+            "catalogue",
+            maxsize=64,
+            ttl=catalogue_cache_ttl
+        )
+        self._starts_flush_interval: float = starts_flush_interval
+        self._pending_starts: Counter = Counter()
+        self._flush_task: Optional[asyncio.Task] = None
 
+    @property
+    def caches(self) -> list[LRUCache]:
+        return [self._question_cache, self._catalogue_cache]
+    
+    async def start(self) -> None:
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+    
+    async def stop(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+            
+        await self.flush_starts()
+    
+    def record_start(self, quiz_id: int) -> None:
+        self._pending_starts[quiz_id] += 1
+    
+    async def flush_starts(self) -> None:
+        if not self._pending_starts:
+            return
+        
+        starts = dict(self._pending_starts)
+        self._pending_starts.clear()
+        
+        try:
+            await self._quiz_stats_repository.add_starts(starts)
+        except Exception as e:
+            self._pending_starts.update(starts)
+            logger.error(f"Failed to flush quiz start counts: {e}")
+    
+    async def get_most_started_quiz_ids(self, limit: int) -> list[int]:
+        return await self._quiz_stats_repository.get_most_started_ids(limit)
+    
+    async def search_quizzes(self, text: str, limit: int = 10) -> list[dict]:
+        if not text or not text.strip():
+            raise ValueError("Search query cannot be empty")
+        
+        return await self._quiz_repository.search(text, limit)
+    
     async def get_available_quizzes(self) -> list[dict]:
         return await self._quiz_repository.get_all_quizzes()
     
@@ -29,33 +131,57 @@ class QuizService:
         page: int = 1,
         page_size: int = 6
     ) -> dict:
-        return await self._quiz_repository.get_quizzes_paginated(
+        cached = self._catalogue_cache.get((page, page_size))
+        if cached is not None:
+            return cached
+        
+        pagination = await self._quiz_repository.get_quizzes_paginated(
             page,
             page_size
         )
+        self._catalogue_cache.set((page, page_size), pagination)
+        
+        return pagination
 
-    async def get_quiz_with_questions(self, quiz_id: int) -> Optional[dict]:
+    async def get_quiz_summary(self, quiz_id: int) -> Optional[dict]:
         if quiz_id <= 0:
             raise ValueError("quiz_id must be positive integer")
         
-        quiz = await self._quiz_repository.get_quiz_by_id(quiz_id)
+        return await self._quiz_repository.get_quiz_summary(quiz_id)
+    
+    async def get_question(
+        self,
+        quiz_id: int,
+        position: int
+    ) -> Optional[dict]:
+        if quiz_id <= 0 or position <= 0:
+            raise ValueError("quiz_id and position must be positive integers")
         
-        if quiz is None:
+        cached = self._question_cache.get((quiz_id, position))
+        if cached is not None:
+            return cached
+        
+        questions = await self._question_repository.get_questions_window(
+            quiz_id,
+            position,
+            self._question_window
+        )
+        
+        if not questions:
             return None
         
-        questions = await self._question_repository.get_questions_by_quiz_id(
-            quiz_id
+        answers = await self._answer_repository.get_answers_by_question_ids(
+            [question['id'] for question in questions]
         )
         
         for question in questions:
-            answers = await self._answer_repository.get_answers_by_question_id(
-                question['id']
-            )
-            question['answers'] = answers
+            question['answers'] = answers[question['id']]
+            self._question_cache.set((quiz_id, question['position']), question)
         
-        quiz['questions'] = questions
+        if questions[0]['position'] != position:
+            return None
         
-        return quiz
+        return questions[0]
 
     async def create_quiz_with_questions(
         self,
@@ -63,41 +189,15 @@ class QuizService:
         creator_id: int,
         questions_data: list[dict]
     ) -> int:
-        if not title or not title.strip():
-            raise ValueError("Quiz title cannot be empty")
+        validate_quiz(title, questions_data)
         
         if creator_id <= 0:
             raise ValueError("creator_id must be positive integer")
         
-        if not questions_data:
-            raise ValueError("Quiz must have at least one question")
-        
-        for idx, question in enumerate(questions_data, 1):
-            if not question.get('text') or not question['text'].strip():
-                raise ValueError(
-                    f"Question {idx} text cannot be empty"
-                )
-            
-            answers = question.get('answers', [])
-            if len(answers) < 2:
-                raise ValueError(
-                    f"Question {idx} must have at least 2 answers"
-                )
-            if len(answers) > 6:
-                raise ValueError(
-                    f"Question {idx} cannot have more than 6 answers"
-                )
-            
-            correct_answer = question.get('correct_answer', 0)
-            if correct_answer < 1 or correct_answer > len(answers):
-                raise ValueError(
-                    f"Question {idx} correct_answer must be between "
-                    f"1 and {len(answers)}"
-                )
-        
         async with DatabaseConnection(self._db_path) as conn:
             cursor = await conn.execute(
                 """
+                -- quiz_service.insert_quiz
                 INSERT INTO quizzes (title, creator_id)
                 VALUES (?, ?)
                 """,
@@ -112,6 +212,7 @@ class QuizService:
             for position, question_data in enumerate(questions_data, 1):
                 question_cursor = await conn.execute(
                     """
+                    -- quiz_service.insert_question
                     INSERT INTO questions 
                     (quiz_id, text, position, correct_answer)
                     VALUES (?, ?, ?, ?)
@@ -136,6 +237,7 @@ class QuizService:
                 ):
                     await conn.execute(
                         """
+                        -- quiz_service.insert_answer
                         INSERT INTO answers 
                         (question_id, text, position)
                         VALUES (?, ?, ?)
@@ -143,8 +245,26 @@ class QuizService:
                         (question_id, answer_text.strip(), answer_pos)
                     )
             
+            await conn.execute(
+                """
+                -- quiz_service.index_quiz
+                INSERT INTO quiz_search (rowid, title, questions)
+                VALUES (?, ?, ?)
+                """,
+                (
+                    quiz_id,
+                    title.strip(),
+                    " ".join(
+                        question['text'].strip()
+                        for question in questions_data
+                    )
+                )
+            )
+            
             await conn.commit()
             
+            self._catalogue_cache.clear()
+            
             return quiz_id
 
     async def calculate_quiz_result(
@@ -190,4 +310,9 @@ class QuizService:
             'total_questions': total_questions,
             'correct_answers': correct_count,
             'percentage': round(percentage, 2)
-        }
\ No newline at end of file
+        }
+    
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._starts_flush_interval)
+            await self.flush_starts()
\ No newline at end of file
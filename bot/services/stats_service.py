@@ -0,0 +1,142 @@
+import asyncio
+import os
+import resource
+import time
+from collections import deque
+from typing import Callable, Optional
+
+from bot.cache import LRUCache
+from bot.database.query_stats import query_stats
+from bot.logger import get_logger
+from bot.monitoring.loop_monitor import LoopLagMonitor
+from bot.monitoring.metrics import QUIZ_FINISHES, QUIZ_STARTS
+from bot.monitoring.outbound import outbound_tracker
+
+logger = get_logger(__name__)
+
+def get_memory_usage() -> int:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+class StatsService:
+    
+    def __init__(
+        self,
+        sessions: dict[str, Callable[[], int]],
+        caches: list[LRUCache],
+        loop_monitor: Optional[LoopLagMonitor] = None,
+        refresh_interval: float = 15.0,
+        window: float = 60.0
+    ) -> None:
+        self._sessions: dict[str, Callable[[], int]] = sessions
+        self._caches: list[LRUCache] = caches
+        self._loop_monitor: Optional[LoopLagMonitor] = loop_monitor
+        self._refresh_interval: float = refresh_interval
+        self._window: float = window
+        self._samples: deque[tuple[float, float, float]] = deque()
+        self._task: Optional[asyncio.Task] = None
+        self._aggregates: dict = {}
+    
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        
+        self.refresh()
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+    
+    def refresh(self) -> None:
+        now = time.monotonic()
+        latest = (
+            now,
+            QUIZ_STARTS.labels().get(),
+            QUIZ_FINISHES.labels().get()
+        )
+        self._samples.append(latest)
+        
+        while (
+            len(self._samples) > 2
+            and self._samples[1][0] <= now - self._window
+        ):
+            self._samples.popleft()
+            
+        oldest = self._samples[0]
+        
+        self._aggregates = {
+            'refreshed_at': time.time(),
+            'starts_per_minute': self._rate(oldest, latest, 1),
+            'finishes_per_minute': self._rate(oldest, latest, 2),
+            'db_p95_ms': round(query_stats.percentile(0.95) * 1000, 2),
+            'memory_bytes': get_memory_usage()
+        }
+    
+    def snapshot(self) -> dict:
+        if not self._aggregates:
+            self.refresh()
+            
+        return {
+            **self._aggregates,
+            'sessions': {
+                name: count() for name, count in self._sessions.items()
+            },
+            'caches': {
+                cache.name: {
+                    'size': len(cache),
+                    'hit_rate': (
+                        cache.hits / (cache.hits + cache.misses)
+                        if cache.hits + cache.misses else None
+                    )
+                }
+                for cache in self._caches
+            },
+            'outbound_in_flight': outbound_tracker.in_flight,
+            'loop_lag': self._loop_lag()
+        }
+    
+    def _loop_lag(self) -> Optional[dict]:
+        if self._loop_monitor is None:
+            return None
+        
+        reports = self._loop_monitor.reports
+        last_block = reports[-1] if reports else None
+        
+        return {
+            **self._loop_monitor.snapshot(),
+            'running': self._loop_monitor.running,
+            'last_block_at': last_block.timestamp if last_block else None,
+            'last_block_ms': round(last_block.lag * 1000, 2)
+            if last_block else None
+        }
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._refresh_interval)
+            
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Failed to refresh stats: {e}", exc_info=True)
+    
+    def _rate(
+        self,
+        oldest: tuple[float, float, float],
+        latest: tuple[float, float, float],
+        index: int
+    ) -> Optional[float]:
+        elapsed = latest[0] - oldest[0]
+        
+        if elapsed <= 0:
+            return None
+        
+        return round((latest[index] - oldest[index]) * 60 / elapsed, 2)
\ No newline at end of file
@@ -0,0 +1,102 @@
+import asyncio
+import time
+from typing import Optional
+
+from bot.database.connection import DatabaseConnection
+from bot.logger import get_logger
+from bot.services.quiz_service import QuizService
+
+logger = get_logger(__name__)
+
+WARMUP_TABLES = ("quizzes", "questions", "answers", "users")
+
+class WarmupService:
+    
+    def __init__(
+        self,
+        quiz_service: QuizService,
+        db_path: str,
+        catalogue_pages: int = 3,
+        top_quizzes: int = 20,
+        page_size: int = 6
+    ) -> None:
+        self._quiz_service: QuizService = quiz_service
+        self._db_path: str = db_path
+        self._catalogue_pages: int = catalogue_pages
+        self._top_quizzes: int = top_quizzes
+        self._page_size: int = page_size
+        self._task: Optional[asyncio.Task] = None
+        
+        self.result: Optional[dict] = None
+    
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+    
+    async def warm_up(self) -> dict:
+        started = time.perf_counter()
+        
+        rows = await self._touch_tables()
+        
+        pages = 0
+        for page in range(1, self._catalogue_pages + 1):
+            pagination = await self._quiz_service.get_quizzes_paginated(
+                page,
+                self._page_size
+            )
+            pages += 1
+            
+            if not pagination['has_next']:
+                break
+        
+        quizzes = 0
+        if self._top_quizzes > 0:
+            quiz_ids = await self._quiz_service.get_most_started_quiz_ids(
+                self._top_quizzes
+            )
+            for quiz_id in quiz_ids:
+                if await self._quiz_service.get_question(quiz_id, 1):
+                    quizzes += 1
+                    
+        return {
+            'rows': rows,
+            'catalogue_pages': pages,
+            'quizzes': quizzes,
+            'duration_ms': (time.perf_counter() - started) * 1000
+        }
+    
+    async def _run(self) -> None:
+        try:
+            self.result = await self.warm_up()
+        except Exception as e:
+            logger.error(f"Cache warm-up failed: {e}", exc_info=True)
+            return
+        
+        logger.info(
+            f"Cache warm-up finished in {self.result['duration_ms']:.0f} ms: "
+            f"{self.result['catalogue_pages']} catalogue pages, "
+            f"{self.result['quizzes']} top quizzes, "
+            f"{sum(self.result['rows'].values())} table rows touched"
+        )
+    
+    async def _touch_tables(self) -> dict[str, int]:
+        rows: dict[str, int] = {}
+        
+        async with DatabaseConnection(self._db_path) as conn:
+            for table in WARMUP_TABLES:
+                cursor = await conn.execute(
+                    f"-- warmup.touch_{table}\n"
+                    f"SELECT COUNT(*) FROM {table} NOT INDEXED"
+                )
+                row = await cursor.fetchone()
+                rows[table] = row[0]
+                
+        return rows
\ No newline at end of file
@@ -0,0 +1,6 @@
+from bot.sharding.supervisor import Supervisor, get_shard_key
+
+__all__ = [
+    "Supervisor",
+    "get_shard_key",
+]
\ No newline at end of file
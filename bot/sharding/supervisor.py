@@ -0,0 +1,351 @@
+import asyncio
+import multiprocessing
+import signal
+import time
+from multiprocessing.process import BaseProcess
+from multiprocessing.queues import Queue
+from typing import Any, Optional
+
+import aiohttp
+from aiohttp import web
+from aiogram.client.telegram import PRODUCTION, TelegramAPIServer
+
+from bot.logger import get_logger
+from bot.monitoring.metrics import SUPERVISOR_RESTARTS, SUPERVISOR_UPDATES
+from bot.monitoring.server import start_monitoring_server
+from bot.sharding.worker import run_worker
+
+logger = get_logger(__name__)
+
+def get_shard_key(update: dict[str, Any]) -> int:
+    for key, payload in update.items():
+        if key == "update_id" or not isinstance(payload, dict):
+            continue
+        
+        user = payload.get("from") or payload.get("user")
+        if user:
+            return user["id"]
+        
+        chat = payload.get("chat")
+        if chat:
+            return chat["id"]
+    
+    return 0
+
+class Supervisor:
+    
+    def __init__(
+        self,
+        bot_token: str,
+        database_path: str,
+        workers: int,
+        allowed_updates: list[str],
+        polling_timeout: int = 10,
+        shutdown_timeout: float = 30.0,
+        api_server: TelegramAPIServer = PRODUCTION,
+        webhook_url: Optional[str] = None,
+        webhook_path: str = "/webhook",
+        webhook_host: str = "0.0.0.0",
+        webhook_port: int = 8080,
+        webhook_secret: Optional[str] = None,
+        metrics_host: str = "0.0.0.0",
+        metrics_port: Optional[int] = None
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be positive integer")
+        
+        self._bot_token: str = bot_token
+        self._database_path: str = database_path
+        self._workers: int = workers
+        self._allowed_updates: list[str] = allowed_updates
+        self._polling_timeout: int = polling_timeout
+        self._shutdown_timeout: float = shutdown_timeout
+        self._api_server: TelegramAPIServer = api_server
+        self._webhook_url: Optional[str] = webhook_url
+        self._webhook_path: str = webhook_path
+        self._webhook_host: str = webhook_host
+        self._webhook_port: int = webhook_port
+        self._webhook_secret: Optional[str] = webhook_secret
+        self._metrics_host: str = metrics_host
+        self._metrics_port: Optional[int] = metrics_port
+        
+        self._context = multiprocessing.get_context("spawn")
+        self._queues: list[Queue] = [
+            self._context.Queue() for _ in range(workers)
+        ]
+        self._processes: list[Optional[BaseProcess]] = [None] * workers
+        self._restarting: set[int] = set()
+        self._restarts: list[int] = [0] * workers
+        self._stopping: bool = False
+        self._ingestion: Optional[asyncio.Task] = None
+        self._started_at: float = time.time()
+        self._shard_counters = [
+            SUPERVISOR_UPDATES.labels(str(index)) for index in range(workers)
+        ]
+    
+    def routes(self) -> list[web.RouteDef]:
+        return [
+            web.get("/health/live", self.handle_live),
+            web.get("/health/ready", self.handle_ready)
+        ]
+    
+    async def handle_live(self, request: web.Request) -> web.Response:
+        alive, report = self.liveness()
+        return web.json_response(report, status=200 if alive else 503)
+    
+    async def handle_ready(self, request: web.Request) -> web.Response:
+        ready, report = self.readiness()
+        return web.json_response(report, status=200 if ready else 503)
+    
+    def liveness(self) -> tuple[bool, dict]:
+        workers = self._workers_report()
+        ingesting = self._ingestion is not None and not self._ingestion.done()
+        alive = ingesting and all(
+            worker['alive'] or worker['restarting'] for worker in workers
+        )
+        
+        return alive, {
+            'status': "ok" if alive else "failing",
+            'uptime_s': round(time.time() - self._started_at, 1),
+            'ingesting': ingesting,
+            'workers': workers
+        }
+    
+    def readiness(self) -> tuple[bool, dict]:
+        alive, report = self.liveness()
+        ready = alive and all(
+            worker['alive'] and not worker['restarting']
+            for worker in report['workers']
+        )
+        report['status'] = "ok" if ready else "degraded"
+        
+        return ready, report
+    
+    def _workers_report(self) -> list[dict]:
+        return [
+            {
+                'index': index,
+                'pid': process.pid if process is not None else None,
+                'alive': process is not None and process.is_alive(),
+                'restarting': index in self._restarting,
+                'restarts': self._restarts[index]
+            }
+            for index, process in enumerate(self._processes)
+        ]
+    
+    def get_shard(self, update: dict[str, Any]) -> int:
+        return hash(get_shard_key(update)) % self._workers
+    
+    def dispatch(self, update: dict[str, Any]) -> None:
+        shard = self.get_shard(update)
+        self._shard_counters[shard].inc()
+        self._queues[shard].put(update)
+    
+    def start_worker(self, index: int) -> None:
+        process = self._context.Process(
+            target=run_worker,
+            args=(index, self._database_path, self._queues[index]),
+            name=f"quiz-bot-worker-{index}",
+            daemon=True
+        )
+        process.start()
+        self._processes[index] = process
+        
+        logger.info(f"Worker {index} spawned: pid={process.pid}")
+    
+    async def stop_worker(self, index: int) -> None:
+        process = self._processes[index]
+        
+        if process is None:
+            return
+        
+        if process.is_alive():
+            self._queues[index].put(None)
+            await asyncio.to_thread(process.join, self._shutdown_timeout)
+            
+        if process.is_alive():
+            logger.warning(
+                f"Worker {index} did not stop in "
+                f"{self._shutdown_timeout}s, terminating"
+            )
+            process.terminate()
+            await asyncio.to_thread(process.join)
+            
+        self._processes[index] = None
+    
+    async def restart_worker(self, index: int) -> None:
+        if index in self._restarting:
+            return
+        
+        self._restarting.add(index)
+        
+        try:
+            logger.info(f"Restarting worker {index}")
+            SUPERVISOR_RESTARTS.labels(str(index)).inc()
+            self._restarts[index] += 1
+            await self.stop_worker(index)
+            
+            if not self._stopping:
+                self.start_worker(index)
+        finally:
+            self._restarting.discard(index)
+    
+    async def rolling_restart(self) -> None:
+        for index in range(self._workers):
+            await self.restart_worker(index)
+    
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stop_event = asyncio.Event()
+        
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop_event.set)
+        loop.add_signal_handler(
+            signal.SIGHUP,
+            lambda: asyncio.ensure_future(self.rolling_restart())
+        )
+        
+        monitoring = None
+        if self._metrics_port is not None:
+            monitoring = await start_monitoring_server(
+                self._metrics_host,
+                self._metrics_port,
+                self.routes()
+            )
+        
+        for index in range(self._workers):
+            self.start_worker(index)
+            
+        if self._webhook_url:
+            ingestion = asyncio.create_task(self._serve_webhook())
+        else:
+            ingestion = asyncio.create_task(self._poll())
+        self._ingestion = ingestion
+        monitor = asyncio.create_task(self._monitor())
+        
+        logger.info(
+            f"Supervisor started with {self._workers} workers, "
+            f"receiving updates via "
+            f"{'webhook' if self._webhook_url else 'polling'}..."
+        )
+        
+        try:
+            await stop_event.wait()
+        finally:
+            self._stopping = True
+            ingestion.cancel()
+            monitor.cancel()
+            await asyncio.gather(ingestion, monitor, return_exceptions=True)
+            
+            await asyncio.gather(*(
+                self.stop_worker(index) for index in range(self._workers)
+            ))
+            
+            for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP):
+                loop.remove_signal_handler(sig)
+            
+            if monitoring is not None:
+                await monitoring.cleanup()
+                
+            logger.info("Supervisor shutdown complete")
+    
+    async def _monitor(self) -> None:
+        while not self._stopping:
+            await asyncio.sleep(1)
+            
+            for index, process in enumerate(self._processes):
+                if index in self._restarting or process is None:
+                    continue
+                
+                if not process.is_alive():
+                    logger.warning(
+                        f"Worker {index} exited with code "
+                        f"{process.exitcode}, respawning"
+                    )
+                    SUPERVISOR_RESTARTS.labels(str(index)).inc()
+                    self._restarts[index] += 1
+                    self.start_worker(index)
+    
+    async def _serve_webhook(self) -> None:
+        async def handle_update(request: web.Request) -> web.Response:
+            if self._webhook_secret and request.headers.get(
+                "X-Telegram-Bot-Api-Secret-Token"
+            ) != self._webhook_secret:
+                return web.Response(status=401)
+            
+            self.dispatch(await request.json())
+            return web.Response()
+        
+        app = web.Application()
+        app.router.add_post(self._webhook_path, handle_update)
+        
+        runner = web.AppRunner(app)
+        await runner.setup()
+        
+        try:
+            site = web.TCPSite(runner, self._webhook_host, self._webhook_port)
+            await site.start()
+            
+            payload: dict[str, Any] = {
+                "url": self._webhook_url,
+                "allowed_updates": self._allowed_updates
+            }
+            if self._webhook_secret:
+                payload["secret_token"] = self._webhook_secret
+                
+            url = self._api_server.api_url(
+                token=self._bot_token,
+                method="setWebhook"
+            )
+            async with aiohttp.ClientSession() as session:
+                async with session.post(url, json=payload) as response:
+                    body = await response.json()
+                    
+            if not body.get("ok"):
+                logger.error(
+                    f"setWebhook rejected: {body.get('description')}"
+                )
+                
+            await asyncio.Event().wait()
+        finally:
+            await runner.cleanup()
+    
+    async def _poll(self) -> None:
+        url = self._api_server.api_url(
+            token=self._bot_token,
+            method="getUpdates"
+        )
+        timeout = aiohttp.ClientTimeout(total=self._polling_timeout + 10)
+        offset: Optional[int] = None
+        
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            while True:
+                payload: dict[str, Any] = {
+                    "timeout": self._polling_timeout,
+                    "allowed_updates": self._allowed_updates
+                }
+                if offset is not None:
+                    payload["offset"] = offset
+                    
+                try:
+                    async with session.post(url, json=payload) as response:
+                        body = await response.json()
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.warning(f"getUpdates failed: {e}")
+                    await asyncio.sleep(1)
+                    continue
+                
+                if not body.get("ok"):
+                    retry_after = body.get("parameters", {}).get(
+                        "retry_after",
+                        1
+                    )
+                    logger.warning(
+                        f"getUpdates rejected: {body.get('description')}"
+                    )
+                    await asyncio.sleep(retry_after)
+                    continue
+                
+                for update in body["result"]:
+                    offset = update["update_id"] + 1
+                    self.dispatch(update)
\ No newline at end of file
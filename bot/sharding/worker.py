@@ -0,0 +1,85 @@
+import asyncio
+import signal
+from multiprocessing.queues import Queue
+from typing import Any
+
+from aiogram import Bot, Dispatcher
+
+from bot.app import create_bot, create_dispatcher
+from bot.config import get_config
+from bot.logger import setup_logging, shutdown_logging, get_logger
+from bot.monitoring.server import start_monitoring_server
+
+logger = get_logger(__name__)
+
+def run_worker(index: int, database_path: str, queue: Queue) -> None:
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    config = get_config()
+    setup_logging(
+        log_level=config.log_level,
+        log_format=config.log_format,
+        log_file=f"bot.worker-{index}.log",
+        max_bytes=config.log_max_bytes,
+        backup_count=config.log_backup_count,
+        queue_size=config.log_queue_size
+    )
+    
+    try:
+        asyncio.run(_serve(index, database_path, queue))
+    finally:
+        shutdown_logging()
+
+async def _serve(index: int, database_path: str, queue: Queue) -> None:
+    config = get_config()
+    bot = create_bot(config.bot_token, config.telegram_api_url)
+    dp = create_dispatcher(database_path)
+    loop = asyncio.get_running_loop()
+    tasks: set[asyncio.Task] = set()
+    
+    monitoring = None
+    if config.metrics_enabled:
+        monitoring = await start_monitoring_server(
+            config.metrics_host,
+            config.metrics_port + 1 + index,
+            routes=dp["health"].routes()
+        )
+    
+    try:
+        await dp.emit_startup(bot=bot)
+        
+        logger.info(f"Worker {index} started")
+        
+        while True:
+            update = await loop.run_in_executor(None, queue.get)
+            
+            if update is None:
+                break
+            
+            task = asyncio.create_task(_process_update(dp, bot, update))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            
+        if tasks:
+            logger.info(
+                f"Worker {index} draining {len(tasks)} in-flight updates"
+            )
+            await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        await dp.emit_shutdown(bot=bot)
+        if monitoring is not None:
+            await monitoring.cleanup()
+        await bot.session.close()
+        logger.info(f"Worker {index} stopped")
+
+async def _process_update(
+    dp: Dispatcher,
+    bot: Bot,
+    update: dict[str, Any]
+) -> None:
+    try:
+        await dp.feed_raw_update(bot, update)
+    except Exception as e:
+        logger.error(
+            f"Failed to process update {update.get('update_id')}: {e}",
+            exc_info=True
+        )
\ No newline at end of file
@@ -1,24 +1,177 @@
-import asyncio
-import aiosqlite
+import argparse
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Optional
 
-async def check_database():
-    db_path = "quiz_bot.db"
+from bot.config import config
+from bot.database.diagnostics import (
+    check_query_plans,
+    collect_statements,
+    get_analyze_freshness,
+    get_fragmentation,
+    get_index_usage,
+    get_object_sizes,
+    get_row_counts,
+    get_table_sizes
+)
+
+BOT_PACKAGE = Path(__file__).parent / "bot"
+
+FREELIST_VACUUM_PERCENT = 10.0
+
+def format_bytes(size: Optional[int]) -> str:
+    if size is None:
+        return "н/д"
+    
+    if size < 1024:
+        return f"{size} Б"
+    
+    for unit in ("КБ", "МБ", "ГБ"):
+        size /= 1024
+        if size < 1024 or unit == "ГБ":
+            return f"{size:.1f} {unit}"
+
+def print_tables(tables: list[dict]) -> None:
+    print("Таблицы:")
+    print(f"  {'таблица':<28} {'строк':>12} {'данные':>10} {'индексы':>10}")
+    
+    for table in tables:
+        print(
+            f"  {table['table']:<28} {table['rows']:>12} "
+            f"{format_bytes(table['bytes']):>10} "
+            f"{format_bytes(table['index_bytes']):>10}"
+        )
+
+def print_indexes(indexes: list[dict]) -> None:
+    print("\nИндексы:")
     
-    async with aiosqlite.connect(db_path) as db:
-        cursor = await db.execute(
-            "SELECT name FROM sqlite_master WHERE type='table'"
+    for index in indexes:
+        print(
+            f"  {index['name']} ON {index['table']}"
+            f"({', '.join(index['columns'])})"
+            f"{' UNIQUE' if index['unique'] else ''}, "
+            f"{format_bytes(index['bytes'])}"
         )
-        tables = await cursor.fetchall()
         
-        print(f"Таблицы в базе данных {db_path}:")
-        for table in tables:
-            print(f"  - {table[0]}")
+        if index['used_by']:
+            print(f"    используется: {', '.join(index['used_by'])}")
+        elif not index['name'].startswith("sqlite_autoindex_"):
+            print("    ⚠️ не встречается в планах запросов")
             
-            cursor = await db.execute(f"PRAGMA table_info({table[0]})")
-            columns = await cursor.fetchall()
-            print(f"    Колонки:")
-            for col in columns:
-                print(f"      {col[1]} ({col[2]})")
+        if index['redundant_with']:
+            print(f"    ⚠️ избыточен: покрывается {index['redundant_with']}")
+
+def print_fragmentation(fragmentation: dict) -> None:
+    print(
+        f"\nФрагментация: {fragmentation['page_count']} страниц по "
+        f"{fragmentation['page_size']} Б, свободных "
+        f"{fragmentation['freelist_count']} "
+        f"({fragmentation['free_percent']}%)"
+    )
+    
+    if fragmentation['free_percent'] > FREELIST_VACUUM_PERCENT:
+        print("  ⚠️ много свободных страниц, выполните VACUUM")
+        
+    for item in fragmentation['objects'][:5]:
+        print(
+            f"  {item['name']}: {item['unused_percent']}% "
+            f"неиспользуемого места в страницах"
+        )
+
+def print_statistics(freshness: list[dict]) -> None:
+    print("\nСтатистика планировщика (ANALYZE):")
+    
+    labels = {
+        'fresh': "актуальна",
+        'stale': "⚠️ устарела",
+        'missing': "⚠️ отсутствует",
+        'empty': "таблица пуста"
+    }
+    
+    for item in freshness:
+        estimate = (
+            f", в статистике {item['estimated_rows']}"
+            if item['estimated_rows'] is not None else ""
+        )
+        print(
+            f"  {item['table']}: {labels[item['status']]} "
+            f"(строк {item['rows']}{estimate})"
+        )
+        
+    if any(item['status'] in ("stale", "missing") for item in freshness):
+        print("  Выполните ANALYZE или PRAGMA optimize")
+
+def print_plans(results: list[dict], verbose: bool) -> int:
+    print("\nПланы запросов:")
+    failures = 0
+    
+    for result in results:
+        if not result['problems']:
+            print(f"  ✅ {result['name']}")
+        elif result['allowed']:
+            print(f"  ➖ {result['name']} - допускается: {result['allowed']}")
+        else:
+            print(f"  ❌ {result['name']}")
+            failures += 1
+            
+        
+        if verbose or (result['problems'] and not result['allowed']):
+            for detail in result['plan']:
+                print(f"      {detail}")
+                
+    print(
+        f"\nПроверено запросов: {len(results)}, "
+        f"с полным сканированием или временным B-деревом: {failures}"
+    )
+    
+    return failures
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Report table sizes, index usage, fragmentation, "
+                    "ANALYZE freshness and query plans"
+    )
+    parser.add_argument("--database", default=None)
+    parser.add_argument(
+        "--plans",
+        action="store_true",
+        help="Only check query plans, exit with 1 on a full scan or temp B-tree"
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print the plan of every statement"
+    )
+    return parser.parse_args()
+
+def check_database(args: argparse.Namespace) -> int:
+    db_path = args.database or config.database_path
+    
+    if not Path(db_path).exists():
+        print(f"База данных {db_path} не найдена")
+        return 1
+    
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    
+    try:
+        print(f"База данных {db_path}\n")
+        plans = check_query_plans(conn, collect_statements(BOT_PACKAGE))
+        
+        if not args.plans:
+            row_counts = get_row_counts(conn)
+            sizes = get_object_sizes(conn)
+            
+            print_tables(get_table_sizes(conn, row_counts, sizes))
+            print_indexes(get_index_usage(conn, plans, sizes))
+            print_fragmentation(get_fragmentation(conn, sizes))
+            print_statistics(get_analyze_freshness(conn, row_counts))
+            
+        failures = print_plans(plans, args.verbose)
+    finally:
+        conn.close()
+        
+    return 1 if failures else 0
 
 if __name__ == "__main__":
-    asyncio.run(check_database())
\ No newline at end of file
+    sys.exit(check_database(parse_args()))
\ No newline at end of file
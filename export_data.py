@@ -0,0 +1,77 @@
+import argparse
+import sys
+from datetime import date
+from typing import Optional
+
+from bot.config import config
+from bot.logger import setup_logging, get_logger
+from bot.services.export_service import (
+    EXPORT_FORMATS,
+    EXPORT_KINDS,
+    export_data
+)
+
+logger = get_logger(__name__)
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Stream quizzes or attempt results to JSONL or CSV"
+    )
+    parser.add_argument("kind", choices=EXPORT_KINDS)
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="jsonl")
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Output file, stdout by default"
+    )
+    parser.add_argument(
+        "--creator",
+        type=int,
+        default=None,
+        help="Only quizzes created by this Telegram ID and their results"
+    )
+    parser.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        default=None,
+        help="First day to include, YYYY-MM-DD"
+    )
+    parser.add_argument(
+        "--until",
+        type=date.fromisoformat,
+        default=None,
+        help="Last day to include, YYYY-MM-DD"
+    )
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--database", default=None)
+    return parser.parse_args()
+
+def main() -> None:
+    args = parse_args()
+    setup_logging(stream=sys.stderr)
+    
+    output: Optional[str] = args.output
+    handle = (
+        open(output, "w", encoding="utf-8", newline="") if output
+        else sys.stdout
+    )
+    
+    try:
+        count = export_data(
+            args.database or config.database_path,
+            args.kind,
+            handle,
+            args.format,
+            creator=args.creator,
+            since=args.since,
+            until=args.until,
+            chunk_size=args.chunk_size
+        )
+    finally:
+        if output:
+            handle.close()
+            
+    logger.info(f"Exported {count} {args.kind}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
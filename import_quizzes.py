@@ -0,0 +1,69 @@
+import argparse
+import asyncio
+import os
+from pathlib import Path
+
+from bot.config import config
+from bot.database.schema import init_db
+from bot.logger import setup_logging, get_logger
+from bot.repositories.user_repository import UserRepository
+from bot.services.import_service import QuizImporter, iter_csv, iter_jsonl
+from bot.services.user_service import UserService
+
+logger = get_logger(__name__)
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Stream quizzes from a JSONL or CSV file into the database"
+    )
+    parser.add_argument("path", type=Path)
+    parser.add_argument(
+        "--format",
+        choices=("jsonl", "csv"),
+        default=None,
+        help="Input format, detected from the file extension by default"
+    )
+    parser.add_argument(
+        "--creator",
+        type=int,
+        required=True,
+        help="Telegram ID of the user who will own the imported quizzes"
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--database", default=None)
+    return parser.parse_args()
+
+async def import_quizzes(args: argparse.Namespace) -> None:
+    setup_logging()
+    
+    db_path = args.database or config.database_path
+    input_format = args.format or args.path.suffix.lstrip(".").lower()
+    
+    if input_format not in ("jsonl", "csv"):
+        logger.error(f"Unknown input format: {args.path.suffix}")
+        return
+    
+    await init_db(db_path)
+    
+    creator = await UserService(UserRepository(db_path)).get_or_create_user(
+        telegram_id=args.creator,
+        username=None,
+        first_name=None
+    )
+    importer = QuizImporter(db_path, creator['id'], args.batch_size)
+    size = os.path.getsize(args.path) or 1
+    
+    with open(args.path, encoding="utf-8", newline="") as handle:
+        records = (
+            iter_jsonl(handle) if input_format == "jsonl"
+            else iter_csv(handle)
+        )
+        await importer.run(records, lambda: handle.buffer.tell() / size)
+        
+    logger.info(
+        f"Import finished: {importer.imported} imported, "
+        f"{importer.skipped} already present, {importer.invalid} invalid"
+    )
+
+if __name__ == "__main__":
+    asyncio.run(import_quizzes(parse_args()))
\ No newline at end of file
@@ -0,0 +1,9 @@
+from loadtest.fake_api import FakeTelegramServer
+from loadtest.mock_session import MockSession
+from loadtest.scenario import QuizScenario
+
+__all__ = [
+    "FakeTelegramServer",
+    "MockSession",
+    "QuizScenario",
+]
\ No newline at end of file
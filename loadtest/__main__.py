@@ -0,0 +1,73 @@
+import argparse
+import asyncio
+import json
+
+from bot.logger import setup_logging, get_logger
+from loadtest.fake_api import FakeTelegramServer
+from loadtest.scenario import QuizScenario
+
+logger = get_logger(__name__)
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Fake Telegram Bot API server with synthetic quiz users"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--think-time", type=float, default=2.0)
+    parser.add_argument("--ramp-up", type=float, default=10.0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default=None)
+    parser.add_argument(
+        "--serve-only",
+        action="store_true",
+        help="Only record calls, do not generate users"
+    )
+    return parser.parse_args()
+
+async def run(args: argparse.Namespace) -> None:
+    server = FakeTelegramServer(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.jitter_ms,
+        rate_limit_probability=args.rate_limit,
+        retry_after=args.retry_after
+    )
+    await server.start(args.host, args.port)
+    
+    try:
+        if args.serve_only:
+            await asyncio.Event().wait()
+            
+        logger.info("Waiting for the bot to call getUpdates or setWebhook...")
+        await server.bot_connected.wait()
+        
+        scenario = QuizScenario(
+            server,
+            users=args.users,
+            think_time=args.think_time,
+            ramp_up=args.ramp_up,
+            seed=args.seed
+        )
+        result = await scenario.run()
+        await asyncio.sleep(1)
+        
+        report = json.dumps(result, indent=2, ensure_ascii=False)
+        print(report)
+        
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                file.write(report)
+    finally:
+        await server.stop()
+
+if __name__ == "__main__":
+    setup_logging()
+    try:
+        asyncio.run(run(parse_args()))
+    except KeyboardInterrupt:
+        pass
\ No newline at end of file
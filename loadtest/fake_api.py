@@ -0,0 +1,330 @@
+import asyncio
+import json
+import random
+import time
+from collections import Counter, defaultdict
+from typing import Any, Optional
+
+import aiohttp
+from aiohttp import web
+
+from bot.logger import get_logger
+from loadtest.updates import (
+    BOT_USER,
+    make_callback_update,
+    make_message_update
+)
+
+logger = get_logger(__name__)
+
+RECORDED_METHODS = frozenset({
+    "sendMessage",
+    "editMessageText",
+    "answerCallbackQuery"
+})
+
+class RecordedCall:
+    
+    __slots__ = ("method", "params", "timestamp")
+    
+    def __init__(self, method: str, params: dict[str, Any]) -> None:
+        self.method: str = method
+        self.params: dict[str, Any] = params
+        self.timestamp: float = time.monotonic()
+
+class FakeTelegramServer:
+    
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        latency_jitter_ms: float = 0.0,
+        rate_limit_probability: float = 0.0,
+        retry_after: int = 1
+    ) -> None:
+        self.latency_ms: float = latency_ms
+        self.latency_jitter_ms: float = latency_jitter_ms
+        self.rate_limit_probability: float = rate_limit_probability
+        self.retry_after: int = retry_after
+        
+        self.calls: list[RecordedCall] = []
+        self.method_counts: Counter = Counter()
+        self.rate_limited: int = 0
+        self.webhook_url: Optional[str] = None
+        self.webhook_secret: Optional[str] = None
+        self.bot_connected: asyncio.Event = asyncio.Event()
+        
+        self._updates: list[dict[str, Any]] = []
+        self._updates_event: asyncio.Event = asyncio.Event()
+        self._next_update_id: int = 1
+        self._next_message_id: int = 1
+        self._replies: dict[int, asyncio.Queue] = defaultdict(asyncio.Queue)
+        self._pending_since: dict[int, float] = {}
+        self._response_latencies: list[float] = []
+        self._client: Optional[aiohttp.ClientSession] = None
+        self._runner: Optional[web.AppRunner] = None
+    
+    def build_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_route("*", "/bot{token}/{method}", self._handle)
+        return app
+    
+    async def start(self, host: str = "127.0.0.1", port: int = 8081) -> None:
+        self._client = aiohttp.ClientSession()
+        self._runner = web.AppRunner(self.build_app())
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        
+        logger.info(f"Fake Bot API listening on http://{host}:{port}")
+    
+    async def stop(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+    
+    async def push_update(self, update: dict[str, Any]) -> dict[str, Any]:
+        chat_id = self._get_chat_id(update)
+        if chat_id is not None:
+            self._pending_since.setdefault(chat_id, time.monotonic())
+            
+        if self.webhook_url is not None and self._client is not None:
+            headers = {}
+            if self.webhook_secret:
+                headers["X-Telegram-Bot-Api-Secret-Token"] = (
+                    self.webhook_secret
+                )
+            async with self._client.post(
+                self.webhook_url,
+                json=update,
+                headers=headers
+            ) as response:
+                await response.read()
+        else:
+            self._updates.append(update)
+            self._updates_event.set()
+            
+        return update
+    
+    async def push_message(self, user_id: int, text: str) -> dict[str, Any]:
+        return await self.push_update(make_message_update(
+            self._allocate_update_id(),
+            user_id,
+            text,
+            self._allocate_message_id()
+        ))
+    
+    async def push_callback(
+        self,
+        user_id: int,
+        data: str,
+        message_id: int
+    ) -> dict[str, Any]:
+        return await self.push_update(make_callback_update(
+            self._allocate_update_id(),
+            user_id,
+            data,
+            message_id
+        ))
+    
+    async def wait_for_reply(
+        self,
+        chat_id: int,
+        timeout: float = 30.0
+    ) -> dict[str, Any]:
+        return await asyncio.wait_for(self._replies[chat_id].get(), timeout)
+    
+    def summary(self) -> dict:
+        latencies = sorted(self._response_latencies)
+        
+        def percentile(value: float) -> Optional[float]:
+            if not latencies:
+                return None
+            index = min(len(latencies) - 1, int(len(latencies) * value))
+            return round(latencies[index] * 1000, 2)
+        
+        return {
+            'calls': dict(self.method_counts),
+            'rate_limited': self.rate_limited,
+            'responses': len(latencies),
+            'response_latency_ms': {
+                'p50': percentile(0.50),
+                'p95': percentile(0.95),
+                'p99': percentile(0.99)
+            }
+        }
+    
+    async def _handle(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        params = await self._read_params(request)
+        
+        if method in ("getUpdates", "setWebhook"):
+            self.bot_connected.set()
+            
+        if self.latency_ms or self.latency_jitter_ms:
+            await asyncio.sleep(
+                max(
+                    0.0,
+                    self.latency_ms
+                    + random.uniform(
+                        -self.latency_jitter_ms,
+                        self.latency_jitter_ms
+                    )
+                ) / 1000
+            )
+            
+        if (
+            method != "getUpdates"
+            and self.rate_limit_probability
+            and random.random() < self.rate_limit_probability
+        ):
+            self.rate_limited += 1
+            return web.json_response(
+                {
+                    "ok": False,
+                    "error_code": 429,
+                    "description": (
+                        f"Too Many Requests: retry after {self.retry_after}"
+                    ),
+                    "parameters": {"retry_after": self.retry_after}
+                },
+                status=429
+            )
+            
+        self.method_counts[method] += 1
+        if method in RECORDED_METHODS:
+            self.calls.append(RecordedCall(method, params))
+            
+        handler = getattr(self, f"_method_{method}", None)
+        result = await handler(params) if handler else True
+        
+        return web.json_response({"ok": True, "result": result})
+    
+    async def _read_params(self, request: web.Request) -> dict[str, Any]:
+        params: dict[str, Any] = dict(request.query)
+        
+        if request.content_type == "application/json":
+            params.update(await request.json())
+        elif request.can_read_body:
+            params.update(await request.post())
+            
+        for key, value in params.items():
+            if isinstance(value, str) and value[:1] in ("{", "["):
+                try:
+                    params[key] = json.loads(value)
+                except ValueError:
+                    pass
+        
+        return params
+    
+    async def _method_getMe(self, params: dict[str, Any]) -> dict:
+        return BOT_USER
+    
+    async def _method_getUpdates(self, params: dict[str, Any]) -> list:
+        offset = int(params.get("offset", 0))
+        timeout = float(params.get("timeout", 0))
+        limit = int(params.get("limit", 100))
+        
+        if offset:
+            self._updates = [
+                update for update in self._updates
+                if update["update_id"] >= offset
+            ]
+            
+        if not self._updates and timeout > 0:
+            self._updates_event.clear()
+            try:
+                await asyncio.wait_for(self._updates_event.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        
+        return self._updates[:limit]
+    
+    async def _method_setWebhook(self, params: dict[str, Any]) -> bool:
+        self.webhook_url = params.get("url") or None
+        self.webhook_secret = params.get("secret_token") or None
+        return True
+    
+    async def _method_deleteWebhook(self, params: dict[str, Any]) -> bool:
+        self.webhook_url = None
+        self.webhook_secret = None
+        return True
+    
+    async def _method_sendMessage(self, params: dict[str, Any]) -> dict:
+        chat_id = int(params["chat_id"])
+        message = self._bot_message(
+            chat_id,
+            self._allocate_message_id(),
+            params
+        )
+        self._record_reply(chat_id, message, params)
+        return message
+    
+    async def _method_editMessageText(self, params: dict[str, Any]) -> dict:
+        chat_id = int(params["chat_id"])
+        message = self._bot_message(
+            chat_id,
+            int(params["message_id"]),
+            params
+        )
+        self._record_reply(chat_id, message, params)
+        return message
+    
+    async def _method_answerCallbackQuery(
+        self,
+        params: dict[str, Any]
+    ) -> bool:
+        return True
+    
+    def _record_reply(
+        self,
+        chat_id: int,
+        message: dict[str, Any],
+        params: dict[str, Any]
+    ) -> None:
+        started = self._pending_since.pop(chat_id, None)
+        if started is not None:
+            self._response_latencies.append(time.monotonic() - started)
+            
+        self._replies[chat_id].put_nowait({
+            "message_id": message["message_id"],
+            "text": params.get("text", ""),
+            "reply_markup": params.get("reply_markup")
+        })
+    
+    def _bot_message(
+        self,
+        chat_id: int,
+        message_id: int,
+        params: dict[str, Any]
+    ) -> dict[str, Any]:
+        message: dict[str, Any] = {
+            "message_id": message_id,
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private"},
+            "from": BOT_USER,
+            "text": params.get("text", "")
+        }
+        
+        if params.get("reply_markup"):
+            message["reply_markup"] = params["reply_markup"]
+            
+        return message
+    
+    def _allocate_update_id(self) -> int:
+        update_id = self._next_update_id
+        self._next_update_id += 1
+        return update_id
+    
+    def _allocate_message_id(self) -> int:
+        message_id = self._next_message_id
+        self._next_message_id += 1
+        return message_id
+    
+    def _get_chat_id(self, update: dict[str, Any]) -> Optional[int]:
+        if "message" in update:
+            return update["message"]["chat"]["id"]
+        if "callback_query" in update:
+            return update["callback_query"]["from"]["id"]
+        return None
\ No newline at end of file
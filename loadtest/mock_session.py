@@ -0,0 +1,83 @@
+import json
+import time
+from collections import Counter
+from typing import Any, AsyncGenerator, Optional
+
+from aiogram import Bot
+from aiogram.client.session.base import BaseSession
+from aiogram.methods import TelegramMethod
+from aiogram.methods.base import TelegramType
+
+from loadtest.updates import BOT_USER
+
+MESSAGE_METHODS = frozenset({
+    "sendMessage",
+    "editMessageText",
+    "sendDocument"
+})
+
+class MockSession(BaseSession):
+    
+    def __init__(self) -> None:
+        super().__init__()
+        self.method_counts: Counter = Counter()
+        self._next_message_id: int = 1
+    
+    async def make_request(
+        self,
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+        timeout: Optional[int] = None
+    ) -> TelegramType:
+        api_method = method.__api_method__
+        self.method_counts[api_method] += 1
+        
+        content = json.dumps({
+            "ok": True,
+            "result": self._build_result(api_method, method)
+        })
+        response = self.check_response(
+            bot=bot,
+            method=method,
+            status_code=200,
+            content=content
+        )
+        
+        return response.result
+    
+    async def stream_content(
+        self,
+        url: str,
+        headers: Optional[dict[str, Any]] = None,
+        timeout: int = 30,
+        chunk_size: int = 65536,
+        raise_for_status: bool = True
+    ) -> AsyncGenerator[bytes, None]:
+        yield b""
+    
+    async def close(self) -> None:
+        pass
+    
+    def _build_result(
+        self,
+        api_method: str,
+        method: TelegramMethod[Any]
+    ) -> Any:
+        if api_method == "getMe":
+            return BOT_USER
+        
+        if api_method not in MESSAGE_METHODS:
+            return True
+        
+        message_id = getattr(method, "message_id", None)
+        if message_id is None:
+            message_id = self._next_message_id
+            self._next_message_id += 1
+            
+        return {
+            "message_id": message_id,
+            "date": int(time.time()),
+            "chat": {"id": method.chat_id, "type": "private"},
+            "from": BOT_USER,
+            "text": getattr(method, "text", None) or ""
+        }
\ No newline at end of file
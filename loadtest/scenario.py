@@ -0,0 +1,145 @@
+import asyncio
+import random
+import time
+from typing import Any, Optional
+
+from bot.logger import get_logger
+from loadtest.fake_api import FakeTelegramServer
+
+logger = get_logger(__name__)
+
+def get_buttons(reply: dict[str, Any]) -> list[str]:
+    markup = reply.get("reply_markup") or {}
+    
+    return [
+        button["callback_data"]
+        for row in markup.get("inline_keyboard", [])
+        for button in row
+        if button.get("callback_data")
+    ]
+
+class QuizScenario:
+    
+    def __init__(
+        self,
+        server: FakeTelegramServer,
+        users: int,
+        think_time: float = 2.0,
+        ramp_up: float = 10.0,
+        back_probability: float = 0.05,
+        reply_timeout: float = 30.0,
+        user_id_base: int = 1_000_000,
+        seed: Optional[int] = None
+    ) -> None:
+        self._server: FakeTelegramServer = server
+        self._users: int = users
+        self._think_time: float = think_time
+        self._ramp_up: float = ramp_up
+        self._back_probability: float = back_probability
+        self._reply_timeout: float = reply_timeout
+        self._user_id_base: int = user_id_base
+        self._random: random.Random = random.Random(seed)
+        
+        self.completed: int = 0
+        self.failed: int = 0
+        self.updates_sent: int = 0
+    
+    async def run(self) -> dict:
+        started = time.monotonic()
+        
+        await asyncio.gather(*(
+            self._run_user(self._user_id_base + index, index)
+            for index in range(self._users)
+        ))
+        
+        elapsed = time.monotonic() - started
+        
+        return {
+            'users': self._users,
+            'completed': self.completed,
+            'failed': self.failed,
+            'updates_sent': self.updates_sent,
+            'elapsed_s': round(elapsed, 3),
+            'updates_per_second': round(self.updates_sent / elapsed, 2)
+            if elapsed > 0 else 0.0,
+            'server': self._server.summary()
+        }
+    
+    async def _run_user(self, user_id: int, index: int) -> None:
+        if self._users > 1:
+            await asyncio.sleep(self._ramp_up * index / (self._users - 1))
+            
+        try:
+            if await self._take_quiz(user_id):
+                self.completed += 1
+            else:
+                self.failed += 1
+        except asyncio.TimeoutError:
+            logger.warning(f"User {user_id} timed out waiting for the bot")
+            self.failed += 1
+    
+    async def _take_quiz(self, user_id: int) -> bool:
+        await self._server.push_message(user_id, "/start")
+        self.updates_sent += 1
+        reply = await self._server.wait_for_reply(
+            user_id,
+            self._reply_timeout
+        )
+        
+        reply = await self._click(user_id, reply, "take_quiz")
+        
+        quiz_buttons = [
+            data for data in get_buttons(reply)
+            if data.startswith("quiz_") and not data.startswith("quiz_page_")
+        ]
+        if not quiz_buttons:
+            return False
+        
+        reply = await self._click(
+            user_id,
+            reply,
+            self._random.choice(quiz_buttons)
+        )
+        
+        while True:
+            buttons = get_buttons(reply)
+            
+            finish = [
+                data for data in buttons if data.startswith("finish_quiz_")
+            ]
+            if finish:
+                await self._click(user_id, reply, finish[0])
+                return True
+            
+            back = [data for data in buttons if data.startswith("back_")]
+            if back and self._random.random() < self._back_probability:
+                reply = await self._click(user_id, reply, back[0])
+                continue
+            
+            answers = [data for data in buttons if data.startswith("answer_")]
+            if not answers:
+                return False
+            
+            reply = await self._click(
+                user_id,
+                reply,
+                self._random.choice(answers)
+            )
+    
+    async def _click(
+        self,
+        user_id: int,
+        reply: dict[str, Any],
+        data: str
+    ) -> dict[str, Any]:
+        await asyncio.sleep(
+            self._think_time * self._random.uniform(0.5, 1.5)
+        )
+        
+        await self._server.push_callback(user_id, data, reply["message_id"])
+        self.updates_sent += 1
+        
+        return await self._server.wait_for_reply(
+            user_id,
+            self._reply_timeout
+        )
\ No newline at end of file
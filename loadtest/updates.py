@@ -0,0 +1,62 @@
+import time
+from typing import Any
+
+BOT_USER = {
+    "id": 1,
+    "is_bot": True,
+    "first_name": "Quiz Bot",
+    "username": "quiz_bot"
+}
+
+def make_user(user_id: int) -> dict[str, Any]:
+    return {
+        "id": user_id,
+        "is_bot": False,
+        "first_name": f"User {user_id}"
+    }
+
+def make_message_update(
+    update_id: int,
+    user_id: int,
+    text: str,
+    message_id: int
+) -> dict[str, Any]:
+    message: dict[str, Any] = {
+        "message_id": message_id,
+        "date": int(time.time()),
+        "chat": {"id": user_id, "type": "private"},
+        "from": make_user(user_id),
+        "text": text
+    }
+    
+    if text.startswith("/"):
+        message["entities"] = [{
+            "type": "bot_command",
+            "offset": 0,
+            "length": len(text.split()[0])
+        }]
+        
+    return {"update_id": update_id, "message": message}
+
+def make_callback_update(
+    update_id: int,
+    user_id: int,
+    data: str,
+    message_id: int
+) -> dict[str, Any]:
+    return {
+        "update_id": update_id,
+        "callback_query": {
+            "id": str(update_id),
+            "chat_instance": str(user_id),
+            "from": make_user(user_id),
+            "data": data,
+            "message": {
+                "message_id": message_id,
+                "date": int(time.time()),
+                "chat": {"id": user_id, "type": "private"},
+                "from": BOT_USER,
+                "text": "..."
+            }
+        }
+    }
\ No newline at end of file
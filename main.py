@@ -1,92 +1,174 @@
+import time
+
+STARTED_AT = time.perf_counter()
+
 import asyncio
 import sys
+from typing import Optional
 
 from aiogram import Bot, Dispatcher
-from aiogram.fsm.storage.memory import MemoryStorage
+from aiohttp import web
 
-from bot.config import config
-from bot.database.connection import DatabaseConnection
+from bot.app import create_bot, create_dispatcher, get_api_server
+from bot.config import Config, get_config
 from bot.database.schema import init_db
-from bot.handlers.create_handler import (
-    create_router,
-    register_create_handlers
-)
-from bot.handlers.quiz_handler import (
-    quiz_router,
-    register_quiz_handlers
-)
-from bot.handlers.start_handler import (
-    start_router,
-    register_start_handlers
-)
 from bot.logger import setup_logging, get_logger
-from bot.middlewares.logging_middleware import LoggingMiddleware
-from bot.repositories.answer_repository import AnswerRepository
-from bot.repositories.question_repository import QuestionRepository
-from bot.repositories.quiz_repository import QuizRepository
-from bot.repositories.user_repository import UserRepository
-from bot.services.quiz_service import QuizService
-from bot.services.user_service import UserService
+from bot.monitoring.server import start_monitoring_server
+from bot.monitoring.startup import StartupTimer
 
 logger = get_logger(__name__)
 
-async def main() -> None:
-    setup_logging()
+async def run_webhook(
+    dp: Dispatcher,
+    bot: Bot,
+    config: Config,
+    timer: StartupTimer
+) -> None:
+    from aiogram.webhook.aiohttp_server import (
+        SimpleRequestHandler,
+        setup_application
+    )
     
-    logger.info("Starting Telegram Quiz Bot...")
+    app = web.Application()
     
-    try:
-        logger.info("Configuration loaded successfully")
-    except Exception as e:
-        logger.error(f"Configuration error: {e}")
-        sys.exit(1)
+    SimpleRequestHandler(
+        dispatcher=dp,
+        bot=bot,
+        secret_token=config.webhook_secret
+    ).register(app, path=config.webhook_path)
+    setup_application(app, dp, bot=bot)
     
-    try:
-        await init_db(config.database_path)
-        logger.info("Database initialized successfully")
-    except Exception as e:
-        logger.error(f"Database initialization failed: {e}", exc_info=True)
-        sys.exit(1)
+    runner = web.AppRunner(app)
+    await runner.setup()
     
-    bot = Bot(token=config.bot_token)
-    storage = MemoryStorage()
-    dp = Dispatcher(storage=storage)
+    try:
+        site = web.TCPSite(runner, config.webhook_host, config.webhook_port)
+        await site.start()
+        
+        await bot.set_webhook(
+            url=config.webhook_url,
+            secret_token=config.webhook_secret,
+            allowed_updates=dp.resolve_used_update_types()
+        )
+        
+        logger.info(
+            f"Webhook server listening on "
+            f"{config.webhook_host}:{config.webhook_port}"
+            f"{config.webhook_path}"
+        )
+        timer.ready("setWebhook")
+        
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+async def run_supervisor(
+    dp: Dispatcher,
+    config: Config,
+    timer: StartupTimer
+) -> None:
+    from bot.sharding.supervisor import Supervisor
     
-    dp.update.middleware(LoggingMiddleware())
+    supervisor = Supervisor(
+        bot_token=config.bot_token,
+        database_path=config.database_path,
+        workers=config.workers,
+        allowed_updates=dp.resolve_used_update_types(),
+        api_server=get_api_server(config.telegram_api_url),
+        webhook_url=config.webhook_url,
+        webhook_path=config.webhook_path,
+        webhook_host=config.webhook_host,
+        webhook_port=config.webhook_port,
+        webhook_secret=config.webhook_secret,
+        metrics_host=config.metrics_host,
+        metrics_port=(
+            config.metrics_port if config.metrics_enabled else None
+        )
+    )
     
-    user_repo = UserRepository(config.database_path)
-    quiz_repo = QuizRepository(config.database_path)
-    question_repo = QuestionRepository(config.database_path)
-    answer_repo = AnswerRepository(config.database_path)
+    logger.info(timer.format())
+    await supervisor.run()
+
+async def start_monitoring(
+    dp: Dispatcher,
+    config: Config
+) -> Optional[web.AppRunner]:
+    if not config.metrics_enabled:
+        return None
     
-    user_service = UserService(user_repo)
-    quiz_service = QuizService(
-        quiz_repo,
-        question_repo,
-        answer_repo,
-        config.database_path
+    return await start_monitoring_server(
+        config.metrics_host,
+        config.metrics_port,
+        routes=dp["health"].routes()
     )
+
+async def main() -> None:
+    timer = StartupTimer(STARTED_AT)
+    timer.record("imports", STARTED_AT)
     
-    register_start_handlers(start_router)
-    register_quiz_handlers(quiz_router)
-    register_create_handlers(create_router)
+    try:
+        with timer.phase("config"):
+            config = get_config()
+    except Exception as e:
+        logger.error(f"Configuration error: {e}")
+        sys.exit(1)
+        
+    setup_logging(
+        log_level=config.log_level,
+        log_format=config.log_format,
+        max_bytes=config.log_max_bytes,
+        backup_count=config.log_backup_count,
+        queue_size=config.log_queue_size
+    )
     
-    dp.include_router(start_router)
-    dp.include_router(quiz_router)
-    dp.include_router(create_router)
+    logger.info("Starting Telegram Quiz Bot...")
+    logger.info("Configuration loaded successfully")
     
-    dp["user_service"] = user_service
-    dp["quiz_service"] = quiz_service
+    with timer.phase("dispatcher"):
+        dp = create_dispatcher(config.database_path)
+        
+    if config.workers > 1:
+        try:
+            await timer.measure("database", init_db(config.database_path))
+        except Exception as e:
+            logger.error(f"Database initialization failed: {e}", exc_info=True)
+            sys.exit(1)
+            
+        await run_supervisor(dp, config, timer)
+        return
     
-    logger.info("Bot initialized, starting polling...")
+    bot = create_bot(config.bot_token, config.telegram_api_url)
     
     try:
-        await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
+        _, _, monitoring = await asyncio.gather(
+            timer.measure("database", init_db(config.database_path)),
+            timer.measure("getMe", bot.me()),
+            timer.measure("monitoring", start_monitoring(dp, config))
+        )
+        logger.info("Database initialized successfully")
+    except Exception as e:
+        logger.error(f"Startup failed: {e}", exc_info=True)
+        await bot.session.close()
+        sys.exit(1)
+        
+    try:
+        if config.webhook_url:
+            logger.info("Bot initialized, starting webhook server...")
+            await run_webhook(dp, bot, config, timer)
+        else:
+            logger.info("Bot initialized, starting polling...")
+            bot.session.middleware(timer.track_first_poll)
+            await dp.start_polling(
+                bot,
+                allowed_updates=dp.resolve_used_update_types()
+            )
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
         logger.error(f"Bot polling error: {e}", exc_info=True)
     finally:
+        if monitoring is not None:
+            await monitoring.cleanup()
         await bot.session.close()
         logger.info("Bot shutdown complete")
 
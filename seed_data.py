@@ -6,6 +6,7 @@ from bot.logger import setup_logging, get_logger
 from bot.repositories.answer_repository import AnswerRepository
 from bot.repositories.question_repository import QuestionRepository
 from bot.repositories.quiz_repository import QuizRepository
+from bot.repositories.quiz_stats_repository import QuizStatsRepository
 from bot.repositories.user_repository import UserRepository
 from bot.services.quiz_service import QuizService
 from bot.services.user_service import UserService
@@ -610,12 +611,14 @@ async def seed_database() -> None:
     quiz_repo = QuizRepository(config.database_path)
     question_repo = QuestionRepository(config.database_path)
     answer_repo = AnswerRepository(config.database_path)
+    quiz_stats_repo = QuizStatsRepository(config.database_path)
     
     user_service = UserService(user_repo)
     quiz_service = QuizService(
         quiz_repo,
         question_repo,
         answer_repo,
+        quiz_stats_repo,
         config.database_path
     )
     